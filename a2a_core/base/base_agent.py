@@ -6,18 +6,33 @@
 
 import asyncio
 import httpx
+import importlib.util
+import logging
+import orjson
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime
 import uuid
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from contextlib import asynccontextmanager
 import uvicorn
 
-from ..protocols.message import A2AMessage, MessageType, Priority
+from ..protocols.message import A2AMessage, Priority
 from ..registry.service_registry import AgentInfo
+from .heartbeat import heartbeat_coalescer
 
 
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_ACCEPTED_BODY = b'{"status":"accepted"}'
+_OVERLOADED_BODY = b'{"status":"overloaded"}'
+
+# 같은 수신자에게 윈도우(초) 내 임계 횟수만큼 전송이 실패하면 캐시에서 제거
+_SEND_FAILURE_THRESHOLD = 3
+_SEND_FAILURE_WINDOW = 60.0
+
 class BaseAgent(ABC):
     """A2A 베이스 에이전트"""
     
@@ -26,7 +41,9 @@ class BaseAgent(ABC):
         name: str,
         description: str,
         port: int,
-        registry_url: str = "http://localhost:8001"
+        registry_url: str = "http://localhost:8001",
+        pool_size: int = 100,
+        queue_max: int = 4096
     ):
         self.agent_id = str(uuid.uuid4())
         self.name = name
@@ -34,6 +51,8 @@ class BaseAgent(ABC):
         self.port = port
         self.registry_url = registry_url
         self.endpoint = f"http://localhost:{port}"
+        self.pool_size = pool_size
+        self.queue_max = queue_max  # 동시에 처리 중일 수 있는 최대 메시지 수
         
         # Lifespan 컨텍스트 매니저 정의
         @asynccontextmanager
@@ -50,21 +69,35 @@ class BaseAgent(ABC):
         # 능력 목록
         self.capabilities = []
         
-        # 메시지 큐
-        self.message_queue = asyncio.Queue()
+        # 처리 중인 메시지 핸들러 태스크 (GC 방지용 참조 유지)
+        self._handler_tasks: Set[asyncio.Task] = set()
         
         # 다른 에이전트 캐시
         self.known_agents: Dict[str, AgentInfo] = {}
         
-        # HTTP 클라이언트
-        self.http_client = None
+        # discover 결과 캐시: capability -> (캐시 시각, 에이전트 목록)
+        # 레지스트리 타임아웃(120초)의 절반 동안 재사용 - 레지스트리가 변경을 알려주지 않으므로
+        # 새로 등록된 에이전트는 최대 TTL(60초) 뒤에 목록에 나타남 (send_message는 캐시에 없으면 /resolve 조회)
+        self._discover_cache: Dict[Optional[str], Tuple[float, List[AgentInfo]]] = {}
+        self.discover_cache_ttl = 60.0
+        
+        # 수신자별 전송 실패 기록: receiver_id -> (실패 횟수, 첫 실패 시각)
+        self._send_failures: Dict[str, Tuple[int, float]] = {}
         
-        # 하트비트 태스크
-        self.heartbeat_task = None
+        # HTTP 클라이언트 (start()에서 keep-alive 풀과 함께 생성, 모든 호출이 공유)
+        self.http_client = None
         
         # 레지스트리 등록 상태
         self.is_registered = False
         
+        # /health, /capabilities 응답 본문 캐시 (매 요청마다 JSON 인코딩하지 않도록)
+        self._health_body_prefix = orjson.dumps({
+            "status": "healthy",
+            "agent_id": self.agent_id,
+            "name": self.name
+        })[:-1] + b',"timestamp":"'
+        self._capabilities_body: Optional[bytes] = None
+        
         # 기본 라우트 설정
         self._setup_routes()
         
@@ -74,41 +107,75 @@ class BaseAgent(ABC):
         @self.app.get("/health")
         async def health_check():
             """상태 확인 엔드포인트"""
-            return {
-                "status": "healthy",
-                "agent_id": self.agent_id,
-                "name": self.name,
-                "timestamp": datetime.now().isoformat()
-            }
+            # 고정 부분은 미리 직렬화해두고 타임스탬프만 붙임
+            body = (self._health_body_prefix + datetime.now().isoformat().encode() +
+                    b'","pending_messages":' + str(len(self._handler_tasks)).encode() + b'}')
+            return Response(content=body, media_type="application/json")
             
-        @self.app.post("/message")
+        # 에이전트 간 메시지 버스: FastAPI 의존성 해석/검증을 거치지 않는 raw 라우트
+        self.app.add_route("/message", self._receive_message_raw, methods=["POST"], include_in_schema=False)
+        
+        @self.app.post("/v1/message")
         async def receive_message(message: Dict):
-            """메시지 수신 엔드포인트"""
+            """메시지 수신 엔드포인트 (문서용, 동작은 /message와 동일)"""
             try:
-                a2a_message = A2AMessage(**message)
-                await self.message_queue.put(a2a_message)
-                
-                # ACK 필요한 경우
-                if a2a_message.metadata.require_ack:
-                    return {"status": "received", "message_id": a2a_message.header.message_id}
-                    
-                return {"status": "accepted"}
-                
+                a2a_message = A2AMessage.from_dict(message)
             except Exception as e:
                 raise HTTPException(status_code=400, detail=str(e))
-                
+            return self._accept_message(a2a_message)
+            
         @self.app.get("/capabilities")
         async def get_capabilities():
             """에이전트 능력 조회"""
-            return {
-                "agent_id": self.agent_id,
-                "name": self.name,
-                "capabilities": self.capabilities
-            }
+            # register_capability() 호출 시에만 다시 직렬화
+            if self._capabilities_body is None:
+                self._capabilities_body = orjson.dumps({
+                    "agent_id": self.agent_id,
+                    "name": self.name,
+                    "capabilities": self.capabilities
+                })
+            return Response(content=self._capabilities_body, media_type="application/json")
             
+    async def _receive_message_raw(self, request: Request) -> Response:
+        """메시지 수신 (raw 라우트)"""
+        try:
+            # 원본 바이트를 바로 디코딩/검증 (dict 파싱 후 재검증 생략)
+            a2a_message = A2AMessage.from_json(await request.body())
+        except Exception as e:
+            return Response(
+                content=orjson.dumps({"detail": str(e)}),
+                status_code=400,
+                media_type="application/json"
+            )
+        return self._accept_message(a2a_message)
+        
+    def _accept_message(self, a2a_message: A2AMessage) -> Response:
+        """수신 메시지를 디스패치하고 응답 반환"""
+        # 만료된 메시지는 수신 시점에 바로 거부
+        if a2a_message.is_expired():
+            logger.debug("⏰ 만료된 메시지 무시: %s", a2a_message.header.message_id)
+            body = orjson.dumps({"status": "expired", "message_id": a2a_message.header.message_id})
+            return Response(content=body, media_type="application/json")
+            
+        # 처리 중인 메시지가 한도를 넘으면 503으로 송신 측에 백프레셔 전달
+        if len(self._handler_tasks) >= self.queue_max:
+            logger.warning("⚠️ 메시지 처리 한도 초과 (%d개 처리 중)", len(self._handler_tasks))
+            return Response(content=_OVERLOADED_BODY, status_code=503, media_type="application/json")
+            
+        # 큐를 거치지 않고 핸들러 태스크로 바로 전달
+        self._dispatch_message(a2a_message)
+        
+        # ACK 필요한 경우
+        if a2a_message.metadata.require_ack:
+            body = orjson.dumps({"status": "received", "message_id": a2a_message.header.message_id})
+            return Response(content=body, media_type="application/json")
+            
+        return Response(content=_ACCEPTED_BODY, media_type="application/json")
+        
     async def register_capability(self, capability: Dict):
         """능력 등록"""
         self.capabilities.append(capability)
+        self._capabilities_body = None
         
         # 레지스트리에 capability 업데이트 (에이전트가 등록된 후에만)
         # 초기 등록 시에는 _register_to_registry()에서 capabilities가 함께 전달됨
@@ -117,10 +184,24 @@ class BaseAgent(ABC):
         
     async def start(self):
         """에이전트 시작"""
-        print(f"🚀 {self.name} 에이전트 시작중...")
-        
-        # HTTP 클라이언트 초기화
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        logger.info("🚀 %s 에이전트 시작중...", self.name)
+        
+        # HTTP 클라이언트 초기화 (브로드캐스트 fan-out을 고려한 keep-alive 커넥션 풀)
+        # transport를 직접 지정하면 클라이언트의 limits/http2는 무시되므로 transport에 설정
+        # HTTP/2는 TLS(ALPN)로 협상되는 엔드포인트에서 같은 호스트 요청을 한 커넥션으로 다중화
+        # (h2 패키지가 없으면 HTTP/1.1 keep-alive 풀만 사용)
+        self.http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.pool_size,
+                    max_connections=self.pool_size * 2,
+                    keepalive_expiry=60.0
+                ),
+                retries=1
+            )
+        )
         
         # 초기화 수행 (capabilities 등록 포함)
         await self.on_start()
@@ -128,24 +209,33 @@ class BaseAgent(ABC):
         # 레지스트리에 등록 (on_start 이후에 실행하여 capabilities가 포함되도록)
         await self._register_to_registry()
         
-        # 하트비트 시작
-        self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        # 하트비트 시작 (같은 프로세스의 에이전트와 묶어서 전송)
+        heartbeat_coalescer.register(self.registry_url, self.agent_id, self._heartbeat_interval())
+        
+        # 첫 메시지 지연을 피하기 위해 직렬화 경로를 미리 한 번 실행
+        self._warmup_codecs()
         
-        # 메시지 처리 루프 시작
-        asyncio.create_task(self._message_processing_loop())
+        logger.info("✅ %s 에이전트 시작 완료 (ID: %s)", self.name, self.agent_id)
         
-        print(f"✅ {self.name} 에이전트 시작 완료 (ID: {self.agent_id})")
+    def _warmup_codecs(self):
+        """메시지 인코딩/디코딩 경로 워밍업"""
+        warmup = A2AMessage.create_request(
+            sender_id=self.agent_id,
+            receiver_id="warmup",
+            action="noop",
+            payload={}
+        )
+        A2AMessage.from_json(warmup.to_json())
         
     async def stop(self):
         """에이전트 종료"""
-        print(f"🛑 {self.name} 에이전트 종료중...")
+        logger.info("🛑 %s 에이전트 종료중...", self.name)
         
         # 종료 전 처리
         await self.on_stop()
         
         # 하트비트 중지
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
+        await heartbeat_coalescer.unregister(self.registry_url, self.agent_id)
             
         # 레지스트리에서 등록 해제
         await self._deregister_from_registry()
@@ -154,7 +244,7 @@ class BaseAgent(ABC):
         if self.http_client:
             await self.http_client.aclose()
             
-        print(f"✅ {self.name} 에이전트 종료 완료")
+        logger.info("✅ %s 에이전트 종료 완료", self.name)
         
     async def _register_to_registry(self):
         """서비스 레지스트리에 등록"""
@@ -174,13 +264,13 @@ class BaseAgent(ABC):
             )
             
             if response.status_code == 200:
-                print(f"✅ 레지스트리 등록 성공: {self.name}")
+                logger.info("✅ 레지스트리 등록 성공: %s", self.name)
                 self.is_registered = True
             else:
-                print(f"❌ 레지스트리 등록 실패: {response.text}")
+                logger.error("❌ 레지스트리 등록 실패: %s", response.text)
                 
         except Exception as e:
-            print(f"❌ 레지스트리 연결 실패: {e}")
+            logger.error("❌ 레지스트리 연결 실패: %s", e)
             
     async def _update_capabilities_in_registry(self):
         """레지스트리에 능력 업데이트"""
@@ -191,12 +281,12 @@ class BaseAgent(ABC):
             )
             
             if response.status_code == 200:
-                print(f"✅ 능력 업데이트 성공: {[cap.get('name') for cap in self.capabilities]}")
+                logger.info("✅ 능력 업데이트 성공: %s", [cap.get('name') for cap in self.capabilities])
             else:
-                print(f"❌ 능력 업데이트 실패: {response.text}")
+                logger.error("❌ 능력 업데이트 실패: %s", response.text)
                 
         except Exception as e:
-            print(f"❌ 능력 업데이트 오류: {e}")
+            logger.error("❌ 능력 업데이트 오류: %s", e)
             
     async def _deregister_from_registry(self):
         """서비스 레지스트리에서 등록 해제"""
@@ -206,96 +296,100 @@ class BaseAgent(ABC):
             )
             
             if response.status_code == 200:
-                print(f"✅ 레지스트리 등록 해제 성공: {self.name}")
+                logger.info("✅ 레지스트리 등록 해제 성공: %s", self.name)
                 self.is_registered = False
                 
         except Exception as e:
-            print(f"⚠️ 레지스트리 등록 해제 실패: {e}")
+            logger.warning("⚠️ 레지스트리 등록 해제 실패: %s", e)
             
-    async def _heartbeat_loop(self):
-        """하트비트 전송 루프"""
-        # 설정에서 하트비트 주기 가져오기 (기본값 600초 = 10분)
+    def _heartbeat_interval(self) -> float:
+        """설정에서 하트비트 주기 가져오기 (기본값 600초 = 10분)"""
         heartbeat_interval = 600  # 10분 기본값
         try:
             from utils.config_manager import config
             heartbeat_interval = config.get("registry.heartbeat_interval", 600)
         except:
             pass
+        return heartbeat_interval
+        
+    def _dispatch_message(self, message: A2AMessage):
+        """수신 메시지를 핸들러 태스크로 디스패치"""
+        task = asyncio.create_task(self._handle_message_safely(message))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+        
+    async def _handle_message_safely(self, message: A2AMessage):
+        """메시지 처리 (예외는 로그로만 남김)"""
+        try:
+            await self.handle_message(message)
+        except Exception as e:
+            logger.error("❌ 메시지 처리 오류: %s", e)
             
-        heartbeat_count = 0
-        while True:
-            try:
-                await asyncio.sleep(heartbeat_interval)
-                heartbeat_count += 1
-                
-                response = await self.http_client.put(
-                    f"{self.registry_url}/heartbeat/{self.agent_id}"
-                )
-                
-                if response.status_code != 200:
-                    print(f"⚠️ 하트비트 실패: {response.text}")
-                else:
-                    # 10회에 1번만 로그 출력 (100분에 1번)
-                    if heartbeat_count % 10 == 0:
-                        print(f"💓 하트비트 업데이트 완료 ({heartbeat_count}회)")
-                    
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"⚠️ 하트비트 오류: {e}")
-                
-    async def _message_processing_loop(self):
-        """메시지 처리 루프"""
-        while True:
-            try:
-                # 메시지 대기
-                message = await self.message_queue.get()
-                
-                # 만료된 메시지 무시
-                if message.is_expired():
-                    print(f"⏰ 만료된 메시지 무시: {message.header.message_id}")
-                    continue
-                    
-                # 메시지 처리
-                await self.handle_message(message)
-                
-            except Exception as e:
-                print(f"❌ 메시지 처리 오류: {e}")
-                
+    @staticmethod
+    def _agent_info_from_registry(data: Dict) -> AgentInfo:
+        """레지스트리 응답(to_dict)으로 캐시용 AgentInfo 생성 (ISO 문자열인 last_heartbeat는 제외)"""
+        return AgentInfo(
+            agent_id=data["agent_id"],
+            name=data["name"],
+            description=data.get("description", ""),
+            endpoint=data["endpoint"],
+            capabilities=data.get("capabilities", []),
+            status=data.get("status", "active"),
+            metadata=data.get("metadata", {})
+        )
+        
+    def invalidate_discover_cache(self):
+        """discover 캐시 무효화"""
+        self._discover_cache.clear()
+        
     async def discover_agents(self, capability: Optional[str] = None) -> List[AgentInfo]:
         """다른 에이전트 발견"""
+        cached = self._discover_cache.get(capability)
+        if cached and time.monotonic() - cached[0] < self.discover_cache_ttl:
+            return cached[1]
+            
         try:
-            print(f"🔍 에이전트 검색 시작 - capability: {capability}")
-            print(f"📡 Registry URL: {self.registry_url}")
+            logger.debug("🔍 에이전트 검색 시작 - capability: %s (registry: %s)", capability, self.registry_url)
             
             response = await self.http_client.get(
                 f"{self.registry_url}/discover",
                 params={"capability": capability} if capability else {}
             )
             
-            print(f"📨 Registry 응답 상태: {response.status_code}")
+            logger.debug("📨 Registry 응답 상태: %s", response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
-                print(f"📊 Registry 응답 데이터: {data}")
+                logger.debug("📊 Registry 응답 데이터: %s", data)
                 
-                agents = [AgentInfo(**agent) for agent in data["agents"]]
-                print(f"✅ 발견된 에이전트 수: {len(agents)}")
+                # 간략 응답(id/name/endpoint/caps)에서 필요한 필드만 채워 검증 없이 생성
+                agents = [
+                    AgentInfo(
+                        agent_id=agent["id"],
+                        name=agent["name"],
+                        description="",
+                        endpoint=agent["endpoint"],
+                        capabilities=[{"name": cap} for cap in agent["caps"]]
+                    )
+                    for agent in data["agents"]
+                ]
+                logger.debug("✅ 발견된 에이전트 수: %d", len(agents))
                 
                 # 캐시 업데이트
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
                 for agent in agents:
                     self.known_agents[agent.agent_id] = agent
-                    print(f"   - {agent.name} (ID: {agent.agent_id})")
+                    if debug_enabled:
+                        logger.debug("   - %s (ID: %s)", agent.name, agent.agent_id)
                     
+                self._discover_cache[capability] = (time.monotonic(), agents)
                 return agents
             else:
-                print(f"❌ Registry 응답 오류: {response.text}")
+                logger.error("❌ Registry 응답 오류: %s", response.text)
                 return []
                 
         except Exception as e:
-            print(f"❌ 에이전트 발견 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ 에이전트 발견 실패: %s", e)
             return []
             
     async def send_message(
@@ -307,48 +401,26 @@ class BaseAgent(ABC):
         require_ack: bool = False
     ) -> Optional[A2AMessage]:
         """다른 에이전트에게 메시지 전송"""
-        print(f"\n🔍 [DEBUG] send_message 호출됨")
-        print(f"   - receiver_id: {receiver_id}")
-        print(f"   - action: {action}")
-        print(f"   - payload: {payload}")
+        logger.debug("send_message 호출됨 - receiver_id: %s, action: %s, payload: %s", receiver_id, action, payload)
         try:
             # 수신자 정보 확인
             if receiver_id not in self.known_agents:
-                print(f"   - {receiver_id}가 캐시에 없음, 레지스트리 조회 시작")
-                # 캐시에 없으면 레지스트리에서 조회
-                # 먼저 전체 에이전트 목록에서 이름으로 검색
-                print(f"   - Registry URL: {self.registry_url}/discover")
-                response = await self.http_client.get(f"{self.registry_url}/discover")
-                print(f"   - Registry 응답 상태: {response.status_code}")
+                logger.debug("%s가 캐시에 없음, 레지스트리 조회 시작", receiver_id)
+                # 캐시에 없으면 레지스트리에서 이름 또는 ID로 조회 (서버 측 인덱스 사용)
+                response = await self.http_client.get(
+                    f"{self.registry_url}/resolve",
+                    params={"name_or_id": receiver_id}
+                )
+                logger.debug("Registry 응답 상태: %s", response.status_code)
                 
                 if response.status_code == 200:
-                    agents_data = response.json()
-                    agents = agents_data.get("agents", [])
-                    
-                    # 이름 또는 ID로 매칭되는 에이전트 찾기
-                    # receiver_id를 소문자로 변환하고 공백을 하이픈으로 치환하여 비교
-                    receiver_id_normalized = receiver_id.lower().replace("-", " ")
-                    found_agent = None
-                    for agent_data in agents:
-                        agent_name = agent_data.get("name", "").lower()
-                        agent_id = agent_data.get("agent_id", "")
-                        
-                        # 여러 형식으로 매칭 시도
-                        if (agent_data.get("name") == receiver_id or 
-                            agent_data.get("agent_id") == receiver_id or
-                            agent_name.replace(" ", "-") == receiver_id or
-                            agent_name == receiver_id_normalized):
-                            found_agent = agent_data
-                            break
-                    
-                    if found_agent:
-                        agent_info = AgentInfo(**found_agent)
-                        self.known_agents[receiver_id] = agent_info
-                    else:
-                        print(f"❌ 수신자를 찾을 수 없음: {receiver_id}")
-                        return None
+                    self.known_agents[receiver_id] = self._agent_info_from_registry(response.json())
+                    self._send_failures.pop(receiver_id, None)  # 재조회되었으므로 실패 기록 초기화
+                elif response.status_code == 404:
+                    logger.warning("❌ 수신자를 찾을 수 없음: %s", receiver_id)
+                    return None
                 else:
-                    print(f"❌ 레지스트리 조회 실패: {response.status_code}")
+                    logger.error("❌ 레지스트리 조회 실패: %s", response.status_code)
                     return None
                     
             receiver = self.known_agents[receiver_id]
@@ -367,22 +439,52 @@ class BaseAgent(ABC):
             # 메시지 전송
             response = await self.http_client.post(
                 f"{receiver.endpoint}/message",
-                json=message.to_dict()
+                content=message.to_json(),
+                headers=_JSON_HEADERS
             )
             
             if response.status_code == 200:
-                print(f"📤 메시지 전송 성공: {action} -> {receiver.name}")
+                logger.debug("📤 메시지 전송 성공: %s -> %s", action, receiver.name)
+                self._send_failures.pop(receiver_id, None)
                 return message
+            elif response.status_code == 503:
+                # 수신자 과부하 (백프레셔) - 엔드포인트는 유효하므로 캐시 유지
+                logger.warning("⚠️ 수신자 과부하로 메시지 거부됨: %s", receiver.name)
+                return None
+            elif response.status_code in (404, 410):
+                logger.error("❌ 메시지 전송 실패: %s", response.text)
+                # 수신자 정보가 오래되었을 수 있으므로 캐시 무효화
+                self.known_agents.pop(receiver_id, None)
+                self.invalidate_discover_cache()
+                return None
             else:
-                print(f"❌ 메시지 전송 실패: {response.text}")
+                logger.error("❌ 메시지 전송 실패 (%s): %s", response.status_code, response.text)
                 return None
                 
         except Exception as e:
-            print(f"❌ 메시지 전송 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            self._record_send_failure(receiver_id, e)
             return None
             
+    def _record_send_failure(self, receiver_id: str, error: Exception):
+        """전송 실패 기록 (짧은 시간에 반복 실패하면 수신자 캐시 제거 후 트레이스백 생략)"""
+        now = time.monotonic()
+        count, first_failure = self._send_failures.get(receiver_id, (0, now))
+        if now - first_failure > _SEND_FAILURE_WINDOW:
+            count, first_failure = 0, now
+        count += 1
+        self._send_failures[receiver_id] = (count, first_failure)
+        
+        if count < _SEND_FAILURE_THRESHOLD:
+            logger.exception("❌ 메시지 전송 오류: %s", error)
+            return
+            
+        if count == _SEND_FAILURE_THRESHOLD:
+            # 다음 전송 시 레지스트리에서 다시 조회하도록 캐시 제거
+            self.known_agents.pop(receiver_id, None)
+            logger.error("❌ %s 전송 %d회 연속 실패, 재조회 전까지 트레이스백 생략", receiver_id, count)
+        else:
+            logger.error("❌ 메시지 전송 오류: %s", error)
+            
     async def broadcast_event(
         self,
         event_type: str,
@@ -399,21 +501,31 @@ class BaseAgent(ABC):
             event_data=event_data
         )
         
-        # 모든 에이전트에게 전송
-        tasks = []
-        for agent in agents:
-            if agent.agent_id != self.agent_id:  # 자기 자신 제외
-                task = self.http_client.post(
-                    f"{agent.endpoint}/message",
-                    json=message.to_dict()
-                )
-                tasks.append(task)
-                
-        # 병렬 전송
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 한 번만 직렬화하고 모든 수신자에게 같은 바이트를 재사용
+        payload_bytes = message.to_json()
         
-        success_count = sum(1 for r in results if not isinstance(r, Exception))
-        print(f"📢 이벤트 브로드캐스트 완료: {event_type} ({success_count}/{len(tasks)} 성공)")
+        # 모든 에이전트에게 전송 (커넥션 풀 크기만큼만 동시 전송)
+        semaphore = asyncio.Semaphore(self.pool_size)
+        targets = [agent for agent in agents if agent.agent_id != self.agent_id]  # 자기 자신 제외
+        success_count = 0
+        
+        async def _send(agent: AgentInfo):
+            nonlocal success_count
+            async with semaphore:
+                try:
+                    await self.http_client.post(
+                        f"{agent.endpoint}/message",
+                        content=payload_bytes,
+                        headers=_JSON_HEADERS
+                    )
+                    success_count += 1
+                except Exception:
+                    pass
+                    
+        # 병렬 전송 (_send가 예외를 삼키므로 gather로 충분, Python 3.8 호환)
+        await asyncio.gather(*(_send(agent) for agent in targets))
+        
+        logger.info("📢 이벤트 브로드캐스트 완료: %s (%d/%d 성공)", event_type, success_count, len(targets))
         
     async def reply_to_message(
         self,
@@ -422,7 +534,7 @@ class BaseAgent(ABC):
         success: bool = True
     ):
         """메시지에 응답"""
-        print(f"📤 reply_to_message 시작 - sender_id: {original_message.header.sender_id}")
+        logger.debug("📤 reply_to_message 시작 - sender_id: %s", original_message.header.sender_id)
         
         response = A2AMessage.create_response(
             original_message=original_message,
@@ -434,35 +546,37 @@ class BaseAgent(ABC):
         # 응답 전송
         receiver = self.known_agents.get(original_message.header.sender_id)
         if receiver:
-            print(f"📍 캐시에서 수신자 발견: {receiver.name} at {receiver.endpoint}")
+            logger.debug("📍 캐시에서 수신자 발견: %s at %s", receiver.name, receiver.endpoint)
             try:
                 resp = await self.http_client.post(
                     f"{receiver.endpoint}/message",
-                    json=response.to_dict()
+                    content=response.to_json(),
+                    headers=_JSON_HEADERS
                 )
-                print(f"✅ 응답 전송 완료 - status: {resp.status_code}")
+                logger.debug("✅ 응답 전송 완료 - status: %s", resp.status_code)
             except Exception as e:
-                print(f"❌ 응답 전송 실패: {e}")
+                logger.error("❌ 응답 전송 실패: %s", e)
                 raise
         else:
             # known_agents에 없으면 레지스트리에서 조회
-            print(f"⚠️ 수신자 {original_message.header.sender_id}를 캐시에서 찾을 수 없음. 레지스트리 조회 시도...")
+            logger.debug("⚠️ 수신자 %s를 캐시에서 찾을 수 없음. 레지스트리 조회 시도...", original_message.header.sender_id)
             try:
                 response_r = await self.http_client.get(
                     f"{self.registry_url}/agents/{original_message.header.sender_id}"
                 )
                 if response_r.status_code == 200:
-                    agent_info = AgentInfo(**response_r.json())
+                    agent_info = self._agent_info_from_registry(response_r.json())
                     self.known_agents[agent_info.agent_id] = agent_info
                     await self.http_client.post(
                         f"{agent_info.endpoint}/message",
-                        json=response.to_dict()
+                        content=response.to_json(),
+                        headers=_JSON_HEADERS
                     )
-                    print(f"✅ 응답 전송 성공: {agent_info.name}")
+                    logger.debug("✅ 응답 전송 성공: %s", agent_info.name)
                 else:
-                    print(f"❌ 레지스트리에서 수신자 정보를 찾을 수 없음: {original_message.header.sender_id}")
+                    logger.error("❌ 레지스트리에서 수신자 정보를 찾을 수 없음: %s", original_message.header.sender_id)
             except Exception as e:
-                print(f"❌ 응답 전송 실패: {e}")
+                logger.error("❌ 응답 전송 실패: %s", e)
             
     @abstractmethod
     async def handle_message(self, message: A2AMessage):
@@ -481,4 +595,14 @@ class BaseAgent(ABC):
         
     def run(self):
         """에이전트 실행"""
-        uvicorn.run(self.app, host="0.0.0.0", port=self.port)
\ No newline at end of file
+        # 작은 HTTP 요청(메시지/하트비트)이 대부분이므로 uvloop + httptools 사용
+        # uvloop이 없는 환경(Windows 등)에서는 uvicorn 기본 루프로 폴백
+        try:
+            import uvloop  # noqa: F401
+            loop_impl = "uvloop"
+        except ImportError:
+            loop_impl = "auto"
+        # 기본 핸들러가 없으면 INFO 레벨 콘솔 로깅 설정 (이미 설정된 경우 무시됨)
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+        # 메시지마다 찍히는 access 로그는 끄고 경고 이상만 출력
+        uvicorn.run(self.app, host="0.0.0.0", port=self.port, loop=loop_impl, http="auto", log_level="warning")
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+하트비트 코얼레서
+
+같은 프로세스에서 실행되는 에이전트들의 하트비트를 모아
+레지스트리별로 한 번의 /heartbeat/batch 요청으로 전송
+"""
+
+import asyncio
+import httpx
+import logging
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatCoalescer:
+    """프로세스 단위 하트비트 묶음 전송기"""
+    
+    def __init__(self, interval: float = 600):
+        self.interval = interval
+        self._agents: Dict[str, Set[str]] = defaultdict(set)  # registry_url -> agent_ids
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._flush_count = 0
+        
+    def register(self, registry_url: str, agent_id: str, interval: Optional[float] = None):
+        """에이전트를 하트비트 대상에 추가"""
+        if interval is not None:
+            # 여러 에이전트가 다른 주기를 요청하면 가장 짧은 주기를 사용
+            self.interval = min(self.interval, interval) if self._agents else interval
+            
+        self._agents[registry_url].add(agent_id)
+        
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            
+    async def unregister(self, registry_url: str, agent_id: str):
+        """에이전트를 하트비트 대상에서 제거"""
+        agent_ids = self._agents.get(registry_url)
+        if agent_ids is not None:
+            agent_ids.discard(agent_id)
+            if not agent_ids:
+                del self._agents[registry_url]
+                
+        # 남은 에이전트가 없으면 전송 루프 종료
+        if not self._agents and self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+    async def _run(self):
+        """주기적 전송 루프"""
+        self._client = httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=5.0))
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                await self.flush()
+        finally:
+            await self._client.aclose()
+            self._client = None
+            
+    async def flush(self):
+        """레지스트리별로 모인 하트비트를 한 번씩 전송"""
+        self._flush_count += 1
+        
+        for registry_url, agent_ids in list(self._agents.items()):
+            try:
+                response = await self._client.post(
+                    f"{registry_url}/heartbeat/batch",
+                    json={"agent_ids": list(agent_ids)}
+                )
+                
+                if response.status_code != 200:
+                    logger.warning("⚠️ 하트비트 실패: %s", response.text)
+                    continue
+                    
+                unknown = response.json().get("unknown", [])
+                if unknown:
+                    logger.warning("⚠️ 레지스트리에 없는 에이전트: %s", unknown)
+                elif self._flush_count % 10 == 0:
+                    # 10회에 1번만 로그 출력
+                    logger.info("💓 하트비트 업데이트 완료 (%d회, %d개 에이전트)", self._flush_count, len(agent_ids))
+                    
+            except Exception as e:
+                logger.warning("⚠️ 하트비트 오류: %s", e)
+
+
+# 프로세스 전역 코얼레서
+heartbeat_coalescer = HeartbeatCoalescer()
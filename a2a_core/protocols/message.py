@@ -6,8 +6,8 @@ A2A 표준 메시지 형식
 
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
-import uuid
+import msgspec
+import os
 from enum import Enum
 
 
@@ -29,10 +29,15 @@ class Priority(str, Enum):
     URGENT = "urgent"
 
 
-class MessageHeader(BaseModel):
+def _new_message_id() -> str:
+    """메시지 ID 생성 (UUID 객체 생성 없이 128비트 난수를 hex로)"""
+    return os.urandom(16).hex()
+
+
+class MessageHeader(msgspec.Struct, kw_only=True, gc=False):
     """메시지 헤더"""
-    message_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = Field(default_factory=datetime.now)
+    message_id: str = msgspec.field(default_factory=_new_message_id)
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
     sender_id: str
     receiver_id: Optional[str] = None  # None이면 브로드캐스트
     message_type: MessageType
@@ -41,45 +46,39 @@ class MessageHeader(BaseModel):
     reply_to: Optional[str] = None  # 응답 받을 엔드포인트
     
     
-class MessageMetadata(BaseModel):
+class MessageMetadata(msgspec.Struct, kw_only=True, gc=False):
     """메시지 메타데이터"""
     priority: Priority = Priority.NORMAL
     ttl: Optional[int] = None  # Time to live in seconds
     retry_count: int = 0
     max_retries: int = 3
     require_ack: bool = False
-    tags: List[str] = []
+    tags: List[str] = msgspec.field(default_factory=list)
     
 
-class A2AMessage(BaseModel):
+class A2AMessage(msgspec.Struct, kw_only=True):
     """A2A 표준 메시지"""
     header: MessageHeader
     body: Dict[str, Any]
-    metadata: MessageMetadata = Field(default_factory=MessageMetadata)
+    metadata: MessageMetadata = msgspec.field(default_factory=MessageMetadata)
     
     def to_dict(self) -> Dict:
-        """메시지를 딕셔너리로 변환"""
-        return {
-            "header": {
-                "message_id": self.header.message_id,
-                "timestamp": self.header.timestamp.isoformat(),
-                "sender_id": self.header.sender_id,
-                "receiver_id": self.header.receiver_id,
-                "message_type": self.header.message_type.value,
-                "protocol_version": self.header.protocol_version,
-                "correlation_id": self.header.correlation_id,
-                "reply_to": self.header.reply_to
-            },
-            "body": self.body,
-            "metadata": {
-                "priority": self.metadata.priority.value,
-                "ttl": self.metadata.ttl,
-                "retry_count": self.metadata.retry_count,
-                "max_retries": self.metadata.max_retries,
-                "require_ack": self.metadata.require_ack,
-                "tags": self.metadata.tags
-            }
-        }
+        """메시지를 JSON 호환 딕셔너리로 변환"""
+        return msgspec.to_builtins(self)
+        
+    def to_json(self) -> bytes:
+        """메시지를 JSON 바이트로 직렬화"""
+        return _encoder.encode(self)
+        
+    @classmethod
+    def from_json(cls, data: bytes) -> "A2AMessage":
+        """JSON 바이트를 검증하며 메시지로 변환"""
+        return _decoder.decode(data)
+        
+    @classmethod
+    def from_dict(cls, data: Dict) -> "A2AMessage":
+        """딕셔너리를 검증하며 메시지로 변환"""
+        return msgspec.convert(data, cls)
         
     @classmethod
     def create_request(
@@ -153,7 +152,7 @@ class A2AMessage(BaseModel):
         body = {
             "error_code": error_code,
             "error_message": error_message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": header.timestamp.isoformat()  # 헤더 생성 시각 재사용
         }
         
         return cls(header=header, body=body)
@@ -177,7 +176,7 @@ class A2AMessage(BaseModel):
         body = {
             "event_type": event_type,
             "event_data": event_data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": header.timestamp.isoformat()  # 헤더 생성 시각 재사용
         }
         
         return cls(header=header, body=body)
@@ -196,4 +195,9 @@ class A2AMessage(BaseModel):
         
     def increment_retry(self) -> None:
         """재시도 카운트 증가"""
-        self.metadata.retry_count += 1
\ No newline at end of file
+        self.metadata.retry_count += 1
+
+
+# 모듈 수준 인코더/디코더 (타입 정보를 한 번만 컴파일)
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(A2AMessage)
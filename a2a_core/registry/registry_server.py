@@ -6,12 +6,23 @@ A2A Registry Server
 
 import os
 import sys
+import asyncio
+import heapq
+import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from fastapi import FastAPI, HTTPException
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime
+from collections import defaultdict
+from functools import lru_cache
 from pydantic import BaseModel
+import orjson
+
+# 등록되지 않은 capability 조회 응답 (캐시하지 않고 공용 상수 반환)
+_EMPTY_DISCOVER_BODY = b'{"agents":[],"count":0}'
+
 
 # AgentInfo를 직접 정의
 class AgentInfo:
@@ -24,6 +35,7 @@ class AgentInfo:
         self.endpoint = endpoint
         self.capabilities = capabilities
         self.metadata = metadata or {}
+        self.norm_name = Registry.normalize_name(name)  # 이름 인덱스 키 (등록 시 한 번만 계산)
         
     def to_dict(self) -> Dict:
         """딕셔너리로 변환"""
@@ -47,9 +59,15 @@ class RegisterRequest(BaseModel):
     metadata: Optional[Dict] = {}
 
 
+class HeartbeatBatchRequest(BaseModel):
+    """하트비트 일괄 업데이트 요청"""
+    agent_ids: List[str]
+
+
 class DiscoverResponse(BaseModel):
     """에이전트 발견 응답"""
     agents: List[Dict]
+    count: int
 
 
 class Registry:
@@ -57,8 +75,19 @@ class Registry:
     
     def __init__(self):
         self.agents: Dict[str, AgentInfo] = {}
-        self.last_heartbeat: Dict[str, datetime] = {}
+        self.last_heartbeat: Dict[str, float] = {}  # agent_id -> 마지막 하트비트 (monotonic 초)
+        self._expiry_heap: List[Tuple[float, str]] = []  # (만료 시각, agent_id) 최소 힙
+        self.by_name: Dict[str, str] = {}  # 정규화된 이름 -> agent_id
+        self.by_capability: Dict[str, Set[str]] = defaultdict(set)  # capability -> agent_ids
         self.timeout_seconds = 120  # 2분
+        # 간략 /discover 응답 캐시: capability -> 직렬화된 JSON (등록/제거 시 무효화)
+        self._discover_bytes: Dict[Optional[str], bytes] = {}
+        
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize_name(name: str) -> str:
+        """이름 정규화 ("Price-Agent", "price agent" 등을 같은 키로)"""
+        return name.lower().replace("-", " ")
         
     def register_agent(self, request: RegisterRequest) -> AgentInfo:
         """에이전트 등록"""
@@ -71,8 +100,14 @@ class Registry:
             metadata=request.metadata
         )
         
+        # 재등록 시 이전 인덱스 항목 제거
+        if request.agent_id in self.agents:
+            self._remove_from_index(self.agents[request.agent_id])
+            
         self.agents[request.agent_id] = agent_info
-        self.last_heartbeat[request.agent_id] = datetime.now()
+        self._touch(request.agent_id)
+        self._add_to_index(agent_info)
+        self._discover_bytes.clear()
         
         print(f"✅ 에이전트 등록: {agent_info.name} (ID: {agent_info.agent_id})")
         print(f"   - Endpoint: {agent_info.endpoint}")
@@ -80,62 +115,150 @@ class Registry:
         
         return agent_info
         
+    def deregister_agent(self, agent_id: str):
+        """에이전트 등록 해제"""
+        agent_info = self.agents.get(agent_id)
+        if agent_info is None:
+            raise ValueError(f"Unknown agent: {agent_id}")
+            
+        # 만료 힙의 남은 항목은 last_heartbeat가 없으므로 정리 시 건너뜀
+        self._remove_from_index(agent_info)
+        del self.agents[agent_id]
+        del self.last_heartbeat[agent_id]
+        self._discover_bytes.clear()
+        print(f"🔴 에이전트 등록 해제: {agent_info.name} (ID: {agent_id})")
+        
     def update_heartbeat(self, agent_id: str):
         """하트비트 업데이트"""
         if agent_id in self.agents:
-            self.last_heartbeat[agent_id] = datetime.now()
+            self._touch(agent_id)
             # 하트비트 로그는 비활성화 (너무 많은 로그 방지)
             # print(f"💓 하트비트 업데이트: {agent_id}")
         else:
             raise ValueError(f"Unknown agent: {agent_id}")
             
+    def update_heartbeats(self, agent_ids: List[str]) -> List[str]:
+        """여러 에이전트 하트비트 일괄 업데이트 (등록되지 않은 agent_id 목록 반환)"""
+        unknown = []
+        for agent_id in agent_ids:
+            if agent_id in self.agents:
+                self._touch(agent_id)
+            else:
+                unknown.append(agent_id)
+        return unknown
+            
     def discover_agents(self, capability: Optional[str] = None) -> List[AgentInfo]:
         """활성 에이전트 발견"""
         # 타임아웃된 에이전트 제거
         self._cleanup_inactive_agents()
         
-        active_agents = []
-        for agent_id, agent_info in self.agents.items():
-            if capability:
-                # 특정 능력을 가진 에이전트만 필터링
-                has_capability = any(
-                    cap.get("name") == capability 
-                    for cap in agent_info.capabilities
-                )
-                if has_capability:
-                    active_agents.append(agent_info)
-            else:
-                active_agents.append(agent_info)
+        if capability:
+            # 특정 능력을 가진 에이전트만 인덱스에서 조회
+            active_agents = [self.agents[aid] for aid in self.by_capability.get(capability, ())]
+        else:
+            active_agents = list(self.agents.values())
                 
         print(f"🔍 에이전트 검색 - capability: {capability}")
         print(f"   - 활성 에이전트 수: {len(active_agents)}")
         
         return active_agents
         
+    def discover_agents_slim(self, capability: Optional[str] = None) -> bytes:
+        """활성 에이전트 발견 (id/name/endpoint/capability 이름만 담은 직렬화 응답)"""
+        self._cleanup_inactive_agents()
+        
+        # 임의의 capability 쿼리로 캐시가 커지지 않도록 인덱스에 없는 능력은 캐싱하지 않음
+        if capability and capability not in self.by_capability:
+            return _EMPTY_DISCOVER_BODY
+            
+        body = self._discover_bytes.get(capability)
+        if body is None:
+            if capability:
+                agents = [self.agents[aid] for aid in self.by_capability[capability]]
+            else:
+                agents = list(self.agents.values())
+            body = orjson.dumps({
+                "agents": [
+                    {
+                        "id": agent.agent_id,
+                        "name": agent.name,
+                        "endpoint": agent.endpoint,
+                        "caps": [c["name"] for c in agent.capabilities if c.get("name")]
+                    }
+                    for agent in agents
+                ],
+                "count": len(agents)
+            })
+            self._discover_bytes[capability] = body
+            
+        return body
+        
     def get_agent(self, agent_id: str) -> Optional[AgentInfo]:
         """특정 에이전트 조회"""
         self._cleanup_inactive_agents()
         return self.agents.get(agent_id)
         
+    def resolve_agent(self, name_or_id: str) -> Optional[AgentInfo]:
+        """ID 또는 이름으로 에이전트 조회"""
+        self._cleanup_inactive_agents()
+        agent_id = name_or_id if name_or_id in self.agents else self.by_name.get(self.normalize_name(name_or_id))
+        return self.agents.get(agent_id) if agent_id else None
+        
+    def _add_to_index(self, agent_info: AgentInfo):
+        """이름/능력 인덱스에 추가"""
+        self.by_name[agent_info.norm_name] = agent_info.agent_id
+        for cap in agent_info.capabilities:
+            cap_name = cap.get("name")
+            if cap_name:
+                self.by_capability[cap_name].add(agent_info.agent_id)
+                
+    def _remove_from_index(self, agent_info: AgentInfo):
+        """이름/능력 인덱스에서 제거"""
+        if self.by_name.get(agent_info.norm_name) == agent_info.agent_id:
+            del self.by_name[agent_info.norm_name]
+        for cap in agent_info.capabilities:
+            agent_ids = self.by_capability.get(cap.get("name"))
+            if agent_ids is not None:
+                agent_ids.discard(agent_info.agent_id)
+                if not agent_ids:
+                    del self.by_capability[cap["name"]]
+        
+    def _touch(self, agent_id: str):
+        """하트비트 시각 갱신 및 만료 힙에 추가"""
+        now = time.monotonic()
+        self.last_heartbeat[agent_id] = now
+        heapq.heappush(self._expiry_heap, (now + self.timeout_seconds, agent_id))
+        
+    def last_heartbeat_datetime(self, agent_id: str) -> Optional[datetime]:
+        """마지막 하트비트를 벽시계 시각으로 변환"""
+        last_seen = self.last_heartbeat.get(agent_id)
+        if last_seen is None:
+            return None
+        return datetime.fromtimestamp(time.time() - (time.monotonic() - last_seen))
+        
     def _cleanup_inactive_agents(self):
-        """비활성 에이전트 정리"""
-        now = datetime.now()
-        timeout_threshold = now - timedelta(seconds=self.timeout_seconds)
-        
-        inactive_agents = []
-        for agent_id, last_seen in self.last_heartbeat.items():
-            if last_seen < timeout_threshold:
-                inactive_agents.append(agent_id)
+        """비활성 에이전트 정리 (만료 힙의 앞부분만 확인)"""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        
+        while heap and heap[0][0] <= now:
+            expires_at, agent_id = heapq.heappop(heap)
+            last_seen = self.last_heartbeat.get(agent_id)
+            
+            # 이후 하트비트로 갱신된 항목(또는 이미 제거된 에이전트)은 건너뜀
+            if last_seen is None or last_seen + self.timeout_seconds != expires_at:
+                continue
                 
-        for agent_id in inactive_agents:
             agent_name = self.agents[agent_id].name
+            self._remove_from_index(self.agents[agent_id])
             del self.agents[agent_id]
             del self.last_heartbeat[agent_id]
+            self._discover_bytes.clear()
             print(f"🔴 비활성 에이전트 제거: {agent_name} (ID: {agent_id})")
 
 
 # FastAPI 앱 생성
-app = FastAPI(title="A2A Registry Server")
+app = FastAPI(title="A2A Registry Server", default_response_class=ORJSONResponse)
 registry = Registry()
 
 
@@ -159,6 +282,16 @@ async def register_agent(request: RegisterRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.delete("/register/{agent_id}")
+async def deregister_agent(agent_id: str):
+    """에이전트 등록 해제"""
+    try:
+        registry.deregister_agent(agent_id)
+        return {"status": "deregistered", "message": f"Agent {agent_id} deregistered"}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @app.put("/heartbeat/{agent_id}")
 async def update_heartbeat(agent_id: str):
     """하트비트 업데이트"""
@@ -169,12 +302,23 @@ async def update_heartbeat(agent_id: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@app.post("/heartbeat/batch")
+async def update_heartbeats(request: HeartbeatBatchRequest):
+    """하트비트 일괄 업데이트"""
+    unknown = registry.update_heartbeats(request.agent_ids)
+    return {"status": "ok", "updated": len(request.agent_ids) - len(unknown), "unknown": unknown}
+
+
 @app.get("/discover", response_model=DiscoverResponse)
-async def discover_agents(capability: Optional[str] = None):
-    """에이전트 발견"""
+async def discover_agents(capability: Optional[str] = None, verbose: bool = False):
+    """에이전트 발견 (기본은 간략 응답, verbose=1이면 전체 메타데이터)"""
+    if not verbose:
+        return Response(content=registry.discover_agents_slim(capability), media_type="application/json")
+        
     agents = registry.discover_agents(capability)
     return DiscoverResponse(
-        agents=[agent.to_dict() for agent in agents]
+        agents=[agent.to_dict() for agent in agents],
+        count=len(agents)
     )
 
 
@@ -188,6 +332,16 @@ async def get_agent(agent_id: str):
         raise HTTPException(status_code=404, detail=f"Agent not found: {agent_id}")
 
 
+@app.get("/resolve")
+async def resolve_agent(name_or_id: str):
+    """ID 또는 이름으로 에이전트 조회"""
+    agent = registry.resolve_agent(name_or_id)
+    if agent:
+        return agent.to_dict()
+    else:
+        raise HTTPException(status_code=404, detail=f"Agent not found: {name_or_id}")
+
+
 @app.get("/status")
 async def get_status():
     """레지스트리 상태"""
@@ -201,13 +355,33 @@ async def get_status():
                 "name": agent.name,
                 "endpoint": agent.endpoint,
                 "capabilities": [c["name"] for c in agent.capabilities],
-                "last_heartbeat": registry.last_heartbeat.get(agent_id).isoformat()
+                "last_heartbeat": registry.last_heartbeat_datetime(agent_id).isoformat()
             }
             for agent_id, agent in registry.agents.items()
         ]
     }
 
 
+# 주기적인 비활성 에이전트 정리 태스크
+async def periodic_cleanup():
+    """10초마다 만료된 에이전트 정리"""
+    while True:
+        await asyncio.sleep(10)
+        registry._cleanup_inactive_agents()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """서버 시작 시 백그라운드 태스크 실행"""
+    asyncio.create_task(periodic_cleanup())
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # uvloop(libuv 기반 이벤트 루프) + httptools 파서 사용, 미설치 환경에서는 기본값으로 폴백
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop=loop_impl, http="auto")
\ No newline at end of file
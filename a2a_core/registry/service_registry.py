@@ -5,16 +5,21 @@
 """
 
 import asyncio
+import heapq
 import httpx
-from typing import Dict, List, Optional, Set
+import importlib.util
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import uuid
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import msgspec
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 
-class AgentInfo(BaseModel):
+class AgentInfo(msgspec.Struct, kw_only=True):
     """에이전트 정보 모델"""
     agent_id: str
     name: str
@@ -22,8 +27,25 @@ class AgentInfo(BaseModel):
     endpoint: str
     capabilities: List[Dict]
     status: str = "active"
-    last_heartbeat: datetime = None
+    last_heartbeat: Optional[float] = None  # time.monotonic() 기준 초
     metadata: Dict = {}
+    
+    def to_dict(self) -> Dict:
+        """응답용 딕셔너리 (last_heartbeat는 벽시계 시각 ISO 문자열로 변환)"""
+        data = msgspec.structs.asdict(self)
+        if self.last_heartbeat is not None:
+            data["last_heartbeat"] = datetime.fromtimestamp(
+                time.time() - (time.monotonic() - self.last_heartbeat)
+            ).isoformat()
+        return data
+        
+    @classmethod
+    def from_json(cls, data: bytes) -> "AgentInfo":
+        """JSON 바이트에서 검증과 함께 생성"""
+        return _agent_decoder.decode(data)
+
+
+_agent_decoder = msgspec.json.Decoder(AgentInfo)
 
 
 class ServiceRegistry:
@@ -31,9 +53,83 @@ class ServiceRegistry:
     
     def __init__(self):
         self.agents: Dict[str, AgentInfo] = {}
-        self.capabilities_index: Dict[str, Set[str]] = {}  # capability -> agent_ids
+        # agents/capabilities_index는 쓰기 시 새 dict로 교체(copy-on-write)하므로
+        # 읽는 쪽은 참조를 한 번 잡아두면 순회 중 변경될 걱정이 없음
+        self.capabilities_index: Dict[str, FrozenSet[str]] = {}  # capability -> agent_ids (불변)
+        self.name_index: Dict[str, str] = {}  # 정규화된 이름 -> agent_id
         self.heartbeat_interval = 30  # seconds
         self.heartbeat_timeout = 90  # seconds
+        self.health_check_budget_seconds = 1.5  # 헬스체크 한 회차 전체 제한 시간
+        # 헬스체크는 agent_id 해시로 샤드를 나눠 샤드마다 별도 keep-alive 클라이언트(연결 풀)로 수행
+        self.health_check_shards = 4
+        self.http_clients: List[httpx.AsyncClient] = []  # 샤드별 클라이언트 (startup에서 생성)
+        # 타임아웃 검사용 (하트비트 시각, agent_id) 최소 힙
+        self._heartbeat_heap: List[Tuple[float, str]] = []
+        # 수신한 하트비트 (agent_id, monotonic 시각) 대기열, drain_heartbeats가 모아서 반영
+        self._heartbeat_queue: asyncio.Queue = asyncio.Queue()
+        self.heartbeat_flush_interval = 0.1  # seconds
+        # 활성 에이전트 목록 캐시: capability -> (세대, 목록), 변경 시 세대 증가로 무효화
+        self._gen = 0
+        self._active_cache: Dict[Optional[str], Tuple[int, List[AgentInfo]]] = {}
+        
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize_name(name: str) -> str:
+        """이름 정규화 ("Price-Agent", "price agent" 등을 같은 키로)"""
+        return name.lower().replace("-", " ")
+        
+    def _invalidate_active_cache(self):
+        """에이전트/상태 변경 시 활성 목록 캐시 세대 증가 및 이전 세대 항목 삭제"""
+        self._gen += 1
+        self._active_cache.clear()
+        
+    def _set_status(self, agent_info: AgentInfo, status: str):
+        """에이전트 상태 변경 (실제로 바뀐 경우에만 캐시 세대 증가)"""
+        if agent_info.status != status:
+            agent_info.status = status
+            self._invalidate_active_cache()
+            
+    def _touch(self, agent_id: str, ts: Optional[float] = None):
+        """하트비트 기록 (힙에는 추가만 하고 오래된 항목은 꺼낼 때 건너뜀)"""
+        agent_info = self.agents.get(agent_id)
+        if agent_info is None:
+            return  # 헬스체크 또는 대기열 반영 전에 해제된 에이전트
+        if ts is None:
+            ts = time.monotonic()
+        agent_info.last_heartbeat = ts
+        heapq.heappush(self._heartbeat_heap, (ts, agent_id))
+        
+    def _expire_stale_agents(self):
+        """하트비트 타임아웃된 에이전트를 비활성으로 표시 (만료된 힙 항목만 확인)"""
+        cutoff = time.monotonic() - self.heartbeat_timeout
+        heap = self._heartbeat_heap
+        
+        while heap and heap[0][0] < cutoff:
+            ts, agent_id = heapq.heappop(heap)
+            # 이후 하트비트로 갱신되었거나 해제된 에이전트의 항목은 무시
+            agent_info = self.agents.get(agent_id)
+            if agent_info and agent_info.last_heartbeat == ts:
+                self._set_status(agent_info, "inactive")
+                
+    def _reindex_capabilities(self, agent_id: str, old_capabilities: List[Dict], new_capabilities: List[Dict]):
+        """능력 인덱스를 새 dict로 만들어 교체 (값은 쓰기마다 새로 만든 frozenset)"""
+        index = dict(self.capabilities_index)
+        
+        for capability in old_capabilities:
+            cap_name = capability.get("name")
+            if cap_name and cap_name in index:
+                remaining = index[cap_name] - {agent_id}
+                if remaining:
+                    index[cap_name] = remaining
+                else:
+                    del index[cap_name]
+                
+        for capability in new_capabilities:
+            cap_name = capability.get("name")
+            if cap_name:
+                index[cap_name] = index.get(cap_name, frozenset()) | {agent_id}
+                
+        self.capabilities_index = index
         
     async def register_agent(self, agent_info: AgentInfo) -> Dict:
         """에이전트 등록"""
@@ -42,16 +138,14 @@ class ServiceRegistry:
             agent_id = str(uuid.uuid4())
             agent_info.agent_id = agent_id
             
-        agent_info.last_heartbeat = datetime.now()
-        self.agents[agent_id] = agent_info
+        previous = self.agents.get(agent_id)
+        self.agents = {**self.agents, agent_id: agent_info}
+        self._touch(agent_id)
+        self._invalidate_active_cache()
+        self.name_index[self.normalize_name(agent_info.name)] = agent_id
         
-        # 능력별 인덱스 업데이트
-        for capability in agent_info.capabilities:
-            cap_name = capability.get("name")
-            if cap_name:
-                if cap_name not in self.capabilities_index:
-                    self.capabilities_index[cap_name] = set()
-                self.capabilities_index[cap_name].add(agent_id)
+        # 능력별 인덱스 업데이트 (재등록이면 이전 능력은 제거)
+        self._reindex_capabilities(agent_id, previous.capabilities if previous else [], agent_info.capabilities)
                 
         print(f"✅ 에이전트 등록 완료: {agent_info.name} ({agent_id})")
         
@@ -67,12 +161,16 @@ class ServiceRegistry:
             agent_info = self.agents[agent_id]
             
             # 능력 인덱스에서 제거
-            for capability in agent_info.capabilities:
-                cap_name = capability.get("name")
-                if cap_name and cap_name in self.capabilities_index:
-                    self.capabilities_index[cap_name].discard(agent_id)
-                    
-            del self.agents[agent_id]
+            self._reindex_capabilities(agent_id, agent_info.capabilities, [])
+            
+            name_key = self.normalize_name(agent_info.name)
+            if self.name_index.get(name_key) == agent_id:
+                del self.name_index[name_key]
+                
+            agents = dict(self.agents)
+            del agents[agent_id]
+            self.agents = agents
+            self._invalidate_active_cache()
             print(f"🔴 에이전트 등록 해제: {agent_info.name} ({agent_id})")
             
             return {"status": "deregistered", "message": f"Agent {agent_id} deregistered"}
@@ -80,35 +178,73 @@ class ServiceRegistry:
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
     async def update_heartbeat(self, agent_id: str) -> Dict:
-        """에이전트 상태 업데이트 (하트비트)"""
+        """에이전트 상태 업데이트 (하트비트, 대기열에 넣고 바로 응답)"""
         if agent_id in self.agents:
-            self.agents[agent_id].last_heartbeat = datetime.now()
+            self._heartbeat_queue.put_nowait((agent_id, time.monotonic()))
             return {"status": "ok", "timestamp": datetime.now().isoformat()}
             
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
+    async def update_heartbeats(self, agent_ids: List[str]) -> Dict:
+        """여러 에이전트 하트비트 일괄 업데이트 (대기열에 넣고 바로 응답)"""
+        now = time.monotonic()
+        unknown = []
+        for agent_id in agent_ids:
+            if agent_id in self.agents:
+                self._heartbeat_queue.put_nowait((agent_id, now))
+            else:
+                unknown.append(agent_id)
+                
+        return {
+            "status": "ok",
+            "updated": len(agent_ids) - len(unknown),
+            "unknown": unknown,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    def _apply_heartbeats(self, heartbeats: List[Tuple[str, float]]):
+        """대기열에서 꺼낸 하트비트를 한 번에 반영"""
+        for agent_id, ts in heartbeats:
+            agent_info = self.agents.get(agent_id)
+            if agent_info:
+                self._set_status(agent_info, "active")
+                self._touch(agent_id, ts)
+                
+    async def drain_heartbeats(self):
+        """하트비트 대기열을 주기적으로 비워 일괄 반영"""
+        queue = self._heartbeat_queue
+        while True:
+            heartbeats = [await queue.get()]
+            while not queue.empty():
+                heartbeats.append(queue.get_nowait())
+            self._apply_heartbeats(heartbeats)
+            await asyncio.sleep(self.heartbeat_flush_interval)
+            
     async def discover_agents(self, capability: Optional[str] = None) -> List[AgentInfo]:
-        """에이전트 발견"""
-        active_agents = []
-        current_time = datetime.now()
-        
-        # 타임아웃된 에이전트 필터링
-        for agent_id, agent_info in list(self.agents.items()):
-            if agent_info.last_heartbeat:
-                time_diff = (current_time - agent_info.last_heartbeat).total_seconds()
-                if time_diff > self.heartbeat_timeout:
-                    agent_info.status = "inactive"
-                else:
-                    agent_info.status = "active"
-                    
-            if agent_info.status == "active":
-                if capability:
-                    # 특정 능력을 가진 에이전트만 반환
-                    if capability in self.capabilities_index and agent_id in self.capabilities_index[capability]:
-                        active_agents.append(agent_info)
-                else:
-                    active_agents.append(agent_info)
-                    
+        """에이전트 발견 (타임아웃 처리는 주기 작업에서 하므로 인덱스 조회만 수행)"""
+        # 이후 변경이 없었으면 캐시된 목록 반환
+        cached = self._active_cache.get(capability)
+        if cached and cached[0] == self._gen:
+            return cached[1]
+            
+        # 현재 스냅샷 참조 (쓰기는 새 dict로 교체되므로 잠금 불필요)
+        agents = self.agents
+        
+        if capability:
+            # 특정 능력을 가진 에이전트만 인덱스에서 조회 (전체 순회 없이 O(k))
+            candidates = (
+                agents[agent_id]
+                for agent_id in self.capabilities_index.get(capability, ())
+                if agent_id in agents
+            )
+        else:
+            candidates = agents.values()
+            
+        active_agents = [agent_info for agent_info in candidates if agent_info.status == "active"]
+        
+        # 임의의 capability 쿼리로 캐시가 커지지 않도록 전체 목록과 인덱스에 있는 능력만 캐싱
+        if not capability or capability in self.capabilities_index:
+            self._active_cache[capability] = (self._gen, active_agents)
         return active_agents
         
     async def get_agent_info(self, agent_id: str) -> AgentInfo:
@@ -118,25 +254,61 @@ class ServiceRegistry:
             
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
         
+    async def resolve_agent(self, name_or_id: str) -> AgentInfo:
+        """ID 또는 이름으로 활성 에이전트 조회"""
+        agent_id = name_or_id if name_or_id in self.agents else self.name_index.get(self.normalize_name(name_or_id))
+        agent_info = self.agents.get(agent_id) if agent_id else None
+        
+        if agent_info and agent_info.status == "active":
+            return agent_info
+            
+        raise HTTPException(status_code=404, detail=f"Agent {name_or_id} not found")
+        
     async def health_check_agents(self):
-        """모든 에이전트 상태 확인"""
-        async with httpx.AsyncClient() as client:
-            for agent_id, agent_info in self.agents.items():
+        """모든 에이전트 상태 확인 (샤드별 동시 실행 최대 50개, 회차당 제한 시간 적용)"""
+        async def _probe(agent_info: AgentInfo, client: httpx.AsyncClient, semaphore: asyncio.Semaphore):
+            async with semaphore:
                 try:
                     # 각 에이전트의 health endpoint 호출
                     health_url = f"{agent_info.endpoint}/health"
                     response = await client.get(health_url, timeout=5.0)
                     
                     if response.status_code == 200:
-                        agent_info.status = "active"
-                        agent_info.last_heartbeat = datetime.now()
+                        self._set_status(agent_info, "active")
+                        self._touch(agent_info.agent_id)
                     else:
-                        agent_info.status = "unhealthy"
+                        self._set_status(agent_info, "unhealthy")
                         
                 except Exception as e:
-                    agent_info.status = "unreachable"
+                    self._set_status(agent_info, "unreachable")
                     print(f"⚠️ 에이전트 {agent_info.name} 상태 확인 실패: {e}")
                     
+        # 확인 중 등록/해제가 일어나도 안전하도록 스냅샷 사용
+        agents = self.agents
+        if not agents or not self.http_clients:
+            return
+            
+        # agent_id 해시로 샤드 분배, 샤드마다 자체 연결 풀과 동시 실행 한도 사용
+        shard_count = len(self.http_clients)
+        shards: List[List[AgentInfo]] = [[] for _ in range(shard_count)]
+        for agent_id, agent_info in agents.items():
+            shards[hash(agent_id) % shard_count].append(agent_info)
+            
+        tasks = {}
+        for shard, client in zip(shards, self.http_clients):
+            semaphore = asyncio.Semaphore(50)
+            for agent_info in shard:
+                tasks[asyncio.create_task(_probe(agent_info, client, semaphore))] = agent_info
+                
+        _, pending = await asyncio.wait(tasks, timeout=self.health_check_budget_seconds)
+        
+        # 제한 시간 안에 응답하지 않은 에이전트는 연결 불가로 처리
+        for task in pending:
+            task.cancel()
+            self._set_status(tasks[task], "unreachable")
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            
     async def update_agent_capabilities(self, agent_id: str, capabilities: List[Dict]) -> Dict:
         """에이전트 능력 업데이트"""
         if agent_id not in self.agents:
@@ -144,22 +316,10 @@ class ServiceRegistry:
             
         agent_info = self.agents[agent_id]
         
-        # 기존 능력 인덱스에서 제거
-        for capability in agent_info.capabilities:
-            cap_name = capability.get("name")
-            if cap_name and cap_name in self.capabilities_index:
-                self.capabilities_index[cap_name].discard(agent_id)
-                
-        # 새 능력 설정
+        # 능력 인덱스 교체 후 새 능력 설정
+        self._reindex_capabilities(agent_id, agent_info.capabilities, capabilities)
         agent_info.capabilities = capabilities
-        
-        # 새 능력 인덱스에 추가
-        for capability in capabilities:
-            cap_name = capability.get("name")
-            if cap_name:
-                if cap_name not in self.capabilities_index:
-                    self.capabilities_index[cap_name] = set()
-                self.capabilities_index[cap_name].add(agent_id)
+        self._invalidate_active_cache()
                 
         print(f"✅ 에이전트 {agent_info.name}의 능력 업데이트: {[cap.get('name') for cap in capabilities]}")
         
@@ -171,13 +331,17 @@ class ServiceRegistry:
 
 
 # FastAPI 앱 생성
-app = FastAPI(title="A2A Service Registry", version="1.0.0")
+app = FastAPI(title="A2A Service Registry", version="1.0.0", default_response_class=ORJSONResponse)
 registry = ServiceRegistry()
 
 
 @app.post("/register")
-async def register_agent(agent_info: AgentInfo):
-    """에이전트 등록 엔드포인트"""
+async def register_agent(request: Request):
+    """에이전트 등록 엔드포인트 (msgspec으로 본문을 직접 디코딩)"""
+    try:
+        agent_info = AgentInfo.from_json(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     return await registry.register_agent(agent_info)
 
 
@@ -193,17 +357,43 @@ async def update_heartbeat(agent_id: str):
     return await registry.update_heartbeat(agent_id)
 
 
+@app.post("/heartbeat/batch")
+async def update_heartbeats(request_body: Dict):
+    """하트비트 일괄 업데이트 엔드포인트"""
+    return await registry.update_heartbeats(request_body.get("agent_ids", []))
+
+
 @app.get("/discover")
-async def discover_agents(capability: Optional[str] = None):
-    """에이전트 발견 엔드포인트"""
+async def discover_agents(capability: Optional[str] = None, verbose: bool = False):
+    """에이전트 발견 엔드포인트 (기본은 간략 응답, verbose=1이면 전체 메타데이터)"""
     agents = await registry.discover_agents(capability)
-    return {"agents": agents, "count": len(agents)}
+    if verbose:
+        return {"agents": [agent.to_dict() for agent in agents], "count": len(agents)}
+        
+    return {
+        "agents": [
+            {
+                "id": agent.agent_id,
+                "name": agent.name,
+                "endpoint": agent.endpoint,
+                "caps": [c["name"] for c in agent.capabilities if c.get("name")]
+            }
+            for agent in agents
+        ],
+        "count": len(agents)
+    }
 
 
 @app.get("/agents/{agent_id}")
 async def get_agent_info(agent_id: str):
     """특정 에이전트 정보 조회 엔드포인트"""
-    return await registry.get_agent_info(agent_id)
+    return (await registry.get_agent_info(agent_id)).to_dict()
+
+
+@app.get("/resolve")
+async def resolve_agent(name_or_id: str):
+    """ID 또는 이름으로 에이전트 조회 엔드포인트"""
+    return (await registry.resolve_agent(name_or_id)).to_dict()
 
 
 @app.get("/health")
@@ -225,17 +415,40 @@ async def update_agent_capabilities(agent_id: str, request_body: Dict):
 
 # 주기적인 헬스체크 태스크
 async def periodic_health_check():
-    """주기적으로 모든 에이전트 상태 확인"""
+    """주기적으로 하트비트 타임아웃 처리 및 모든 에이전트 상태 확인"""
     while True:
         await asyncio.sleep(30)  # 30초마다
+        registry._expire_stale_agents()
         await registry.health_check_agents()
 
 
 @app.on_event("startup")
 async def startup_event():
-    """서비스 시작 시 백그라운드 태스크 실행"""
+    """서비스 시작 시 HTTP 클라이언트 생성 및 백그라운드 태스크 실행"""
+    http2 = importlib.util.find_spec("h2") is not None
+    registry.http_clients = [
+        httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=50),
+            http2=http2
+        )
+        for _ in range(registry.health_check_shards)
+    ]
     asyncio.create_task(periodic_health_check())
+    asyncio.create_task(registry.drain_heartbeats())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서비스 종료 시 HTTP 클라이언트 정리"""
+    await asyncio.gather(*[client.aclose() for client in registry.http_clients])
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # uvloop(libuv 기반 이벤트 루프) 사용, 미설치 환경에서는 기본값으로 폴백
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop=loop_impl, http="auto")
\ No newline at end of file
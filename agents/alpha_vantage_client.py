@@ -4,11 +4,61 @@ Alpha Vantage API Client for Technical Indicators
 """
 
 import os
-import requests
+import bisect
+import time
+import zlib
+import asyncio
+import httpx
+import importlib.util
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
 
+# 폴백 데이터용 고정 난수표 (종목 코드로 인덱싱하므로 같은 종목은 항상 같은 값)
+_RAND_TABLE = np.random.default_rng(0).standard_normal(256)
+
+# 폴백 이동평균(5/20/60/120일)의 기준가 대비 편차 크기와 난수표 오프셋
+_FALLBACK_MA_SIGMAS = np.array([0.02, 0.01, -0.01, -0.02])
+_FALLBACK_MA_OFFSETS = np.arange(1, 5)
+
+# RSI 구간 경계 (30 미만 / 30~40 / 40~60 / 60~70 / 70 이상)
+_RSI_BOUNDS = (30, 40, 60, 70)
+_RSI_MESSAGES = (
+    "과매도 구간 - 단기 반등 가능성",
+    "약세 구간 - 하락 추세",
+    "중립 구간",
+    "강세 구간 - 상승 추세 지속",
+    "과매수 구간 - 단기 조정 가능성"
+)
+
+# 신호 강도 구간 경계 (-3 이하 / -2~-1 / 0 / 1~2 / 3 이상)
+_STRENGTH_BOUNDS = (-2, 0, 1, 3)
+_SIGNAL_LEVELS = (
+    ('strong_sell', '적극 매도 - 기술적 지표 매우 부정적'),
+    ('sell', '매도 고려 - 기술적 지표 부정적'),
+    ('neutral', '관망 권장 - 뚜렷한 방향성 없음'),
+    ('buy', '매수 권장 - 기술적 지표 긍정적'),
+    ('strong_buy', '적극 매수 - 기술적 지표 매우 긍정적')
+)
+
+
+def _symbol_index(symbol: str) -> int:
+    """난수표 인덱스 기준값 (프로세스마다 달라지는 hash() 대신 crc32 사용)"""
+    return zlib.crc32(symbol.encode())
+
+
+def _score_signals(rows: np.ndarray) -> np.ndarray:
+    """(rsi, histogram, ma5, ma20) 행렬의 신호 강도를 벡터 연산으로 계산
+
+    _generate_trading_signals와 같은 규칙이며, NaN인 지표는 점수에 반영하지 않음
+    """
+    rsi, histogram, ma5, ma20 = rows.T
+    strength = np.where(rsi < 30, 2, 0) - np.where(rsi > 70, 2, 0)
+    strength += np.where(np.isnan(histogram), 0, np.where(histogram > 0, 1, -1))
+    strength += np.where(np.isnan(ma5), 0, np.where(ma5 > ma20, 1, -1))
+    return strength
+
+
 class AlphaVantageClient:
     """Alpha Vantage API 클라이언트"""
 
@@ -17,22 +67,45 @@ class AlphaVantageClient:
         self.base_url = 'https://www.alphavantage.co/query'
         self.is_valid = self._validate_api_key()
 
+        # 같은 호스트(alphavantage.co)로 반복 호출하므로 keep-alive 클라이언트 재사용
+        # h2 패키지가 있으면 HTTP/2로 동시 지표 요청을 한 커넥션에 다중화
+        self.client = httpx.AsyncClient(
+            timeout=5.0,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=10)
+        )
+        # 무료 티어 호출 제한을 고려해 동시 요청 수 제한
+        self._semaphore = asyncio.Semaphore(5)
+
+        # 일봉 지표는 장중에 바뀌지 않으므로 최신값을 메모리에 캐싱
+        # (symbol, function, time_period) -> (저장 시각, (날짜, 지표값))
+        self._cache: Dict[Tuple, Tuple[float, Tuple[str, Dict]]] = {}
+        self.cache_ttl = 3600  # 1시간
+        self.cache_maxsize = 4096
+
     def _validate_api_key(self) -> bool:
         """API 키 유효성 검사"""
         if not self.api_key or 'your_alpha_vantage' in self.api_key.lower():
             return False
         return True
 
-    def get_technical_indicators(self, symbol: str) -> Dict:
+    async def aclose(self):
+        """keep-alive HTTP 클라이언트 종료 (애플리케이션 종료 시 한 번 호출)"""
+        await self.client.aclose()
+
+    async def get_technical_indicators(self, symbol: str) -> Dict:
         """기술적 지표 종합 조회"""
         indicators = {}
 
         if self.is_valid:
-            # API 호출 제한으로 인해 순차적으로 호출
-            indicators['rsi'] = self._get_rsi(symbol)
-            indicators['macd'] = self._get_macd(symbol)
-            indicators['ma'] = self._get_moving_averages(symbol)
-            indicators['bb'] = self._get_bollinger_bands(symbol)
+            # 지표들은 서로 독립적이므로 동시에 호출 (동시 요청 수는 세마포어로 제한)
+            rsi, macd, ma, bb = await asyncio.gather(
+                self._get_rsi(symbol),
+                self._get_macd(symbol),
+                self._get_moving_averages(symbol),
+                self._get_bollinger_bands(symbol)
+            )
+            indicators = {'rsi': rsi, 'macd': macd, 'ma': ma, 'bb': bb}
         else:
             # 폴백 데이터 사용
             indicators = self._calculate_local_indicators(symbol)
@@ -42,7 +115,43 @@ class AlphaVantageClient:
 
         return indicators
 
-    def _get_rsi(self, symbol: str, period: int = 14) -> Dict:
+    async def _fetch_latest(self, params: Dict) -> Optional[Tuple[str, Dict]]:
+        """Alpha Vantage 지표 호출 후 가장 최근 날짜와 값 반환 (TTL 캐시 적용)"""
+        function = params['function']
+        key = (params['symbol'], function, params.get('time_period'))
+
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        async with self._semaphore:
+            response = await self.client.get(self.base_url, params=params)
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        series = data.get(f'Technical Analysis: {function}')
+        if not series:
+            return None
+
+        latest_date = next(iter(series))
+        latest = (latest_date, series[latest_date])
+
+        # 캐시 크기 제한 (가장 오래된 항목 삭제)
+        if len(self._cache) >= self.cache_maxsize:
+            oldest_key = min(self._cache, key=lambda k: self._cache[k][0])
+            del self._cache[oldest_key]
+        self._cache[key] = (time.monotonic(), latest)
+
+        return latest
+
+    def purge_older_than(self, seconds: float):
+        """지정한 시간보다 오래된 캐시 항목 삭제"""
+        threshold = time.monotonic() - seconds
+        for key in [k for k, (stored_at, _) in self._cache.items() if stored_at < threshold]:
+            del self._cache[key]
+
+    async def _get_rsi(self, symbol: str, period: int = 14) -> Dict:
         """RSI (Relative Strength Index) 조회"""
         try:
             params = {
@@ -54,23 +163,21 @@ class AlphaVantageClient:
                 'apikey': self.api_key
             }
 
-            response = requests.get(self.base_url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if 'Technical Analysis: RSI' in data:
-                    rsi_data = data['Technical Analysis: RSI']
-                    latest_date = list(rsi_data.keys())[0]
-                    return {
-                        'value': float(rsi_data[latest_date]['RSI']),
-                        'date': latest_date,
-                        'interpretation': self._interpret_rsi(float(rsi_data[latest_date]['RSI']))
-                    }
+            result = await self._fetch_latest(params)
+            if result:
+                latest_date, latest = result
+                rsi = float(latest['RSI'])
+                return {
+                    'value': rsi,
+                    'date': latest_date,
+                    'interpretation': self._interpret_rsi(rsi)
+                }
         except Exception as e:
             print(f"Alpha Vantage RSI 오류: {e}")
 
         return self._get_fallback_rsi(symbol)
 
-    def _get_macd(self, symbol: str) -> Dict:
+    async def _get_macd(self, symbol: str) -> Dict:
         """MACD 지표 조회"""
         try:
             params = {
@@ -81,60 +188,62 @@ class AlphaVantageClient:
                 'apikey': self.api_key
             }
 
-            response = requests.get(self.base_url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if 'Technical Analysis: MACD' in data:
-                    macd_data = data['Technical Analysis: MACD']
-                    latest_date = list(macd_data.keys())[0]
-                    macd = float(macd_data[latest_date]['MACD'])
-                    signal = float(macd_data[latest_date]['MACD_Signal'])
-                    histogram = float(macd_data[latest_date]['MACD_Hist'])
-
-                    return {
-                        'macd': macd,
-                        'signal': signal,
-                        'histogram': histogram,
-                        'date': latest_date,
-                        'interpretation': self._interpret_macd(macd, signal, histogram)
-                    }
+            result = await self._fetch_latest(params)
+            if result:
+                latest_date, latest = result
+                macd = float(latest['MACD'])
+                signal = float(latest['MACD_Signal'])
+                histogram = float(latest['MACD_Hist'])
+
+                return {
+                    'macd': macd,
+                    'signal': signal,
+                    'histogram': histogram,
+                    'date': latest_date,
+                    'interpretation': self._interpret_macd(macd, signal, histogram)
+                }
         except Exception as e:
             print(f"Alpha Vantage MACD 오류: {e}")
 
         return self._get_fallback_macd(symbol)
 
-    def _get_moving_averages(self, symbol: str) -> Dict:
+    async def _get_moving_averages(self, symbol: str) -> Dict:
         """이동평균선 조회"""
         ma_periods = [5, 20, 60, 120]
-        ma_data = {}
-
-        for period in ma_periods:
-            try:
-                params = {
-                    'function': 'SMA',
-                    'symbol': symbol,
-                    'interval': 'daily',
-                    'time_period': period,
-                    'series_type': 'close',
-                    'apikey': self.api_key
-                }
-
-                response = requests.get(self.base_url, params=params, timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'Technical Analysis: SMA' in data:
-                        sma_data = data['Technical Analysis: SMA']
-                        latest_date = list(sma_data.keys())[0]
-                        ma_data[f'ma{period}'] = float(sma_data[latest_date]['SMA'])
-            except Exception as e:
-                print(f"Alpha Vantage MA{period} 오류: {e}")
+        values = await asyncio.gather(*[self._get_sma(symbol, period) for period in ma_periods])
+        ma_data = {
+            f'ma{period}': value
+            for period, value in zip(ma_periods, values)
+            if value is not None
+        }
 
         if not ma_data:
             ma_data = self._get_fallback_ma(symbol)
 
         return ma_data
 
-    def _get_bollinger_bands(self, symbol: str) -> Dict:
+    async def _get_sma(self, symbol: str, period: int) -> Optional[float]:
+        """단일 기간 단순이동평균 조회"""
+        try:
+            params = {
+                'function': 'SMA',
+                'symbol': symbol,
+                'interval': 'daily',
+                'time_period': period,
+                'series_type': 'close',
+                'apikey': self.api_key
+            }
+
+            result = await self._fetch_latest(params)
+            if result:
+                _, latest = result
+                return float(latest['SMA'])
+        except Exception as e:
+            print(f"Alpha Vantage MA{period} 오류: {e}")
+
+        return None
+
+    async def _get_bollinger_bands(self, symbol: str) -> Dict:
         """볼린저 밴드 조회"""
         try:
             params = {
@@ -146,18 +255,15 @@ class AlphaVantageClient:
                 'apikey': self.api_key
             }
 
-            response = requests.get(self.base_url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if 'Technical Analysis: BBANDS' in data:
-                    bb_data = data['Technical Analysis: BBANDS']
-                    latest_date = list(bb_data.keys())[0]
-                    return {
-                        'upper': float(bb_data[latest_date]['Real Upper Band']),
-                        'middle': float(bb_data[latest_date]['Real Middle Band']),
-                        'lower': float(bb_data[latest_date]['Real Lower Band']),
-                        'date': latest_date
-                    }
+            result = await self._fetch_latest(params)
+            if result:
+                latest_date, latest = result
+                return {
+                    'upper': float(latest['Real Upper Band']),
+                    'middle': float(latest['Real Middle Band']),
+                    'lower': float(latest['Real Lower Band']),
+                    'date': latest_date
+                }
         except Exception as e:
             print(f"Alpha Vantage 볼린저밴드 오류: {e}")
 
@@ -176,16 +282,7 @@ class AlphaVantageClient:
 
     def _interpret_rsi(self, rsi: float) -> str:
         """RSI 해석"""
-        if rsi >= 70:
-            return "과매수 구간 - 단기 조정 가능성"
-        elif rsi >= 60:
-            return "강세 구간 - 상승 추세 지속"
-        elif rsi >= 40:
-            return "중립 구간"
-        elif rsi >= 30:
-            return "약세 구간 - 하락 추세"
-        else:
-            return "과매도 구간 - 단기 반등 가능성"
+        return _RSI_MESSAGES[bisect.bisect_right(_RSI_BOUNDS, rsi)]
 
     def _interpret_macd(self, macd: float, signal: float, histogram: float) -> str:
         """MACD 해석"""
@@ -242,24 +339,38 @@ class AlphaVantageClient:
                 signals['strength'] -= 1
 
         # 종합 판단
-        if signals['strength'] >= 3:
-            signals['overall'] = 'strong_buy'
-            signals['recommendation'] = '적극 매수 - 기술적 지표 매우 긍정적'
-        elif signals['strength'] >= 1:
-            signals['overall'] = 'buy'
-            signals['recommendation'] = '매수 권장 - 기술적 지표 긍정적'
-        elif signals['strength'] <= -3:
-            signals['overall'] = 'strong_sell'
-            signals['recommendation'] = '적극 매도 - 기술적 지표 매우 부정적'
-        elif signals['strength'] <= -1:
-            signals['overall'] = 'sell'
-            signals['recommendation'] = '매도 고려 - 기술적 지표 부정적'
-        else:
-            signals['overall'] = 'neutral'
-            signals['recommendation'] = '관망 권장 - 뚜렷한 방향성 없음'
+        signals['overall'], signals['recommendation'] = _SIGNAL_LEVELS[
+            bisect.bisect_right(_STRENGTH_BOUNDS, signals['strength'])
+        ]
 
         return signals
 
+    def score_watchlist(self, indicators_list: List[Dict]) -> List[Dict]:
+        """여러 종목의 종합 신호를 한 번에 계산 (관심종목 일괄 평가용, 신호 이름 목록은 생략)"""
+        # (rsi, histogram, ma5, ma20) 행렬로 변환, 없는 지표는 NaN
+        rows = np.full((len(indicators_list), 4), np.nan)
+        for i, indicators in enumerate(indicators_list):
+            if indicators.get('rsi'):
+                rows[i, 0] = indicators['rsi'].get('value', 50)
+            if indicators.get('macd'):
+                rows[i, 1] = indicators['macd'].get('histogram', 0)
+            if indicators.get('ma'):
+                rows[i, 2] = indicators['ma'].get('ma5', 0)
+                rows[i, 3] = indicators['ma'].get('ma20', 0)
+
+        strengths = _score_signals(rows)
+        levels = np.searchsorted(_STRENGTH_BOUNDS, strengths, side='right')
+
+        results = []
+        for strength, level in zip(strengths.tolist(), levels.tolist()):
+            overall, recommendation = _SIGNAL_LEVELS[level]
+            results.append({
+                'overall': overall,
+                'strength': strength,
+                'recommendation': recommendation
+            })
+        return results
+
     def _get_fallback_rsi(self, symbol: str) -> Dict:
         """폴백 RSI 데이터"""
         # 주식별 대략적인 RSI 값
@@ -272,7 +383,9 @@ class AlphaVantageClient:
             '373220.KS': 45.8   # LG에너지솔루션
         }
 
-        rsi = rsi_values.get(symbol, 50 + np.random.randn() * 10)
+        rsi = rsi_values.get(symbol)
+        if rsi is None:
+            rsi = 50 + float(_RAND_TABLE[_symbol_index(symbol) & 0xff]) * 10
         return {
             'value': rsi,
             'date': datetime.now().strftime('%Y-%m-%d'),
@@ -309,11 +422,14 @@ class AlphaVantageClient:
         }
 
         base = base_prices.get(symbol, 100)
+        # 4개 기간의 편차를 난수표에서 한 번에 조회
+        deviations = _RAND_TABLE[(_symbol_index(symbol) + _FALLBACK_MA_OFFSETS) & 0xff] * _FALLBACK_MA_SIGMAS
+        ma5, ma20, ma60, ma120 = (base * (1 + deviations)).tolist()
         return {
-            'ma5': base * (1 + np.random.randn() * 0.02),
-            'ma20': base * (1 + np.random.randn() * 0.01),
-            'ma60': base * (1 - np.random.randn() * 0.01),
-            'ma120': base * (1 - np.random.randn() * 0.02)
+            'ma5': ma5,
+            'ma20': ma20,
+            'ma60': ma60,
+            'ma120': ma120
         }
 
     def _get_fallback_bb(self, symbol: str) -> Dict:
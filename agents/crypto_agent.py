@@ -4,13 +4,45 @@ CoinGecko API를 활용한 실시간 암호화폐 가격 및 정보 수집
 """
 
 import os
+import time
 import asyncio
-from typing import Dict, List, Optional, Any
+import logging
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-import json
-from dataclasses import dataclass, asdict
-import aiohttp
+from dataclasses import dataclass
+import orjson
+from orjson import loads as json_loads
 from agents.sentiment_agent import SentimentAgent
+from agents.http_session import get_session, close_session
+from cache.api_cache import api_cache
+
+
+def json_dumps_pretty(value: Any) -> str:
+    """들여쓰기된 JSON 문자열 (테스트 출력용)"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+# CoinGecko 무료 티어 호출 제한을 고려한 호스트 단위 동시 요청 수와 429 재시도 설정
+_COINGECKO_SEMAPHORE = asyncio.Semaphore(int(os.getenv("COINGECKO_MAX_CONCURRENCY", "10")))
+_COINGECKO_MAX_RETRIES = 3
+_COINGECKO_MAX_RETRY_DELAY = 60  # seconds
+_COINGECKO_READ_CHUNK_SIZE = 64 * 1024
+
+# X-RateLimit-Remaining이 이 값 미만이면 다음 요청 전에 잠시 대기
+_COINGECKO_LOW_REMAINING = 3
+_COINGECKO_THROTTLE_DELAY = 1.0  # seconds
+_coingecko_resume_at = 0.0  # time.monotonic() 기준 다음 요청 허용 시각
+
+
+def _note_coingecko_rate_limit(headers) -> None:
+    """응답 헤더의 남은 호출 수가 적으면 다음 요청 허용 시각을 늦춤"""
+    global _coingecko_resume_at
+
+    remaining = headers.get("X-RateLimit-Remaining", "")
+    if remaining.isdigit() and int(remaining) < _COINGECKO_LOW_REMAINING:
+        _coingecko_resume_at = max(_coingecko_resume_at, time.monotonic() + _COINGECKO_THROTTLE_DELAY)
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class CryptoData:
@@ -80,29 +112,8 @@ class CryptoAgent:
             "MATIC": "polygon",
             "AVAX": "avalanche"
         }
-    
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-    
-    def normalize_crypto_name(self, crypto_name: str) -> str:
-        """암호화폐 이름/심볼을 CoinGecko ID로 변환"""
-        crypto_name = crypto_name.strip().lower()
         
-        # 한글명 매핑
-        if crypto_name in self.crypto_mapping:
-            return self.crypto_mapping[crypto_name]
-            
-        # 심볼 매핑
-        upper_name = crypto_name.upper()
-        if upper_name in self.symbol_to_id:
-            return self.symbol_to_id[upper_name]
-            
-        # 영문명 직접 매핑
+        # 영문명 -> ID 매핑
         english_names = {
             "bitcoin": "bitcoin",
             "ethereum": "ethereum", 
@@ -117,7 +128,29 @@ class CryptoAgent:
             "avalanche": "avalanche"
         }
         
-        return english_names.get(crypto_name, crypto_name)
+        # 소문자 이름/심볼 -> ID 통합 인덱스 (한글명 > 심볼 > 영문명 순으로 우선)
+        self._name_index = {
+            **english_names,
+            **{symbol.lower(): coin_id for symbol, coin_id in self.symbol_to_id.items()},
+            **self.crypto_mapping
+        }
+        
+        # 지원하는 CoinGecko ID 집합 (여기에 없는 이름은 API 호출 없이 모의 데이터로 처리)
+        self._valid_ids = frozenset(self._name_index.values())
+    
+    async def __aenter__(self):
+        # 프로세스 공유 세션 사용 (연결 재사용)
+        self.session = await get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # 공유 세션은 애플리케이션 종료 시 close_session()으로 정리
+        self.session = None
+    
+    def normalize_crypto_name(self, crypto_name: str) -> str:
+        """암호화폐 이름/심볼을 CoinGecko ID로 변환"""
+        crypto_name = crypto_name.strip().lower()
+        return self._name_index.get(crypto_name, crypto_name)
     
     async def get_crypto_data(self, crypto_name: str) -> Dict[str, Any]:
         """
@@ -131,7 +164,20 @@ class CryptoAgent:
         """
         try:
             coin_id = self.normalize_crypto_name(crypto_name)
-            print(f"[CRYPTO] Fetching data for {crypto_name} (coin_id: {coin_id})", flush=True)
+            
+            # 매핑에 없는 이름은 대부분 404로 끝나므로 요청 없이 바로 모의 데이터 반환
+            if coin_id not in self._valid_ids:
+                logger.debug("Unknown crypto %s, skipping API call", crypto_name)
+                return await self._get_mock_crypto_data(crypto_name)
+            
+            # 캐시 확인 (시세는 1분 단위로 갱신되므로 짧은 TTL로 재사용)
+            cache_key = api_cache.make_key("coingecko", "coin", coin_id)
+            cached = await api_cache.get(cache_key)
+            if cached:
+                logger.debug("Cache hit for %s (coin_id: %s)", crypto_name, coin_id)
+                return self._build_crypto_result(cached, crypto_name)
+                
+            logger.debug("Fetching data for %s (coin_id: %s)", crypto_name, coin_id)
             
             # CoinGecko API 호출
             url = f"{self.coingecko_url}/coins/{coin_id}"
@@ -143,63 +189,206 @@ class CryptoAgent:
                 "developer_data": "false"
             }
             
-            print(f"[CRYPTO] API URL: {url}", flush=True)
-            async with self.session.get(url, params=params) as response:
-                print(f"[CRYPTO] Response status: {response.status}", flush=True)
-                if response.status == 200:
-                    data = await response.json()
-                    print(f"[CRYPTO] Data received successfully", flush=True)
-                    return self._parse_crypto_data(data, crypto_name)
-                else:
-                    # API 실패 시 모의 데이터 반환
-                    text = await response.text()
-                    print(f"[CRYPTO] API failed with status {response.status}: {text[:200]}", flush=True)
-                    return await self._get_mock_crypto_data(crypto_name)
+            logger.debug("API URL: %s", url)
+            status, body = await self._coingecko_get(url, params)
+            logger.debug("Response status: %s", status)
+            if status == 200:
+                data = json_loads(body)
+                logger.debug("Data received successfully")
+                result = self._parse_crypto_data(data, crypto_name)
+                await api_cache.set(cache_key, result["crypto_data"], "coingecko")
+                return result
+            else:
+                # API 실패 시 모의 데이터 반환
+                text = body.decode(errors="replace")
+                logger.warning("API failed with status %s: %s", status, text[:200])
+                return await self._get_mock_crypto_data(crypto_name)
                     
         except Exception as e:
-            print(f"[CRYPTO] Error fetching data for {crypto_name}: {e}", flush=True)
+            logger.warning("Error fetching data for %s: %s", crypto_name, e)
             return await self._get_mock_crypto_data(crypto_name)
     
+    async def get_crypto_data_batch(self, crypto_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 암호화폐 실시간 데이터 일괄 조회 (/coins/markets 요청으로 한 번에 조회)
+        
+        Args:
+            crypto_names: 암호화폐명 또는 심볼 목록
+            
+        Returns:
+            입력한 이름별 암호화폐 데이터 딕셔너리
+        """
+        coin_ids = {crypto_name: self.normalize_crypto_name(crypto_name) for crypto_name in crypto_names}
+        
+        # 캐시에 있는 코인은 제외하고 조회
+        results = {}
+        missing_ids = []
+        for crypto_name, coin_id in coin_ids.items():
+            if coin_id not in self._valid_ids:
+                continue
+            cached = await api_cache.get(api_cache.make_key("coingecko", "coin", coin_id))
+            if cached:
+                results[crypto_name] = self._build_crypto_result(cached, crypto_name)
+            elif coin_id not in missing_ids:
+                missing_ids.append(coin_id)
+                
+        fetched = {}
+        if missing_ids:
+            try:
+                logger.debug("Fetching markets data for %s", missing_ids)
+                params = {
+                    "ids": ",".join(missing_ids),
+                    "price_change_percentage": "24h,7d,30d"
+                }
+                # USD/KRW 시세를 동시에 조회
+                usd_entries, krw_entries = await asyncio.gather(
+                    self._get_markets({**params, "vs_currency": "usd"}),
+                    self._get_markets({**params, "vs_currency": "krw"})
+                )
+                krw_by_id = {entry["id"]: entry for entry in krw_entries}
+                
+                for usd_entry in usd_entries:
+                    crypto_data = self._parse_markets_entry(usd_entry, krw_by_id.get(usd_entry["id"], {}))
+                    fetched[usd_entry["id"]] = crypto_data
+                    await api_cache.set(api_cache.make_key("coingecko", "coin", usd_entry["id"]), crypto_data, "coingecko")
+                    
+            except Exception as e:
+                logger.warning("Error fetching markets data for %s: %s", missing_ids, e)
+                
+        # 조회에 실패한 코인은 모의 데이터 사용
+        for crypto_name, coin_id in coin_ids.items():
+            if crypto_name in results:
+                continue
+            if coin_id in fetched:
+                results[crypto_name] = self._build_crypto_result(fetched[coin_id], crypto_name)
+            else:
+                results[crypto_name] = await self._get_mock_crypto_data(crypto_name)
+                
+        return results
+    
+    async def _get_markets(self, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        """CoinGecko /coins/markets 호출"""
+        status, body = await self._coingecko_get(f"{self.coingecko_url}/coins/markets", params)
+        if status != 200:
+            text = body.decode(errors="replace")
+            raise RuntimeError(f"markets API failed with status {status}: {text[:200]}")
+        return json_loads(body)
+    
+    async def _coingecko_get(self, url: str, params: Dict[str, str]) -> Tuple[int, bytearray]:
+        """CoinGecko GET 요청 (429 응답 시 Retry-After 또는 지수 백오프 후 재시도)"""
+        for attempt in range(_COINGECKO_MAX_RETRIES + 1):
+            async with _COINGECKO_SEMAPHORE:
+                # 호출 한도가 거의 소진된 경우 세마포어를 쥔 채 대기해 전체 요청 속도를 낮춤
+                wait = _coingecko_resume_at - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                async with self.session.get(url, params=params) as response:
+                    # 청크 단위로 하나의 버퍼에 이어 붙여 전체 응답 사본이 두 번 잡히지 않게 함
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(_COINGECKO_READ_CHUNK_SIZE):
+                        body += chunk
+                    _note_coingecko_rate_limit(response.headers)
+                    if response.status != 429 or attempt == _COINGECKO_MAX_RETRIES:
+                        return response.status, body
+                    retry_after = response.headers.get("Retry-After", "")
+                    
+            # 재시도 대기는 세마포어를 놓은 뒤에 수행
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+            delay = min(delay, _COINGECKO_MAX_RETRY_DELAY)
+            logger.info("Rate limited by CoinGecko, retrying in %.0fs (%d/%d)", delay, attempt + 1, _COINGECKO_MAX_RETRIES)
+            await asyncio.sleep(delay)
+    
+    def _parse_markets_entry(self, usd: Dict[str, Any], krw: Dict[str, Any]) -> Dict[str, Any]:
+        """CoinGecko /coins/markets 응답 항목 파싱 - USD와 KRW 항목을 합쳐 CryptoData 필드 구성으로 변환"""
+        crypto_data = {
+            "symbol": usd.get("symbol", "").upper(),
+            "name": usd.get("name", ""),
+            "current_price_usd": usd.get("current_price", 0),
+            "current_price_krw": krw.get("current_price", 0),
+            "market_cap_usd": usd.get("market_cap", 0),
+            "market_cap_krw": krw.get("market_cap", 0),
+            "market_cap_rank": usd.get("market_cap_rank", 0),
+            "price_change_24h_usd": usd.get("price_change_24h", 0),
+            "price_change_24h_krw": krw.get("price_change_24h", 0),
+            "price_change_percentage_24h": usd.get("price_change_percentage_24h", 0),
+            "price_change_percentage_7d": usd.get("price_change_percentage_7d_in_currency", 0),
+            "price_change_percentage_30d": usd.get("price_change_percentage_30d_in_currency", 0),
+            "circulating_supply": usd.get("circulating_supply", 0),
+            "total_supply": usd.get("total_supply", 0),
+            "max_supply": usd.get("max_supply", 0),
+            "volume_24h_usd": usd.get("total_volume", 0),
+            "volume_24h_krw": krw.get("total_volume", 0),
+            "high_24h_usd": usd.get("high_24h", 0),
+            "high_24h_krw": krw.get("high_24h", 0),
+            "low_24h_usd": usd.get("low_24h", 0),
+            "low_24h_krw": krw.get("low_24h", 0),
+            "ath_usd": usd.get("ath", 0),
+            "ath_krw": krw.get("ath", 0),
+            "ath_date": usd.get("ath_date", ""),
+            "atl_usd": usd.get("atl", 0),
+            "atl_krw": krw.get("atl", 0),
+            "atl_date": usd.get("atl_date", ""),
+            "last_updated": usd.get("last_updated") or datetime.now().isoformat()
+        }
+        
+        return crypto_data
+    
     def _parse_crypto_data(self, data: dict, original_name: str) -> Dict[str, Any]:
         """CoinGecko API 응답 파싱 - USD와 KRW 모두 파싱"""
-        market_data = data.get("market_data", {})
-        
-        crypto_info = CryptoData(
-            symbol=data.get("symbol", "").upper(),
-            name=data.get("name", original_name),
-            current_price_usd=market_data.get("current_price", {}).get("usd", 0),
-            current_price_krw=market_data.get("current_price", {}).get("krw", 0),
-            market_cap_usd=market_data.get("market_cap", {}).get("usd", 0),
-            market_cap_krw=market_data.get("market_cap", {}).get("krw", 0),
-            market_cap_rank=market_data.get("market_cap_rank", 0),
-            price_change_24h_usd=market_data.get("price_change_24h", 0),
-            price_change_24h_krw=market_data.get("price_change_24h_in_currency", {}).get("krw", 0),
-            price_change_percentage_24h=market_data.get("price_change_percentage_24h", 0),
-            price_change_percentage_7d=market_data.get("price_change_percentage_7d", 0),
-            price_change_percentage_30d=market_data.get("price_change_percentage_30d", 0),
-            circulating_supply=market_data.get("circulating_supply", 0),
-            total_supply=market_data.get("total_supply", 0),
-            max_supply=market_data.get("max_supply", 0),
-            volume_24h_usd=market_data.get("total_volume", {}).get("usd", 0),
-            volume_24h_krw=market_data.get("total_volume", {}).get("krw", 0),
-            high_24h_usd=market_data.get("high_24h", {}).get("usd", 0),
-            high_24h_krw=market_data.get("high_24h", {}).get("krw", 0),
-            low_24h_usd=market_data.get("low_24h", {}).get("usd", 0),
-            low_24h_krw=market_data.get("low_24h", {}).get("krw", 0),
-            ath_usd=market_data.get("ath", {}).get("usd", 0),
-            ath_krw=market_data.get("ath", {}).get("krw", 0),
-            ath_date=market_data.get("ath_date", {}).get("usd", ""),
-            atl_usd=market_data.get("atl", {}).get("usd", 0),
-            atl_krw=market_data.get("atl", {}).get("krw", 0),
-            atl_date=market_data.get("atl_date", {}).get("usd", ""),
-            last_updated=market_data.get("last_updated", datetime.now().isoformat())
-        )
+        market_data = data.get("market_data") or {}
+        
+        # 통화별 하위 딕셔너리는 한 번씩만 조회 (없거나 null이면 빈 딕셔너리)
+        current_price = market_data.get("current_price") or {}
+        market_cap = market_data.get("market_cap") or {}
+        price_change_24h = market_data.get("price_change_24h_in_currency") or {}
+        total_volume = market_data.get("total_volume") or {}
+        high_24h = market_data.get("high_24h") or {}
+        low_24h = market_data.get("low_24h") or {}
+        ath = market_data.get("ath") or {}
+        ath_date = market_data.get("ath_date") or {}
+        atl = market_data.get("atl") or {}
+        atl_date = market_data.get("atl_date") or {}
         
+        crypto_data = {
+            "symbol": data.get("symbol", "").upper(),
+            "name": data.get("name", original_name),
+            "current_price_usd": current_price.get("usd", 0),
+            "current_price_krw": current_price.get("krw", 0),
+            "market_cap_usd": market_cap.get("usd", 0),
+            "market_cap_krw": market_cap.get("krw", 0),
+            "market_cap_rank": market_data.get("market_cap_rank", 0),
+            "price_change_24h_usd": market_data.get("price_change_24h", 0),
+            "price_change_24h_krw": price_change_24h.get("krw", 0),
+            "price_change_percentage_24h": market_data.get("price_change_percentage_24h", 0),
+            "price_change_percentage_7d": market_data.get("price_change_percentage_7d", 0),
+            "price_change_percentage_30d": market_data.get("price_change_percentage_30d", 0),
+            "circulating_supply": market_data.get("circulating_supply", 0),
+            "total_supply": market_data.get("total_supply", 0),
+            "max_supply": market_data.get("max_supply", 0),
+            "volume_24h_usd": total_volume.get("usd", 0),
+            "volume_24h_krw": total_volume.get("krw", 0),
+            "high_24h_usd": high_24h.get("usd", 0),
+            "high_24h_krw": high_24h.get("krw", 0),
+            "low_24h_usd": low_24h.get("usd", 0),
+            "low_24h_krw": low_24h.get("krw", 0),
+            "ath_usd": ath.get("usd", 0),
+            "ath_krw": ath.get("krw", 0),
+            "ath_date": ath_date.get("usd", ""),
+            "atl_usd": atl.get("usd", 0),
+            "atl_krw": atl.get("krw", 0),
+            "atl_date": atl_date.get("usd", ""),
+            "last_updated": market_data.get("last_updated") or datetime.now().isoformat()
+        }
+        
+        return self._build_crypto_result(crypto_data, original_name)
+    
+    def _build_crypto_result(self, crypto_data: Dict[str, Any], original_name: str) -> Dict[str, Any]:
+        """CoinGecko 데이터 응답 구성 (API 응답과 캐시 공통)"""
         return {
             "status": "success",
             "crypto_name": original_name,
             "data_source": "REAL_DATA",
-            "crypto_data": asdict(crypto_info),
+            "crypto_data": crypto_data,
             "message": f"CoinGecko에서 {original_name} 데이터 수집 완료"
         }
     
@@ -225,43 +414,46 @@ class CryptoAgent:
         
         # 대략적인 USD-KRW 환율 (1400원)
         usd_to_krw = 1400
+        price_usd = base_price
+        price_krw = base_price * usd_to_krw
         
-        mock_crypto = CryptoData(
-            symbol=coin_id.upper()[:4] if coin_id else "UNKN",
-            name=crypto_name,
-            current_price_usd=base_price,
-            current_price_krw=base_price * usd_to_krw,
-            market_cap_usd=base_price * 19000000,
-            market_cap_krw=base_price * 19000000 * usd_to_krw,
-            market_cap_rank=1,
-            price_change_24h_usd=base_price * 0.02,
-            price_change_24h_krw=base_price * 0.02 * usd_to_krw,
-            price_change_percentage_24h=2.1,
-            price_change_percentage_7d=5.3,
-            price_change_percentage_30d=-1.2,
-            circulating_supply=19000000,
-            total_supply=21000000,
-            max_supply=21000000,
-            volume_24h_usd=base_price * 500000,
-            volume_24h_krw=base_price * 500000 * usd_to_krw,
-            high_24h_usd=base_price * 1.05,
-            high_24h_krw=base_price * 1.05 * usd_to_krw,
-            low_24h_usd=base_price * 0.95,
-            low_24h_krw=base_price * 0.95 * usd_to_krw,
-            ath_usd=base_price * 3,
-            ath_krw=base_price * 3 * usd_to_krw,
-            ath_date="2021-11-10T00:00:00.000Z",
-            atl_usd=base_price * 0.1,
-            atl_krw=base_price * 0.1 * usd_to_krw,
-            atl_date="2020-03-20T00:00:00.000Z",
-            last_updated=datetime.now().isoformat()
-        )
+        # CryptoData와 같은 필드 구성의 딕셔너리를 직접 생성
+        mock_crypto = {
+            "symbol": coin_id.upper()[:4] if coin_id else "UNKN",
+            "name": crypto_name,
+            "current_price_usd": price_usd,
+            "current_price_krw": price_krw,
+            "market_cap_usd": price_usd * 19000000,
+            "market_cap_krw": price_krw * 19000000,
+            "market_cap_rank": 1,
+            "price_change_24h_usd": price_usd * 0.02,
+            "price_change_24h_krw": price_krw * 0.02,
+            "price_change_percentage_24h": 2.1,
+            "price_change_percentage_7d": 5.3,
+            "price_change_percentage_30d": -1.2,
+            "circulating_supply": 19000000,
+            "total_supply": 21000000,
+            "max_supply": 21000000,
+            "volume_24h_usd": price_usd * 500000,
+            "volume_24h_krw": price_krw * 500000,
+            "high_24h_usd": price_usd * 1.05,
+            "high_24h_krw": price_krw * 1.05,
+            "low_24h_usd": price_usd * 0.95,
+            "low_24h_krw": price_krw * 0.95,
+            "ath_usd": price_usd * 3,
+            "ath_krw": price_krw * 3,
+            "ath_date": "2021-11-10T00:00:00.000Z",
+            "atl_usd": price_usd * 0.1,
+            "atl_krw": price_krw * 0.1,
+            "atl_date": "2020-03-20T00:00:00.000Z",
+            "last_updated": datetime.now().isoformat()
+        }
         
         return {
             "status": "success",
             "crypto_name": crypto_name,
             "data_source": "MOCK_DATA", 
-            "crypto_data": asdict(mock_crypto),
+            "crypto_data": mock_crypto,
             "message": f"⚠️ 모의 데이터 - CoinGecko API 연결 실패"
         }
     
@@ -283,34 +475,37 @@ class CryptoAgent:
                 "interval": "hourly" if days <= 1 else "daily"
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    prices = data.get("prices", [])
-                    
-                    # 시간별 가격 데이터 변환
-                    price_history = []
-                    for timestamp, price in prices:
-                        price_history.append({
-                            "timestamp": timestamp,
-                            "date": datetime.fromtimestamp(timestamp/1000).strftime("%Y-%m-%d %H:%M"),
-                            "price": price
-                        })
-                    
-                    return {
-                        "status": "success",
-                        "crypto_name": crypto_name,
-                        "period_days": days,
-                        "data_source": "REAL_DATA",
-                        "history": price_history[-50:],  # 최근 50개 데이터포인트
-                        "message": f"{crypto_name} {days}일 가격 히스토리"
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "message": f"가격 히스토리 조회 실패: {response.status}"
+            status, body = await self._coingecko_get(url, params)
+            if status == 200:
+                data = json_loads(body)
+                # 최근 50개 데이터포인트만 변환 (버려질 항목은 날짜 포맷팅 생략)
+                prices = data.get("prices", [])[-50:]
+                
+                # 시간별 가격 데이터 변환
+                price_history = [
+                    {
+                        "timestamp": timestamp,
+                        "date": datetime.fromtimestamp(timestamp/1000).strftime("%Y-%m-%d %H:%M"),
+                        "price": price
                     }
-                    
+                    for timestamp, price in prices
+                ]
+                
+                return {
+                    "status": "success",
+                    "crypto_name": crypto_name,
+                    "period_days": days,
+                    "data_source": "REAL_DATA",
+                    "history": price_history,
+                    "message": f"{crypto_name} {days}일 가격 히스토리"
+                }
+            else:
+                return {
+                    "status": "error",
+                    "message": f"가격 히스토리 조회 실패: {status}"
+                }
+                
+
         except Exception as e:
             return {
                 "status": "error", 
@@ -324,32 +519,21 @@ class CryptoAgent:
         Args:
             crypto_name: 암호화폐명
         """
-        print(f"[CRYPTO] Starting analyze_crypto for: {crypto_name}")
+        logger.debug("Starting analyze_crypto for: %s", crypto_name)
         
-        # 기본 데이터 조회
-        crypto_result = await self.get_crypto_data(crypto_name)
-        print(f"[CRYPTO] Got crypto_result status: {crypto_result.get('status', 'unknown')}")
+        # 기본 데이터 조회와 감성 분석(뉴스 기반)은 서로 독립적이므로 동시에 실행
+        crypto_result, sentiment_result = await asyncio.gather(
+            self.get_crypto_data(crypto_name),
+            self._analyze_crypto_sentiment(crypto_name)
+        )
+        logger.debug("Got crypto_result status: %s", crypto_result.get("status", "unknown"))
         
         if crypto_result["status"] != "success":
-            print(f"[CRYPTO] Error in get_crypto_data: {crypto_result}")
+            logger.warning("Error in get_crypto_data: %s", crypto_result)
             return crypto_result
             
         crypto_data = crypto_result["crypto_data"]
         
-        # 감성 분석 (뉴스 기반)
-        try:
-            async with SentimentAgent() as sentiment_agent:
-                sentiment_result = await sentiment_agent.analyze_sentiment(
-                    f"{crypto_name} crypto cryptocurrency", 
-                    is_korean=False
-                )
-        except Exception as e:
-            sentiment_result = {
-                "overall_sentiment": 0.0,
-                "sentiment_label": "중립적",
-                "recommendation": "관망"
-            }
-        
         # 기술적 지표 계산
         technical_signals = self._calculate_crypto_signals(crypto_data)
         
@@ -364,6 +548,21 @@ class CryptoAgent:
             "updated_at": datetime.now().isoformat()
         }
     
+    async def _analyze_crypto_sentiment(self, crypto_name: str) -> Dict[str, Any]:
+        """뉴스 기반 감성 분석 (실패 시 중립 결과 반환)"""
+        try:
+            async with SentimentAgent() as sentiment_agent:
+                return await sentiment_agent.analyze_sentiment(
+                    f"{crypto_name} crypto cryptocurrency", 
+                    is_korean=False
+                )
+        except Exception as e:
+            return {
+                "overall_sentiment": 0.0,
+                "sentiment_label": "중립적",
+                "recommendation": "관망"
+            }
+    
     def _calculate_crypto_signals(self, crypto_data: Dict[str, Any]) -> Dict[str, Any]:
         """암호화폐 기술적 신호 계산"""
         current_price = crypto_data.get("current_price_usd", 0)
@@ -440,7 +639,8 @@ async def main():
     """테스트 함수"""
     async with CryptoAgent() as agent:
         result = await agent.analyze_crypto("비트코인")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(json_dumps_pretty(result))
+    await close_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -5,13 +5,79 @@ DART Agent - 한국 공시 데이터 수집 에이전트
 
 import os
 import asyncio
-import aiohttp
+import heapq
+import logging
 import re
+from operator import itemgetter
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+import orjson
+from orjson import loads as json_loads
 from html import unescape
+import aiohttp
+from agents.http_session import get_session, close_session
+from agents.dart_corp_codes import ensure_corp_codes, lookup_corp_code
+from agents.dart_parsers import format_financial_summary, parse_disclosure_list
+from cache.api_cache import api_cache
+from utils.date_cache import today_str, days_ago_str
+
+
+def json_dumps_pretty(value: Any) -> str:
+    """들여쓰기된 JSON 문자열 (테스트 출력용)"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+logger = logging.getLogger(__name__)
+
+# DART 요청 타임아웃 (공유 세션 기본값 5분 대신 요청 단위로 적용)
+_DART_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# list.json 페이지당 최대 건수 (API 제한) - 한 응답이 이 이상 커지지 않음
+_DART_MAX_PAGE_COUNT = 100
+
+# 회사명 -> 고유번호 (임시 주요 기업 매핑)
+_COMPANY_TO_CORP_CODE = {
+    "삼성전자": "00126380",
+    "SK하이닉스": "00164779",
+    "LG에너지솔루션": "01251716",
+    "현대차": "00164742",
+    "카카오": "00256598",
+    "네이버": "00226352",
+    "포스코": "00123666"
+}
+
+# 보고서명 키워드별 요약 (우선순위 순서)
+_TITLE_SUMMARIES = {
+    "반기보고서": "\n".join([
+        "📊 2025년 상반기 재무실적 및 사업현황 공시",
+        "• 매출, 영업이익, 순이익 등 주요 재무지표 발표",
+        "• 반도체 부문 실적 회복 및 AI 수요 증가 반영",
+        "• 향후 사업 전망 및 투자 계획 공개"
+    ]),
+    "자기주식취득": "\n".join([
+        "💰 자사주 매입 프로그램 시행 결정",
+        "• 주주가치 제고 및 주가 안정화 목적",
+        "• 시장 상황에 따른 탄력적 매입 계획",
+        "• 배당정책과 연계한 주주환원 정책 강화"
+    ]),
+    "자기주식처분": "\n".join([
+        "💼 보유 자사주 시장 매각 결정",
+        "• 시장 유동성 공급 및 적정 주가 형성",
+        "• 자본 효율성 개선 및 재무구조 최적화",
+        "• 투자자 접근성 향상을 통한 거래 활성화"
+    ]),
+    "분기보고서": "\n".join([
+        "📈 분기별 재무실적 및 사업성과 공시",
+        "• 전분기 대비 매출 및 수익성 변화",
+        "• 주요 사업부문별 실적 분석"
+    ])
+}
+_TITLE_PRIORITY = {keyword: rank for rank, keyword in enumerate(_TITLE_SUMMARIES)}
+_TITLE_RE = re.compile("|".join(_TITLE_SUMMARIES))
+_GENERIC_SUMMARY = "\n".join([
+    "• 회사의 주요 경영활동 및 의사결정 사항",
+    "• 투자자 및 이해관계자에게 중요한 정보 공개"
+])
 
 
 @dataclass
@@ -33,6 +99,8 @@ class DartAgent:
         self.api_key = api_key or os.getenv("DART_API_KEY", "")
         self.base_url = "https://opendart.fss.or.kr/api"
         self.session = None
+        # DART API 호출 제한을 고려해 동시 요청 수 제한
+        self._semaphore = asyncio.Semaphore(4)
         
         # 주요 공시 유형
         self.major_disclosure_types = {
@@ -49,14 +117,13 @@ class DartAgent:
         }
         
     async def __aenter__(self):
-        """비동기 컨텍스트 매니저 진입"""
-        self.session = aiohttp.ClientSession()
+        """비동기 컨텍스트 매니저 진입 (프로세스 공유 세션 사용)"""
+        self.session = await get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
-        if self.session:
-            await self.session.close()
+        """비동기 컨텍스트 매니저 종료 (공유 세션은 close_session()에서 정리)"""
+        self.session = None
             
     async def search_disclosures(self, 
                                corp_code: Optional[str] = None,
@@ -76,23 +143,23 @@ class DartAgent:
             end_date: 종료일 (YYYYMMDD)
             pblntf_ty: 공시유형 (A~J)
             page_no: 페이지 번호
-            page_count: 페이지당 건수
+            page_count: 페이지당 건수 (DART 최대 100건)
         """
         if not self.api_key:
             return {"status": "error", "message": "DART API key not configured"}
             
         # 날짜 기본값 설정 (최근 30일)
         if not end_date:
-            end_date = datetime.now().strftime("%Y%m%d")
+            end_date = today_str()
         if not start_date:
-            start_date = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
+            start_date = days_ago_str(30)
             
         params = {
             "crtfc_key": self.api_key,
             "bgn_de": start_date,
             "end_de": end_date,
             "page_no": page_no,
-            "page_count": page_count
+            "page_count": min(page_count, _DART_MAX_PAGE_COUNT)
         }
         
         # 선택적 파라미터 추가
@@ -101,50 +168,55 @@ class DartAgent:
         if pblntf_ty:
             params["pblntf_ty"] = pblntf_ty
             
+        # 캐시 확인 (API 키를 제외한 조회 조건으로 키 생성)
+        cache_key = api_cache.make_key(
+            "dart", "list",
+            *(f"{key}={value}" for key, value in sorted(params.items()) if key != "crtfc_key")
+        )
+        cached = await api_cache.get(cache_key)
+        if cached:
+            logger.debug("Cache hit: %s", cache_key)
+            return cached
+            
         try:
-            print(f"[DART API] Requesting: {self.base_url}/list.json with params: {params}")
-            async with self.session.get(
+            logger.debug("Requesting list.json: %s", cache_key)
+            async with self._semaphore, self.session.get(
                 f"{self.base_url}/list.json",
-                params=params
+                params=params,
+                timeout=_DART_TIMEOUT
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    print(f"[DART API] Response status: {data.get('status')}, message: {data.get('message', 'No message')}")
-                    print(f"[DART API] Total count: {data.get('total_count', 0)}")
+                    data = json_loads(await response.read())
+                    logger.debug("Response status: %s, message: %s", data.get("status"), data.get("message", "No message"))
+                    logger.debug("Total count: %s", data.get("total_count", 0))
                     
                     if data.get("status") == "000":
                         # 성공
-                        disclosures = []
                         list_data = data.get("list", [])
-                        print(f"[DART API] Found {len(list_data)} items in list")
+                        logger.debug("Found %d items in list", len(list_data))
                         
-                        for item in list_data:
-                            disclosure = DartDisclosure(
-                                rcept_no=item.get("rcept_no", ""),
-                                corp_code=item.get("corp_code", ""),
-                                corp_name=item.get("corp_name", ""),
-                                report_nm=item.get("report_nm", ""),
-                                rcept_dt=item.get("rcept_dt", ""),
-                                rm=item.get("rm", ""),
-                                stock_code=item.get("stock_code", "")
-                            )
-                            disclosures.append(asdict(disclosure))
+                        # DartDisclosure 필드 구성의 딕셔너리를 직접 생성
+                        disclosures = parse_disclosure_list(list_data)
                             
-                        return {
+                        result = {
                             "status": "success",
                             "data_source": "REAL_DATA",
                             "total_count": data.get("total_count", 0),
                             "total_page": data.get("total_page", 0),
                             "disclosures": disclosures
                         }
+                        # 종료일이 지난 기간의 목록은 더 바뀌지 않으므로 더 오래 캐싱
+                        namespace = "dart_archive" if end_date < today_str() else "dart"
+                        await api_cache.set(cache_key, result, namespace)
+                        return result
                     else:
-                        print(f"[DART API] API Error: {data.get('message', 'Unknown error')}")
+                        logger.warning("API error: %s", data.get("message", "Unknown error"))
                         return {
                             "status": "error",
                             "message": data.get("message", "Unknown error")
                         }
                 else:
-                    print(f"[DART API] HTTP Error: {response.status}")
+                    logger.warning("HTTP error: %s", response.status)
                     return {
                         "status": "error",
                         "message": f"HTTP error: {response.status}"
@@ -205,7 +277,7 @@ class DartAgent:
             # rcept_no에서 회사 정보 추출
             corp_info = self._extract_corp_info_from_rcept_no(rcept_no)
             if not corp_info:
-                print(f"[DART] Could not extract corp info from {rcept_no}")
+                logger.debug("Could not extract corp info from %s", rcept_no)
                 return None
                 
             corp_code, bsns_year, reprt_code = corp_info
@@ -218,20 +290,21 @@ class DartAgent:
                 "reprt_code": reprt_code
             }
             
-            print(f"[DART] Financial API params: {params}")
+            logger.debug("Financial API request: corp_code=%s, bsns_year=%s, reprt_code=%s", corp_code, bsns_year, reprt_code)
             
             async with self.session.get(
                 f"{self.base_url}/fnlttSinglAcnt.json",
-                params=params
+                params=params,
+                timeout=_DART_TIMEOUT
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    print(f"[DART] Financial API status: {data.get('status')}, message: {data.get('message')}")
+                    data = json_loads(await response.read())
+                    logger.debug("Financial API status: %s, message: %s", data.get("status"), data.get("message"))
                     if data.get("status") == "000" and data.get("list"):
                         return self._parse_financial_data(data.get("list", []))
                         
         except Exception as e:
-            print(f"[DART] Financial data fetch failed: {str(e)}")
+            logger.warning("Financial data fetch failed: %s", e)
             
         return None
     
@@ -251,88 +324,22 @@ class DartAgent:
     def _parse_financial_data(self, financial_list: List[Dict]) -> str:
         """재무 데이터 파싱"""
         try:
-            results = []
-            found_metrics = set()
-            
-            # 주요 재무 지표 추출 (중복 제거)
-            key_metrics = {
-                "매출액": ["매출액"],
-                "영업이익": ["영업이익"],  
-                "당기순이익": ["당기순이익"],
-                "자산총계": ["자산총계"], 
-                "부채총계": ["부채총계"]
-            }
-            
-            # 정확한 매치를 위해 순서대로 처리
-            for metric, keywords in key_metrics.items():
-                if metric in found_metrics:
-                    continue
-                    
-                for item in financial_list:
-                    account_nm = item.get("account_nm", "").strip()
-                    thstrm_amount = item.get("thstrm_amount", "0").strip()
-                    
-                    # 정확한 매칭
-                    if account_nm in keywords:
-                        try:
-                            # 금액 파싱 (천원 단위를 조원, 억원으로 변환)
-                            amount = int(thstrm_amount.replace(",", ""))
-                            
-                            if amount >= 1000000000000:  # 1조 이상
-                                trillion = amount / 1000000000000
-                                results.append(f"• **{metric}**: {trillion:.1f}조원")
-                            else:  # 억원 단위
-                                billion = amount / 100000000
-                                results.append(f"• **{metric}**: {billion:,.0f}억원")
-                                
-                            found_metrics.add(metric)
-                            break
-                        except ValueError:
-                            results.append(f"• **{metric}**: {thstrm_amount}")
-                            found_metrics.add(metric)
-                            break
-            
-            return "\\n".join(results) if results else None
+            return format_financial_summary(financial_list)
             
         except Exception as e:
-            print(f"[DART] Financial parsing error: {str(e)}")
+            logger.warning("Financial parsing error: %s", e)
             return None
     
     def _generate_summary_from_title(self, report_nm: str, rcept_no: str) -> str:
         """보고서명을 기반으로 내용 요약 생성"""
         try:
-            summary_parts = []
-            
-            if "반기보고서" in report_nm:
-                summary_parts.append("📊 2025년 상반기 재무실적 및 사업현황 공시")
-                summary_parts.append("• 매출, 영업이익, 순이익 등 주요 재무지표 발표")
-                summary_parts.append("• 반도체 부문 실적 회복 및 AI 수요 증가 반영")
-                summary_parts.append("• 향후 사업 전망 및 투자 계획 공개")
+            # 여러 키워드가 함께 있으면 _TITLE_SUMMARIES 순서가 앞선 것을 사용
+            matches = _TITLE_RE.findall(report_nm)
+            if matches:
+                return _TITLE_SUMMARIES[min(matches, key=_TITLE_PRIORITY.__getitem__)]
                 
-            elif "자기주식취득" in report_nm:
-                summary_parts.append("💰 자사주 매입 프로그램 시행 결정")
-                summary_parts.append("• 주주가치 제고 및 주가 안정화 목적")  
-                summary_parts.append("• 시장 상황에 따른 탄력적 매입 계획")
-                summary_parts.append("• 배당정책과 연계한 주주환원 정책 강화")
-                
-            elif "자기주식처분" in report_nm:
-                summary_parts.append("💼 보유 자사주 시장 매각 결정")
-                summary_parts.append("• 시장 유동성 공급 및 적정 주가 형성")
-                summary_parts.append("• 자본 효율성 개선 및 재무구조 최적화")
-                summary_parts.append("• 투자자 접근성 향상을 통한 거래 활성화")
-                
-            elif "분기보고서" in report_nm:
-                summary_parts.append("📈 분기별 재무실적 및 사업성과 공시")
-                summary_parts.append("• 전분기 대비 매출 및 수익성 변화")
-                summary_parts.append("• 주요 사업부문별 실적 분석")
-                
-            else:
-                # 일반적인 공시의 경우
-                summary_parts.append(f"📋 {report_nm}")
-                summary_parts.append("• 회사의 주요 경영활동 및 의사결정 사항")
-                summary_parts.append("• 투자자 및 이해관계자에게 중요한 정보 공개")
-            
-            return "\n".join(summary_parts) if summary_parts else "공시 내용 요약 생성 실패"
+            # 일반적인 공시의 경우
+            return f"📋 {report_nm}\n{_GENERIC_SUMMARY}"
             
         except Exception as e:
             return f"요약 생성 오류: {str(e)}"
@@ -348,18 +355,8 @@ class DartAgent:
         # 회사명으로 corp_code 검색하는 기능이 필요
         # 실제로는 DART에서 제공하는 고유번호 API를 사용해야 함
         
-        # 임시로 주요 기업 매핑
-        company_mapping = {
-            "삼성전자": "00126380",
-            "SK하이닉스": "00164779",
-            "LG에너지솔루션": "01251716",
-            "현대차": "00164742",
-            "카카오": "00256598",
-            "네이버": "00226352",
-            "포스코": "00123666"
-        }
-        
-        corp_code = company_mapping.get(company_name)
+        # 임시로 주요 기업 매핑 사용
+        corp_code = _COMPANY_TO_CORP_CODE.get(company_name)
         if not corp_code:
             return {
                 "status": "error",
@@ -370,72 +367,61 @@ class DartAgent:
         
     async def get_major_disclosures(self, 
                                   stock_code: str,
-                                  days: int = 30) -> Dict[str, Any]:
+                                  days: int = 30,
+                                  limit: Optional[int] = None) -> Dict[str, Any]:
         """
         특정 종목의 주요 공시만 가져오기
         
         Args:
             stock_code: 종목코드
             days: 조회 기간 (일)
+            limit: 최신순 최대 건수 (None이면 전체)
         """
-        # 종목코드로 회사 고유번호 찾기
-        corp_code = None
-        if stock_code == "005930":
-            corp_code = "00126380"  # 삼성전자
-        elif stock_code == "000660":
-            corp_code = "00164779"  # SK하이닉스
-        elif stock_code == "035420":
-            corp_code = "00266961"  # 네이버
-        elif stock_code == "035720":
-            corp_code = "00258801"  # 카카오
-        elif stock_code == "354200":
-            corp_code = "00139670"  # 더본코리아 (임시 - 실제 확인 필요)
-        elif stock_code == "001040":
-            corp_code = "00138856"  # CJ (임시 - 실제 확인 필요)
-        elif stock_code == "004990":
-            corp_code = "00142004"  # 롯데홀딩스 (임시 - 실제 확인 필요)
-        elif stock_code == "004170":
-            corp_code = "00161292"  # 신세계 (임시 - 실제 확인 필요)  
-        elif stock_code == "069960":
-            corp_code = "00145526"  # 현대백화점 (임시 - 실제 확인 필요)
-        elif stock_code == "139480":
-            corp_code = "00148874"  # 이마트 (임시 - 실제 확인 필요)
+        # 종목코드로 회사 고유번호 찾기 (전체 상장사 매핑은 백그라운드 로드, 완료 전에는 내장 매핑)
+        ensure_corp_codes(self.api_key)
+        corp_code = lookup_corp_code(stock_code)
         
-        print(f"[DART get_major_disclosures] stock_code: {stock_code}, corp_code: {corp_code}")
-        print(f"[DART get_major_disclosures] API key exists: {bool(self.api_key)}")
+        logger.debug("get_major_disclosures stock_code: %s, corp_code: %s", stock_code, corp_code)
+        logger.debug("API key exists: %s", bool(self.api_key))
         
         if not corp_code:
             # 종목코드로 직접 검색 시도
-            print(f"[DART get_major_disclosures] No corp_code found for {stock_code}")
+            logger.debug("No corp_code found for %s", stock_code)
             return await self._search_by_stock_code(stock_code, days)
             
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+        end_date = today_str()
+        start_date = days_ago_str(days)
         
         # 주요사항보고(B)와 정기공시(A)만 조회
         major_types = ["A", "B"]
         all_disclosures = []
         
-        for pblntf_ty in major_types:
-            print(f"[DART] Searching for type {pblntf_ty}, corp_code: {corp_code}, period: {start_date}-{end_date}")
-            result = await self.search_disclosures(
+        # 유형별 조회는 서로 독립적이므로 동시에 요청
+        logger.debug("Searching for types %s, corp_code: %s, period: %s-%s", major_types, corp_code, start_date, end_date)
+        results = await asyncio.gather(*[
+            self.search_disclosures(
                 corp_code=corp_code,
                 start_date=start_date,
                 end_date=end_date,
                 pblntf_ty=pblntf_ty
             )
-            
-            print(f"[DART] Search result for type {pblntf_ty}: {result}")
-            
-            if result["status"] == "success":
+            for pblntf_ty in major_types
+        ], return_exceptions=True)
+        
+        for pblntf_ty, result in zip(major_types, results):
+            if isinstance(result, dict) and result["status"] == "success":
                 disclosures = result.get("disclosures", [])
-                print(f"[DART DEBUG] Type {pblntf_ty}: {len(disclosures)} disclosures found")
+                logger.debug("Type %s: %d disclosures found", pblntf_ty, len(disclosures))
                 all_disclosures.extend(disclosures)
             else:
-                print(f"[DART ERROR] Failed to get disclosures for type {pblntf_ty}: {result.get('message')}")
+                message = result.get('message') if isinstance(result, dict) else result
+                logger.warning("Failed to get disclosures for type %s: %s", pblntf_ty, message)
                 
-        # 날짜순 정렬
-        all_disclosures.sort(key=lambda x: x["rcept_dt"], reverse=True)
+        # 날짜순 정렬 (건수 제한이 있으면 상위 N건만 선택)
+        if limit is not None:
+            all_disclosures = heapq.nlargest(limit, all_disclosures, key=itemgetter("rcept_dt"))
+        else:
+            all_disclosures.sort(key=itemgetter("rcept_dt"), reverse=True)
         
         return {
             "status": "success",
@@ -491,7 +477,7 @@ async def test_dart_agent():
                 }
             ]
         }
-        print(json.dumps(mock_data, indent=2, ensure_ascii=False))
+        print(json_dumps_pretty(mock_data))
         return
         
     async with DartAgent(api_key) as agent:
@@ -512,6 +498,8 @@ async def test_dart_agent():
         else:
             print(f"오류: {result.get('message')}")
             
+    await close_session()
+
 
 if __name__ == "__main__":
     asyncio.run(test_dart_agent())
\ No newline at end of file
@@ -4,11 +4,92 @@ DART API Client for Korean Financial Data
 """
 
 import os
-import requests
-import json
-from typing import Dict, List, Optional
-from datetime import datetime
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
 import xml.etree.ElementTree as ET
+import aiohttp
+from agents.http_session import get_session
+from agents.dart_corp_codes import ensure_corp_codes, lookup_corp_code
+from agents.dart_parsers import (
+    parse_company_info, parse_disclosure_links, parse_financial_metrics, parse_shareholders
+)
+from cache.api_cache import api_cache
+from utils.date_cache import today_str
+from orjson import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+# 분기 → 보고서 코드
+_REPORT_CODES = {
+    1: '11013',  # 1분기보고서
+    2: '11012',  # 반기보고서
+    3: '11014',  # 3분기보고서
+    4: '11011'   # 사업보고서
+}
+
+# API 키가 없거나 호출 실패 시 사용하는 폴백 데이터
+_FALLBACK_COMPANY = {
+    '005930': {
+        'company_name': '삼성전자',
+        'ceo': '한종희',
+        'industry': '전자부품 제조업',
+        'establishment_date': '1969-01-13'
+    },
+    '000660': {
+        'company_name': 'SK하이닉스',
+        'ceo': '곽노정',
+        'industry': '반도체 제조업',
+        'establishment_date': '1983-02-01'
+    }
+}
+
+_FALLBACK_FINANCIAL = {
+    '005930': {
+        'revenue': 67570000000000,
+        'operating_profit': 6540000000000,
+        'net_income': 5240000000000,
+        'eps': 5900,
+        'roe': 8.2,
+        'roa': 3.4,
+        'debt_ratio': 42.3
+    },
+    '000660': {
+        'revenue': 12740000000000,
+        'operating_profit': 2980000000000,
+        'net_income': 2100000000000,
+        'eps': 3800,
+        'roe': 12.5,
+        'roa': 5.8,
+        'debt_ratio': 38.7
+    }
+}
+
+_FALLBACK_SHAREHOLDERS = {
+    '005930': (
+        {'name': '이재용', 'shares': 249273790, 'ratio': 8.37},
+        {'name': '국민연금공단', 'shares': 531749068, 'ratio': 8.91},
+        {'name': '블랙록', 'shares': 312456789, 'ratio': 5.23}
+    ),
+    '000660': (
+        {'name': 'SK텔레콤', 'shares': 146100000, 'ratio': 20.07},
+        {'name': '국민연금공단', 'shares': 74285715, 'ratio': 10.20}
+    )
+}
+
+# (보고서명, 제출인) - 접수일자는 조회 시점 날짜로 채움
+_FALLBACK_DISCLOSURES = {
+    '005930': (
+        ('분기보고서 (2024.09)', '삼성전자'),
+        ('주요사항보고서(자기주식취득결정)', '삼성전자'),
+        ('최대주주등소유주식변동신고서', '이재용')
+    ),
+    '000660': (
+        ('분기보고서 (2024.09)', 'SK하이닉스'),
+        ('주요경영사항신고', 'SK하이닉스')
+    )
+}
+
 
 class DARTApiClient:
     """DART Open API 클라이언트"""
@@ -17,6 +98,7 @@ class DARTApiClient:
         self.api_key = os.getenv('DART_API_KEY', '')
         self.base_url = 'https://opendart.fss.or.kr/api'
         self.is_valid = self._validate_api_key()
+        self.timeout = aiohttp.ClientTimeout(total=5)
 
     def _validate_api_key(self) -> bool:
         """API 키 유효성 검사"""
@@ -24,271 +106,145 @@ class DARTApiClient:
             return False
         return True
 
-    def get_company_info(self, stock_code: str) -> Dict:
+    async def get_company_info(self, stock_code: str) -> Dict:
         """기업 개황 조회"""
         if not self.is_valid:
             return self._get_fallback_data(stock_code)
 
         try:
-            url = f"{self.base_url}/company.json"
-            params = {
-                'crtfc_key': self.api_key,
-                'corp_code': self._get_corp_code(stock_code)
-            }
-
-            response = requests.get(url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == '000':  # 정상
-                    return self._parse_company_info(data)
+            result = await self._fetch_cached('dart', ('company', stock_code), 'company.json', {
+                'corp_code': await self._get_corp_code(stock_code)
+            }, parse_company_info)
+            if result is not None:
+                return result
         except Exception as e:
-            print(f"DART API 오류: {e}")
+            logger.warning("DART API 오류: %s", e)
 
         return self._get_fallback_data(stock_code)
 
-    def get_financial_statements(self, stock_code: str, year: int = 2024, quarter: int = 3) -> Dict:
+    async def get_financial_statements(self, stock_code: str, year: int = 2024, quarter: int = 3) -> Dict:
         """재무제표 조회"""
         if not self.is_valid:
             return self._get_fallback_financial_data(stock_code)
 
         try:
-            url = f"{self.base_url}/fnlttSinglAcntAll.json"
-            params = {
-                'crtfc_key': self.api_key,
-                'corp_code': self._get_corp_code(stock_code),
+            result = await self._fetch_cached('dart', ('financials', stock_code, year, quarter), 'fnlttSinglAcntAll.json', {
+                'corp_code': await self._get_corp_code(stock_code),
                 'bsns_year': str(year),
                 'reprt_code': self._get_report_code(quarter),
                 'fs_div': 'CFS'  # 연결재무제표
-            }
-
-            response = requests.get(url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == '000':
-                    return self._parse_financial_data(data.get('list', []))
+            }, lambda data: parse_financial_metrics(data.get('list', [])))
+            if result is not None:
+                return result
         except Exception as e:
-            print(f"DART 재무제표 조회 오류: {e}")
+            logger.warning("DART 재무제표 조회 오류: %s", e)
 
         return self._get_fallback_financial_data(stock_code)
 
-    def get_major_shareholders(self, stock_code: str) -> List[Dict]:
+    async def get_major_shareholders(self, stock_code: str) -> List[Dict]:
         """대주주 현황 조회"""
         if not self.is_valid:
             return self._get_fallback_shareholders(stock_code)
 
         try:
-            url = f"{self.base_url}/majorstock.json"
-            params = {
-                'crtfc_key': self.api_key,
-                'corp_code': self._get_corp_code(stock_code)
-            }
-
-            response = requests.get(url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == '000':
-                    return self._parse_shareholders(data.get('list', []))
+            result = await self._fetch_cached('dart', ('shareholders', stock_code), 'majorstock.json', {
+                'corp_code': await self._get_corp_code(stock_code)
+            }, lambda data: parse_shareholders(data.get('list', [])))
+            if result is not None:
+                return result
         except Exception as e:
-            print(f"DART 대주주 조회 오류: {e}")
+            logger.warning("DART 대주주 조회 오류: %s", e)
 
         return self._get_fallback_shareholders(stock_code)
 
-    def get_recent_disclosures(self, stock_code: str, count: int = 10) -> List[Dict]:
+    async def get_recent_disclosures(self, stock_code: str, count: int = 10) -> List[Dict]:
         """최근 공시 조회"""
         if not self.is_valid:
             return self._get_fallback_disclosures(stock_code)
 
         try:
-            url = f"{self.base_url}/list.json"
-            params = {
-                'crtfc_key': self.api_key,
-                'corp_code': self._get_corp_code(stock_code),
+            result = await self._fetch_cached('dart_recent', ('recent', stock_code, count), 'list.json', {
+                'corp_code': await self._get_corp_code(stock_code),
                 'page_count': str(count),
                 'page_no': '1'
-            }
-
-            response = requests.get(url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == '000':
-                    return self._parse_disclosures(data.get('list', []))
+            }, lambda data: parse_disclosure_links(data.get('list', [])))
+            if result is not None:
+                return result
         except Exception as e:
-            print(f"DART 공시 조회 오류: {e}")
+            logger.warning("DART 공시 조회 오류: %s", e)
 
         return self._get_fallback_disclosures(stock_code)
 
-    def _get_corp_code(self, stock_code: str) -> str:
-        """종목코드 → DART 기업코드 변환"""
-        # 실제로는 DART에서 제공하는 기업코드 매핑 파일을 사용해야 함
-        corp_codes = {
-            '005930': '00126380',  # 삼성전자
-            '000660': '00164742',  # SK하이닉스
-            '373220': '01512702',  # LG에너지솔루션
-            '207940': '00976610',  # 삼성바이오로직스
-            '005380': '00126186',  # 현대차
-            '006400': '00126308',  # 삼성SDI
-            '051910': '00190321'   # LG화학
+    async def get_full_profile(self, stock_code: str) -> Dict:
+        """기업 개황, 재무제표, 대주주, 최근 공시 일괄 조회 (네 요청을 동시에 실행)"""
+        company_info, financials, shareholders, disclosures = await asyncio.gather(
+            self.get_company_info(stock_code),
+            self.get_financial_statements(stock_code),
+            self.get_major_shareholders(stock_code),
+            self.get_recent_disclosures(stock_code)
+        )
+        return {
+            'company_info': company_info,
+            'financials': financials,
+            'shareholders': shareholders,
+            'disclosures': disclosures
         }
-        return corp_codes.get(stock_code, '')
 
-    def _get_report_code(self, quarter: int) -> str:
-        """분기 → 보고서 코드 변환"""
-        report_codes = {
-            1: '11013',  # 1분기보고서
-            2: '11012',  # 반기보고서
-            3: '11014',  # 3분기보고서
-            4: '11011'   # 사업보고서
-        }
-        return report_codes.get(quarter, '11014')
-
-    def _parse_financial_data(self, data: List[Dict]) -> Dict:
-        """재무데이터 파싱"""
-        result = {
-            'revenue': 0,
-            'operating_profit': 0,
-            'net_income': 0,
-            'total_assets': 0,
-            'total_equity': 0,
-            'total_debt': 0,
-            'eps': 0,
-            'roe': 0,
-            'roa': 0,
-            'debt_ratio': 0
-        }
+    async def _fetch_cached(self, namespace: str, key_parts: tuple, endpoint: str,
+                            params: Dict, parse: Callable[[Dict], Any]) -> Optional[Any]:
+        """캐시 확인 후 DART API 호출 - 정상 응답은 파싱 결과를 네임스페이스 TTL로 캐싱"""
+        cache_key = api_cache.make_key(namespace, *key_parts)
+        cached = await api_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        for item in data:
-            account = item.get('account_nm', '')
-            amount = float(item.get('thstrm_amount', '0').replace(',', ''))
-
-            if '매출액' in account or '수익' in account:
-                result['revenue'] = amount
-            elif '영업이익' in account:
-                result['operating_profit'] = amount
-            elif '당기순이익' in account:
-                result['net_income'] = amount
-            elif '자산총계' in account:
-                result['total_assets'] = amount
-            elif '자본총계' in account:
-                result['total_equity'] = amount
-            elif '부채총계' in account:
-                result['total_debt'] = amount
-
-        # 재무비율 계산
-        if result['total_equity'] > 0:
-            result['roe'] = (result['net_income'] / result['total_equity']) * 100
-        if result['total_assets'] > 0:
-            result['roa'] = (result['net_income'] / result['total_assets']) * 100
-        if result['total_equity'] > 0:
-            result['debt_ratio'] = (result['total_debt'] / result['total_equity']) * 100
+        data = await self._fetch(endpoint, params)
+        if data is None:
+            return None
 
+        result = parse(data)
+        await api_cache.set(cache_key, result, namespace)
         return result
 
-    def _parse_disclosures(self, data: List[Dict]) -> List[Dict]:
-        """공시 데이터 파싱"""
-        disclosures = []
-        for item in data:
-            disclosures.append({
-                'date': item.get('rcept_dt', ''),
-                'title': item.get('report_nm', ''),
-                'submitter': item.get('flr_nm', ''),
-                'url': f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={item.get('rcept_no', '')}"
-            })
-        return disclosures
-
-    def _parse_shareholders(self, data: List[Dict]) -> List[Dict]:
-        """대주주 데이터 파싱"""
-        shareholders = []
-        for item in data:
-            shareholders.append({
-                'name': item.get('nm', ''),
-                'shares': int(item.get('bsis_posesn_stock_co', '0').replace(',', '')),
-                'ratio': float(item.get('bsis_posesn_stock_qota', '0'))
-            })
-        return shareholders
-
-    def _parse_company_info(self, data: Dict) -> Dict:
-        """기업정보 파싱"""
-        return {
-            'company_name': data.get('corp_name', ''),
-            'ceo': data.get('ceo_nm', ''),
-            'establishment_date': data.get('est_dt', ''),
-            'listing_date': data.get('list_dt', ''),
-            'industry': data.get('induty_code', ''),
-            'address': data.get('adres', ''),
-            'homepage': data.get('hm_url', ''),
-            'phone': data.get('phn_no', ''),
-            'fiscal_month': data.get('acc_mt', '')
-        }
+    async def _fetch(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """DART API 호출 (공유 세션 사용) - 정상 응답(status '000')이면 JSON, 아니면 None 반환"""
+        session = await get_session()
+        async with session.get(
+            f"{self.base_url}/{endpoint}",
+            params={'crtfc_key': self.api_key, **params},
+            timeout=self.timeout
+        ) as response:
+            if response.status != 200:
+                return None
+            data = json_loads(await response.read())
+
+        return data if data.get('status') == '000' else None
+
+    async def _get_corp_code(self, stock_code: str) -> str:
+        """종목코드 → DART 기업코드 변환 (전체 상장사 매핑은 백그라운드 로드, 완료 전에는 내장 매핑)"""
+        ensure_corp_codes(self.api_key)
+        return lookup_corp_code(stock_code) or ''
+
+    def _get_report_code(self, quarter: int) -> str:
+        """분기 → 보고서 코드 변환"""
+        return _REPORT_CODES.get(quarter, '11014')
 
     def _get_fallback_data(self, stock_code: str) -> Dict:
         """폴백 기업 데이터"""
-        fallback_data = {
-            '005930': {
-                'company_name': '삼성전자',
-                'ceo': '한종희',
-                'industry': '전자부품 제조업',
-                'establishment_date': '1969-01-13'
-            },
-            '000660': {
-                'company_name': 'SK하이닉스',
-                'ceo': '곽노정',
-                'industry': '반도체 제조업',
-                'establishment_date': '1983-02-01'
-            }
-        }
-        return fallback_data.get(stock_code, {})
+        return dict(_FALLBACK_COMPANY.get(stock_code, {}))
 
     def _get_fallback_financial_data(self, stock_code: str) -> Dict:
         """폴백 재무 데이터"""
-        fallback_data = {
-            '005930': {
-                'revenue': 67570000000000,
-                'operating_profit': 6540000000000,
-                'net_income': 5240000000000,
-                'eps': 5900,
-                'roe': 8.2,
-                'roa': 3.4,
-                'debt_ratio': 42.3
-            },
-            '000660': {
-                'revenue': 12740000000000,
-                'operating_profit': 2980000000000,
-                'net_income': 2100000000000,
-                'eps': 3800,
-                'roe': 12.5,
-                'roa': 5.8,
-                'debt_ratio': 38.7
-            }
-        }
-        return fallback_data.get(stock_code, {})
+        return dict(_FALLBACK_FINANCIAL.get(stock_code, {}))
 
     def _get_fallback_shareholders(self, stock_code: str) -> List[Dict]:
         """폴백 대주주 데이터"""
-        fallback_data = {
-            '005930': [
-                {'name': '이재용', 'shares': 249273790, 'ratio': 8.37},
-                {'name': '국민연금공단', 'shares': 531749068, 'ratio': 8.91},
-                {'name': '블랙록', 'shares': 312456789, 'ratio': 5.23}
-            ],
-            '000660': [
-                {'name': 'SK텔레콤', 'shares': 146100000, 'ratio': 20.07},
-                {'name': '국민연금공단', 'shares': 74285715, 'ratio': 10.20}
-            ]
-        }
-        return fallback_data.get(stock_code, [])
+        return [dict(holder) for holder in _FALLBACK_SHAREHOLDERS.get(stock_code, ())]
 
     def _get_fallback_disclosures(self, stock_code: str) -> List[Dict]:
         """폴백 공시 데이터"""
-        today = datetime.now().strftime('%Y%m%d')
-        fallback_data = {
-            '005930': [
-                {'date': today, 'title': '분기보고서 (2024.09)', 'submitter': '삼성전자'},
-                {'date': today, 'title': '주요사항보고서(자기주식취득결정)', 'submitter': '삼성전자'},
-                {'date': today, 'title': '최대주주등소유주식변동신고서', 'submitter': '이재용'}
-            ],
-            '000660': [
-                {'date': today, 'title': '분기보고서 (2024.09)', 'submitter': 'SK하이닉스'},
-                {'date': today, 'title': '주요경영사항신고', 'submitter': 'SK하이닉스'}
-            ]
-        }
-        return fallback_data.get(stock_code, [])
\ No newline at end of file
+        today = today_str()
+        return [
+            {'date': today, 'title': title, 'submitter': submitter}
+            for title, submitter in _FALLBACK_DISCLOSURES.get(stock_code, ())
+        ]
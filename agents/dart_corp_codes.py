@@ -0,0 +1,127 @@
+"""
+DART 고유번호 매핑
+종목코드 → DART 기업 고유번호 (DartAgent, DARTApiClient 공용)
+"""
+
+import asyncio
+import io
+import logging
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Dict, Optional
+import aiohttp
+from agents.http_session import get_session
+from cache.api_cache import api_cache
+
+logger = logging.getLogger(__name__)
+
+# corpCode.xml 조회 실패 시(또는 API 키가 없을 때) 사용하는 주요 기업 매핑
+STOCK_TO_CORP_CODE = {
+    "005930": "00126380",  # 삼성전자
+    "000660": "00164779",  # SK하이닉스
+    "035420": "00266961",  # 네이버
+    "035720": "00258801",  # 카카오
+    "373220": "01512702",  # LG에너지솔루션
+    "207940": "00976610",  # 삼성바이오로직스
+    "005380": "00126186",  # 현대차
+    "006400": "00126308",  # 삼성SDI
+    "051910": "00190321",  # LG화학
+    "354200": "00139670",  # 더본코리아 (임시 - 실제 확인 필요)
+    "001040": "00138856",  # CJ (임시 - 실제 확인 필요)
+    "004990": "00142004",  # 롯데홀딩스 (임시 - 실제 확인 필요)
+    "004170": "00161292",  # 신세계 (임시 - 실제 확인 필요)
+    "069960": "00145526",  # 현대백화점 (임시 - 실제 확인 필요)
+    "139480": "00148874"   # 이마트 (임시 - 실제 확인 필요)
+}
+
+_CORP_CODE_URL = "https://opendart.fss.or.kr/api/corpCode.xml"
+_CORP_CODE_TIMEOUT = aiohttp.ClientTimeout(total=60)
+_CORP_CODE_TTL = 86400  # seconds, 신규 상장사 반영을 위한 재로드 주기 (api_cache dart_corp_codes TTL과 동일)
+_CORP_CODE_RETRY_INTERVAL = 600  # seconds, 실패 후 재시도 간격
+
+# 전체 상장사 매핑 (corpCode.xml에서 백그라운드로 로드, 로드 전에는 내장 매핑 사용)
+_corp_codes: Optional[Dict[str, str]] = None
+_loaded_at = float("-inf")
+_last_failure = float("-inf")
+_load_task: Optional[asyncio.Task] = None
+
+
+def _parse_corp_code_zip(payload: bytes) -> Dict[str, str]:
+    """corpCode.xml 압축 파일에서 종목코드가 있는(상장) 기업만 추출"""
+    corp_codes = {}
+    with zipfile.ZipFile(io.BytesIO(payload)) as archive:
+        with archive.open(archive.namelist()[0]) as xml_file:
+            # 전체 트리를 만들지 않고 <list> 단위로 읽고 바로 해제
+            for _, elem in ET.iterparse(xml_file):
+                if elem.tag != "list":
+                    continue
+                stock_code = (elem.findtext("stock_code") or "").strip()
+                if stock_code:
+                    corp_codes[stock_code] = elem.findtext("corp_code", "").strip()
+                elem.clear()
+    return corp_codes
+
+
+async def _download_corp_codes(api_key: str) -> Dict[str, str]:
+    """corpCode.xml 다운로드 후 파싱 (압축 해제/파싱은 스레드에서 실행)"""
+    session = await get_session()
+    async with session.get(
+        _CORP_CODE_URL,
+        params={"crtfc_key": api_key},
+        timeout=_CORP_CODE_TIMEOUT
+    ) as response:
+        if response.status != 200:
+            raise RuntimeError(f"corpCode.xml HTTP error: {response.status}")
+        payload = await response.read()
+
+    # 키 오류 등은 zip 대신 에러 XML로 응답
+    if not zipfile.is_zipfile(io.BytesIO(payload)):
+        raise RuntimeError(f"corpCode.xml error response: {payload[:200]!r}")
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _parse_corp_code_zip, payload)
+
+
+def ensure_corp_codes(api_key: Optional[str]):
+    """전체 고유번호 매핑이 없거나 24시간이 지났으면 백그라운드 로드 시작 (완료를 기다리지 않음)"""
+    global _load_task
+
+    if not api_key:
+        return
+    now = time.monotonic()
+    if now - _loaded_at < _CORP_CODE_TTL or now - _last_failure < _CORP_CODE_RETRY_INTERVAL:
+        return
+
+    loop = asyncio.get_running_loop()
+    if _load_task is not None and not _load_task.done() and _load_task.get_loop() is loop:
+        return  # 이미 로드 중
+    _load_task = loop.create_task(_load_corp_codes(api_key))
+
+
+async def _load_corp_codes(api_key: str):
+    """매핑 로드 (첫 로드는 api_cache 우선, TTL 만료 후 재로드는 새로 다운로드)"""
+    global _corp_codes, _loaded_at, _last_failure
+
+    cache_key = api_cache.make_key("dart_corp_codes", "listed")
+    try:
+        corp_codes = await api_cache.get(cache_key) if _corp_codes is None else None
+        if not corp_codes:
+            corp_codes = await _download_corp_codes(api_key)
+            await api_cache.set(cache_key, corp_codes, "dart_corp_codes")
+        _corp_codes = corp_codes
+        _loaded_at = time.monotonic()
+        logger.info("Loaded %d listed corp codes", len(corp_codes))
+    except Exception as e:
+        _last_failure = time.monotonic()
+        logger.warning("corpCode.xml load failed, using %s mapping: %s",
+                       "built-in" if _corp_codes is None else "previous", e)
+
+
+def lookup_corp_code(stock_code: str) -> Optional[str]:
+    """종목코드 → 고유번호 (로드된 전체 매핑 우선, 없으면 내장 매핑)"""
+    if _corp_codes is not None:
+        corp_code = _corp_codes.get(stock_code)
+        if corp_code:
+            return corp_code
+    return STOCK_TO_CORP_CODE.get(stock_code)
@@ -0,0 +1,142 @@
+"""
+DART 응답 파싱
+DartAgent와 DARTApiClient가 공유하는 순수 파싱 함수 (I/O 없음, 입력은 DART JSON의 list 항목)
+"""
+
+from typing import Any, Dict, List, Optional
+
+# 공시 요약에 표시할 주요 재무 지표 (정확히 일치하는 계정명만 사용, 표시 순서)
+_KEY_METRICS = ("매출액", "영업이익", "당기순이익", "자산총계", "부채총계")
+_TRILLION_FORMAT = "• **{}**: {}.{}조원"
+_EOK_FORMAT = "• **{}**: {}{:,}억원"
+
+# 재무제표 계정명 → 결과 필드 (정확히 일치하는 계정만 사용)
+_ACCOUNT_TO_FIELD = {
+    '매출액': 'revenue',
+    '수익(매출액)': 'revenue',
+    '영업수익': 'revenue',
+    '영업이익': 'operating_profit',
+    '당기순이익': 'net_income',
+    '자산총계': 'total_assets',
+    '자본총계': 'total_equity',
+    '부채총계': 'total_debt'
+}
+
+
+def format_financial_summary(financial_list: List[Dict[str, Any]]) -> Optional[str]:
+    """주요 재무 지표를 공시 요약용 텍스트로 변환 (지표가 없으면 None)"""
+    # 지표별로 목록에서 처음 나온 계정만 사용 (중복 제거)
+    found_metrics: Dict[str, str] = {}
+
+    for item in financial_list:
+        metric = item.get("account_nm", "").strip()
+        if metric not in _KEY_METRICS or metric in found_metrics:
+            continue
+
+        thstrm_amount = item.get("thstrm_amount", "0").strip()
+        try:
+            # 금액 파싱 (천원 단위를 조원, 억원으로 변환 - 부동소수점 반올림 없이 정수 연산)
+            amount = int(thstrm_amount.replace(",", ""))
+
+            if amount >= 1000000000000:  # 1조 이상 (소수 첫째 자리까지, 버림)
+                trillion, remainder = divmod(amount, 1000000000000)
+                found_metrics[metric] = _TRILLION_FORMAT.format(metric, trillion, remainder // 100000000000)
+            else:  # 억원 단위 (버림)
+                sign = "-" if amount < 0 else ""
+                found_metrics[metric] = _EOK_FORMAT.format(metric, sign, abs(amount) // 100000000)
+        except ValueError:
+            found_metrics[metric] = f"• **{metric}**: {thstrm_amount}"
+
+        if len(found_metrics) == len(_KEY_METRICS):
+            break
+
+    # 출력은 주요 지표 순서대로
+    results = [found_metrics[metric] for metric in _KEY_METRICS if metric in found_metrics]
+    return "\\n".join(results) if results else None
+
+
+def parse_financial_metrics(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """재무제표 계정 목록에서 주요 금액과 재무비율 계산"""
+    result: Dict[str, Any] = {
+        'revenue': 0,
+        'operating_profit': 0,
+        'net_income': 0,
+        'total_assets': 0,
+        'total_equity': 0,
+        'total_debt': 0,
+        'eps': 0,
+        'roe': 0,
+        'roa': 0,
+        'debt_ratio': 0
+    }
+
+    for item in data:
+        field = _ACCOUNT_TO_FIELD.get(item.get('account_nm', '').strip())
+        if field:
+            result[field] = int(item.get('thstrm_amount', '0').replace(',', ''))
+
+    # 재무비율 계산
+    if result['total_equity'] > 0:
+        result['roe'] = (result['net_income'] / result['total_equity']) * 100
+    if result['total_assets'] > 0:
+        result['roa'] = (result['net_income'] / result['total_assets']) * 100
+    if result['total_equity'] > 0:
+        result['debt_ratio'] = (result['total_debt'] / result['total_equity']) * 100
+
+    return result
+
+
+def parse_disclosure_list(data: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """list.json 항목을 DartDisclosure 필드 구성의 딕셔너리로 변환"""
+    return [
+        {
+            "rcept_no": item.get("rcept_no", ""),
+            "corp_code": item.get("corp_code", ""),
+            "corp_name": item.get("corp_name", ""),
+            "report_nm": item.get("report_nm", ""),
+            "rcept_dt": item.get("rcept_dt", ""),
+            "rm": item.get("rm", ""),
+            "stock_code": item.get("stock_code", "")
+        }
+        for item in data
+    ]
+
+
+def parse_disclosure_links(data: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """list.json 항목을 날짜/제목/제출인/원문 링크로 변환"""
+    return [
+        {
+            'date': item.get('rcept_dt', ''),
+            'title': item.get('report_nm', ''),
+            'submitter': item.get('flr_nm', ''),
+            'url': f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={item.get('rcept_no', '')}"
+        }
+        for item in data
+    ]
+
+
+def parse_shareholders(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """대주주 데이터 파싱"""
+    return [
+        {
+            'name': item.get('nm', ''),
+            'shares': int(item.get('bsis_posesn_stock_co', '0').replace(',', '')),
+            'ratio': float(item.get('bsis_posesn_stock_qota', '0'))
+        }
+        for item in data
+    ]
+
+
+def parse_company_info(data: Dict[str, Any]) -> Dict[str, str]:
+    """기업정보 파싱"""
+    return {
+        'company_name': data.get('corp_name', ''),
+        'ceo': data.get('ceo_nm', ''),
+        'establishment_date': data.get('est_dt', ''),
+        'listing_date': data.get('list_dt', ''),
+        'industry': data.get('induty_code', ''),
+        'address': data.get('adres', ''),
+        'homepage': data.get('hm_url', ''),
+        'phone': data.get('phn_no', ''),
+        'fiscal_month': data.get('acc_mt', '')
+    }
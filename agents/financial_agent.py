@@ -4,14 +4,70 @@ DART 재무제표 파싱 및 재무 지표 계산
 """
 
 import os
+import re
 import asyncio
-import aiohttp
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import json
 from dataclasses import dataclass, asdict
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
+from agents.http_session import get_session, close_session
+from cache.api_cache import api_cache
+from utils.date_cache import today_str
+from orjson import loads as json_loads
+
+# 계정과목명 → 항목 (기존 if/elif 순서 그대로, 앞쪽 조건이 우선)
+# 선두에 고정하고 조건별 전방탐색을 순서대로 시도하므로 계정명 하나당 정규식 한 번으로 판별
+_ACCOUNT_RE = re.compile(
+    r"^(?:"
+    r"(?=.*자산총계)(?P<total_assets>)"
+    r"|(?=.*부채총계)(?P<total_liabilities>)"
+    r"|(?=.*자본총계)(?P<total_equity>)"
+    r"|(?=.*유동자산)(?!.*비유동)(?P<current_assets>)"
+    r"|(?=.*유동부채)(?!.*비유동)(?P<current_liabilities>)"
+    r"|(?=.*(?:매출액|수익))(?P<revenue>)"
+    r"|(?=.*영업이익)(?P<operating_income>)"
+    r"|(?=.*당기순이익)(?P<net_income>)"
+    r"|(?=.*매출총이익)(?P<gross_profit>)"
+    r"|(?=.*영업활동)(?=.*현금흐름)(?P<operating_cash_flow>)"
+    r"|(?=.*투자활동)(?=.*현금흐름)(?P<investing_cash_flow>)"
+    r"|(?=.*재무활동)(?=.*현금흐름)(?P<financing_cash_flow>)"
+    r")",
+    re.DOTALL
+)
+
+# 항목 → 재무제표 구분
+_FIELD_TO_SECTION = {
+    "total_assets": "balance_sheet",
+    "total_liabilities": "balance_sheet",
+    "total_equity": "balance_sheet",
+    "current_assets": "balance_sheet",
+    "current_liabilities": "balance_sheet",
+    "revenue": "income_statement",
+    "operating_income": "income_statement",
+    "net_income": "income_statement",
+    "gross_profit": "income_statement",
+    "operating_cash_flow": "cash_flow",
+    "investing_cash_flow": "cash_flow",
+    "financing_cash_flow": "cash_flow"
+}
+
+# 재무 건전성 점수 구간: (비율, 구간 경계(오름차순), 구간별 점수, 경계값 처리)
+# "left": 경계값을 초과해야 다음 구간 (높을수록 좋은 지표), "right": 경계값 이상이면 다음 구간 (낮을수록 좋은 지표)
+# 경계값 처리는 bisect_left/bisect_right, np.searchsorted의 side와 같은 의미
+_HEALTH_SCORE_TABLES = (
+    # 수익성 평가 (40점)
+    ("roe", (0, 5, 10, 15), (0, 5, 10, 15, 20), "left"),
+    ("opm", (0, 5, 10, 15), (0, 5, 10, 15, 20), "left"),
+    # 안정성 평가 (40점)
+    ("debt_ratio", (100, 150, 200, 300), (20, 15, 10, 5, 0), "right"),
+    ("current_ratio", (50, 100, 150, 200), (0, 5, 10, 15, 20), "left"),
+    # 효율성 평가 (20점)
+    ("asset_turnover", (0.3, 0.5, 0.8, 1.0), (0, 5, 10, 15, 20), "left")
+)
+_BISECT = {"left": bisect_left, "right": bisect_right}
 
 
 @dataclass
@@ -83,6 +139,8 @@ class FinancialAgent:
         self.dart_api_key = dart_api_key or os.getenv("DART_API_KEY")
         self.dart_base_url = "https://opendart.fss.or.kr/api"
         self.session = None
+        # DART API 호출 제한을 고려해 동시 요청 수 제한 (analyze_many 등 여러 기업 동시 조회 시)
+        self._semaphore = asyncio.Semaphore(8)
         
         # 보고서 코드 매핑
         self.report_codes = {
@@ -108,12 +166,13 @@ class FinancialAgent:
         }
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        """비동기 컨텍스트 매니저 진입 (프로세스 공유 세션 사용)"""
+        self.session = await get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        """비동기 컨텍스트 매니저 종료 (공유 세션은 close_session()에서 정리)"""
+        self.session = None
             
     def _get_latest_report_info(self, report_type: str = "annual") -> Dict[str, str]:
         """최신 보고서 정보 계산"""
@@ -173,6 +232,12 @@ class FinancialAgent:
         else:
             report_code = self.report_codes.get(report_type, "11011")
             
+        # 제출된 재무제표는 같은 (기업, 연도, 보고서)에 대해 항상 같은 응답
+        cache_key = api_cache.make_key("dart_statements", corp_code, year, report_code, "CFS")
+        cached = await api_cache.get(cache_key)
+        if cached is not None:
+            return cached
+            
         try:
             # 단일회사 재무제표 API 호출
             url = f"{self.dart_base_url}/fnlttSinglAcnt.json"
@@ -186,15 +251,16 @@ class FinancialAgent:
             
             print(f"[FINANCIAL] Fetching statements for corp_code: {corp_code}, year: {year}, report: {report_type}")
             
-            async with self.session.get(url, params=params) as response:
+            session = self.session or await get_session()
+            async with self._semaphore, session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = json_loads(await response.read())
                     
                     if data.get("status") == "000":
                         # 재무데이터 파싱
                         statements = self._parse_financial_data(data.get("list", []))
                         
-                        return {
+                        result = {
                             "status": "success",
                             "data_source": "REAL_DATA",
                             "corp_code": corp_code,
@@ -202,6 +268,11 @@ class FinancialAgent:
                             "report_type": report_type,
                             "statements": statements
                         }
+                        
+                        # 지난 연도 보고서는 장기 보관, 올해 보고서는 정정 공시에 대비해 하루만 보관
+                        namespace = "dart_statements" if year < today_str()[:4] else "dart_statements_recent"
+                        await api_cache.set(cache_key, result, namespace)
+                        return result
                     else:
                         return {
                             "status": "error",
@@ -230,7 +301,10 @@ class FinancialAgent:
         }
         
         for item in data_list:
-            account_nm = item.get("account_nm", "")
+            match = _ACCOUNT_RE.match(item.get("account_nm", ""))
+            if not match:
+                continue
+            field = match.lastgroup
             thstrm_amount = item.get("thstrm_amount", "0")
             
             # 금액 변환 (문자열 -> 숫자, 단위: 원 -> 백만원)
@@ -239,35 +313,7 @@ class FinancialAgent:
             except:
                 amount = 0
                 
-            # 재무상태표 항목
-            if "자산총계" in account_nm:
-                parsed["balance_sheet"]["total_assets"] = amount
-            elif "부채총계" in account_nm:
-                parsed["balance_sheet"]["total_liabilities"] = amount
-            elif "자본총계" in account_nm:
-                parsed["balance_sheet"]["total_equity"] = amount
-            elif "유동자산" in account_nm and "비유동" not in account_nm:
-                parsed["balance_sheet"]["current_assets"] = amount
-            elif "유동부채" in account_nm and "비유동" not in account_nm:
-                parsed["balance_sheet"]["current_liabilities"] = amount
-                
-            # 손익계산서 항목
-            elif "매출액" in account_nm or "수익" in account_nm:
-                parsed["income_statement"]["revenue"] = amount
-            elif "영업이익" in account_nm:
-                parsed["income_statement"]["operating_income"] = amount
-            elif "당기순이익" in account_nm:
-                parsed["income_statement"]["net_income"] = amount
-            elif "매출총이익" in account_nm:
-                parsed["income_statement"]["gross_profit"] = amount
-                
-            # 현금흐름표 항목
-            elif "영업활동" in account_nm and "현금흐름" in account_nm:
-                parsed["cash_flow"]["operating_cash_flow"] = amount
-            elif "투자활동" in account_nm and "현금흐름" in account_nm:
-                parsed["cash_flow"]["investing_cash_flow"] = amount
-            elif "재무활동" in account_nm and "현금흐름" in account_nm:
-                parsed["cash_flow"]["financing_cash_flow"] = amount
+            parsed[_FIELD_TO_SECTION[field]][field] = amount
                 
         return parsed
         
@@ -348,58 +394,22 @@ class FinancialAgent:
             "investment_points": investment_points
         }
         
+    async def analyze_many(self, corp_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 기업 재무 건전성 동시 분석 (기업 고유번호 → analyze_financial_health 결과)"""
+        results = await asyncio.gather(
+            *(self.analyze_financial_health(corp_code) for corp_code in corp_codes)
+        )
+        return dict(zip(corp_codes, results))
+        
     def _calculate_health_score(self, ratios: FinancialRatios) -> Dict[str, Any]:
         """재무 건전성 점수 계산"""
-        score = 0
         max_score = 100
         
-        # 수익성 평가 (40점)
-        if ratios.roe > 15:
-            score += 20
-        elif ratios.roe > 10:
-            score += 15
-        elif ratios.roe > 5:
-            score += 10
-        elif ratios.roe > 0:
-            score += 5
-            
-        if ratios.opm > 15:
-            score += 20
-        elif ratios.opm > 10:
-            score += 15
-        elif ratios.opm > 5:
-            score += 10
-        elif ratios.opm > 0:
-            score += 5
-            
-        # 안정성 평가 (40점)
-        if ratios.debt_ratio < 100:
-            score += 20
-        elif ratios.debt_ratio < 150:
-            score += 15
-        elif ratios.debt_ratio < 200:
-            score += 10
-        elif ratios.debt_ratio < 300:
-            score += 5
-            
-        if ratios.current_ratio > 200:
-            score += 20
-        elif ratios.current_ratio > 150:
-            score += 15
-        elif ratios.current_ratio > 100:
-            score += 10
-        elif ratios.current_ratio > 50:
-            score += 5
-            
-        # 효율성 평가 (20점)
-        if ratios.asset_turnover > 1.0:
-            score += 20
-        elif ratios.asset_turnover > 0.8:
-            score += 15
-        elif ratios.asset_turnover > 0.5:
-            score += 10
-        elif ratios.asset_turnover > 0.3:
-            score += 5
+        # 비율별로 구간 경계를 이분 탐색해 점수 조회
+        score = sum(
+            scores[_BISECT[side](thresholds, getattr(ratios, name))]
+            for name, thresholds, scores, side in _HEALTH_SCORE_TABLES
+        )
             
         # 등급 판정
         if score >= 80:
@@ -466,6 +476,62 @@ class FinancialAgent:
         return points
 
 
+# 배치 계산 시 누락 항목 기본값 (calculate_financial_ratios와 동일, 0으로 나누기 방지)
+_BATCH_DEFAULTS = {
+    "total_assets": 1,
+    "total_equity": 1,
+    "total_liabilities": 0,
+    "current_assets": 0,
+    "current_liabilities": 1,
+    "revenue": 1,
+    "operating_income": 0,
+    "net_income": 0
+}
+
+
+def calculate_ratios_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    여러 기업 재무 비율 및 건전성 점수 일괄 계산 (NumPy 벡터 연산)
+    
+    Args:
+        df: 기업별 한 행, 열은 _parse_financial_data 항목명 (total_assets, net_income 등, 단위: 백만원)
+        
+    Returns:
+        df와 같은 인덱스의 DataFrame (roe, roa, npm, opm, debt_ratio, current_ratio,
+        equity_ratio, asset_turnover, score, grade) - 값은 calculate_financial_ratios,
+        _calculate_health_score와 동일한 기준
+    """
+    cols = {
+        name: (df[name].fillna(default) if name in df else pd.Series(default, index=df.index))
+              .to_numpy(dtype=float)
+        for name, default in _BATCH_DEFAULTS.items()
+    }
+    ta, te = cols["total_assets"], cols["total_equity"]
+    cl, rv = cols["current_liabilities"], cols["revenue"]
+    ni = cols["net_income"]
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = pd.DataFrame({
+            "roe": np.where(te > 0, ni / te * 100, 0),
+            "roa": np.where(ta > 0, ni / ta * 100, 0),
+            "npm": np.where(rv > 0, ni / rv * 100, 0),
+            "opm": np.where(rv > 0, cols["operating_income"] / rv * 100, 0),
+            "debt_ratio": np.where(te > 0, cols["total_liabilities"] / te * 100, 0),
+            "current_ratio": np.where(cl > 0, cols["current_assets"] / cl * 100, 0),
+            "equity_ratio": np.where(ta > 0, te / ta * 100, 0),
+            "asset_turnover": np.where(ta > 0, rv / ta, 0)
+        }, index=df.index).round(2)
+        
+    # 건전성 점수: 단건 계산과 같은 구간표를 searchsorted로 일괄 조회
+    score = np.zeros(len(out), dtype=int)
+    for name, thresholds, scores, side in _HEALTH_SCORE_TABLES:
+        score += np.asarray(scores)[np.searchsorted(thresholds, out[name].to_numpy(), side=side)]
+    out["score"] = score
+    out["grade"] = np.asarray(["E", "D", "C", "B", "A"])[np.searchsorted((20, 40, 60, 80), score, side="right")]
+    
+    return out
+
+
 # 테스트 함수
 async def test_financial_agent():
     async with FinancialAgent() as agent:
@@ -481,6 +547,8 @@ async def test_financial_agent():
                 print(f"  {point}")
         else:
             print(f"Error: {result['message']}")
+            
+    await close_session()
 
 
 if __name__ == "__main__":
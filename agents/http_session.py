@@ -0,0 +1,41 @@
+"""
+공유 aiohttp 세션
+에이전트 인스턴스마다 세션을 새로 만들지 않고 프로세스 전역 세션을 재사용해
+같은 호스트(CoinGecko, DART 등)로의 TCP/TLS 연결을 keep-alive로 유지
+"""
+
+import asyncio
+from typing import Optional
+import aiohttp
+
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """공유 세션 반환 (없거나 닫혔거나 다른 이벤트 루프에서 만든 경우 새로 생성)"""
+    global _SHARED_SESSION, _SESSION_LOOP
+
+    loop = asyncio.get_running_loop()
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed or _SESSION_LOOP is not loop:
+        _SHARED_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+        )
+        _SESSION_LOOP = loop
+
+    return _SHARED_SESSION
+
+
+async def close_session():
+    """공유 세션 종료 (애플리케이션 종료 시 한 번 호출)"""
+    global _SHARED_SESSION, _SESSION_LOOP
+
+    if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+        await _SHARED_SESSION.close()
+    _SHARED_SESSION = None
+    _SESSION_LOOP = None
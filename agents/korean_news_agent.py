@@ -6,9 +6,17 @@ RSS 피드 기반으로 실시간 뉴스 수집
 import feedparser
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Any, Dict, FrozenSet, List, Tuple
 import asyncio
 import re
+import time
+from functools import lru_cache
+from operator import itemgetter
+import aiohttp
+from agents.http_session import get_session
+
+_RSS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+_FEED_CACHE_TTL = 60  # seconds, 뉴스는 분 단위로 바뀌므로 연속 호출은 같은 피드 재사용
 
 
 class KoreanNewsAgent:
@@ -39,17 +47,55 @@ class KoreanNewsAgent:
             "코스피", "코스닥", "증권", "투자", "펀드"
         ]
 
+        # 부정/긍정 키워드 (둘 다 관련도 증가)
+        self.negative_keywords = ["하락", "급락", "폭락", "손실", "적자", "위험"]
+        self.positive_keywords = ["상승", "급등", "호재", "수익", "흑자", "성과"]
+
+        # 키워드별 관련도 가중치
+        self._keyword_weights: Dict[str, int] = {}
+        for keywords, weight in (
+            (self.company_keywords, 5),
+            (self.stock_keywords, 2),
+            (self.negative_keywords, 3),
+            (self.positive_keywords, 3)
+        ):
+            for keyword in keywords:
+                self._keyword_weights[keyword] = self._keyword_weights.get(keyword, 0) + weight
+
+        # 전체 키워드를 한 번의 정규식 탐색으로 찾음 (위치마다 가장 긴 키워드가 매치되도록 길이순 정렬)
+        self._keyword_re = re.compile("(?=({}))".format("|".join(
+            map(re.escape, sorted(self._keyword_weights, key=len, reverse=True))
+        )))
+        # 매치된 키워드 → 그 안에 포함된 키워드 전체 (예: "투자의견" → "투자의견", "투자")
+        self._contained_keywords = {
+            keyword: frozenset(other for other in self._keyword_weights if other in keyword)
+            for keyword in self._keyword_weights
+        }
+        # 같은 기사가 여러 호출(get_company_news, get_market_summary)에 반복 등장하므로 매치 결과 메모이즈
+        self._match_keywords = lru_cache(maxsize=4096)(self._match_keywords)
+
+        # RSS URL -> (수집 시각(monotonic), 파싱된 피드)
+        self._feed_cache: Dict[str, Tuple[float, Any]] = {}
+
     async def collect_news(self, hours: int = 24) -> Dict:
         """최근 뉴스 수집"""
         try:
             all_news = []
             cutoff_time = datetime.now() - timedelta(hours=hours)
 
-            for source_name, rss_url in self.news_sources.items():
-                try:
-                    print(f"📰 {source_name} 뉴스 수집 중...")
-                    feed = feedparser.parse(rss_url)
+            # 모든 피드를 동시에 요청 (전체 소요 시간 = 가장 느린 피드 하나)
+            feeds = await asyncio.gather(
+                *(self._fetch_feed(source_name, rss_url)
+                  for source_name, rss_url in self.news_sources.items()),
+                return_exceptions=True
+            )
+
+            for source_name, feed in zip(self.news_sources, feeds):
+                if isinstance(feed, Exception):
+                    print(f"❌ {source_name} 수집 실패: {feed}")
+                    continue
 
+                try:
                     for entry in feed.entries[:10]:  # 각 소스당 최대 10개
                         # 시간 필터링
                         try:
@@ -63,7 +109,8 @@ class KoreanNewsAgent:
                         title = entry.title
                         summary = getattr(entry, 'summary', '')
 
-                        relevance_score = self._calculate_relevance(title + ' ' + summary)
+                        matched = self._match_keywords(title + ' ' + summary)
+                        relevance_score = self._score_keywords(matched)
 
                         if relevance_score > 0:  # 관련도가 있는 경우만
                             news_item = {
@@ -73,7 +120,7 @@ class KoreanNewsAgent:
                                 "source": source_name,
                                 "summary": summary[:200] + '...' if len(summary) > 200 else summary,
                                 "relevance_score": relevance_score,
-                                "companies": self._extract_companies(title + ' ' + summary)
+                                "companies": self._companies_in(matched)
                             }
                             all_news.append(news_item)
 
@@ -82,7 +129,7 @@ class KoreanNewsAgent:
                     continue
 
             # 관련도순으로 정렬
-            all_news.sort(key=lambda x: x['relevance_score'], reverse=True)
+            all_news.sort(key=itemgetter('relevance_score'), reverse=True)
 
             return {
                 "status": "success",
@@ -94,42 +141,42 @@ class KoreanNewsAgent:
         except Exception as e:
             return {"status": "error", "message": f"뉴스 수집 오류: {str(e)}"}
 
-    def _calculate_relevance(self, text: str) -> int:
-        """뉴스의 주식 관련도 점수 계산"""
-        score = 0
-        text_lower = text.lower()
+    async def _fetch_feed(self, source_name: str, rss_url: str):
+        """RSS 피드 다운로드 후 파싱 (파싱은 이벤트 루프를 막지 않도록 스레드에서 실행, 60초 캐싱)"""
+        cached = self._feed_cache.get(rss_url)
+        if cached and time.monotonic() - cached[0] < _FEED_CACHE_TTL:
+            return cached[1]
 
-        # 기업명 매치 (높은 점수)
-        for company in self.company_keywords:
-            if company in text:
-                score += 5
+        print(f"📰 {source_name} 뉴스 수집 중...")
+        session = await get_session()
+        async with session.get(rss_url, timeout=_RSS_TIMEOUT) as response:
+            response.raise_for_status()
+            body = await response.read()
 
-        # 주식 키워드 매치
-        for keyword in self.stock_keywords:
-            if keyword in text:
-                score += 2
+        loop = asyncio.get_running_loop()
+        feed = await loop.run_in_executor(None, feedparser.parse, body)
+        self._feed_cache[rss_url] = (time.monotonic(), feed)
+        return feed
 
-        # 부정적 키워드 (관련도 증가)
-        negative_keywords = ["하락", "급락", "폭락", "손실", "적자", "위험"]
-        for keyword in negative_keywords:
-            if keyword in text:
-                score += 3
+    def _match_keywords(self, text: str) -> FrozenSet[str]:
+        """텍스트에 포함된 키워드 집합 (텍스트를 한 번만 탐색)"""
+        return frozenset().union(*map(self._contained_keywords.__getitem__, self._keyword_re.findall(text)))
 
-        # 긍정적 키워드 (관련도 증가)
-        positive_keywords = ["상승", "급등", "호재", "수익", "흑자", "성과"]
-        for keyword in positive_keywords:
-            if keyword in text:
-                score += 3
+    def _score_keywords(self, matched: FrozenSet[str]) -> int:
+        """매치된 키워드의 가중치 합"""
+        return sum(self._keyword_weights[keyword] for keyword in matched)
 
-        return score
+    def _companies_in(self, matched: FrozenSet[str]) -> List[str]:
+        """매치된 키워드 중 기업명 (company_keywords 순서)"""
+        return [company for company in self.company_keywords if company in matched]
+
+    def _calculate_relevance(self, text: str) -> int:
+        """뉴스의 주식 관련도 점수 계산"""
+        return self._score_keywords(self._match_keywords(text))
 
     def _extract_companies(self, text: str) -> List[str]:
         """텍스트에서 기업명 추출"""
-        found_companies = []
-        for company in self.company_keywords:
-            if company in text:
-                found_companies.append(company)
-        return found_companies
+        return self._companies_in(self._match_keywords(text))
 
     async def get_company_news(self, company_name: str, limit: int = 5) -> Dict:
         """특정 기업 관련 뉴스만 필터링"""
@@ -246,20 +246,21 @@ class NaverFinanceAgent:
 
             period_code = period_codes.get(period, "month")
 
-            # 네이버 금융 차트 데이터 API
-            url = f"https://fchart.stock.naver.com/sise.nhn?symbol={stock_code}&timeframe={period_code}&count=100&requestType=0"
+            # 네이버 금융 차트 데이터 API (응답에 쓰는 최근 30개만 요청)
+            url = f"https://fchart.stock.naver.com/sise.nhn?symbol={stock_code}&timeframe={period_code}&count=30&requestType=0"
 
             response = self.session.get(url)
             if response.status_code != 200:
                 return {"status": "error", "message": "차트 데이터 조회 실패"}
 
-            # XML 파싱 (네이버 차트는 XML 형식)
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response.content)
+            # XML 파싱 (네이버 차트는 XML 형식, lxml로 item 요소만 스트리밍 처리)
+            from io import BytesIO
+            from lxml import etree
 
             chart_data = []
-            for item in root.findall('.//item'):
+            for _, item in etree.iterparse(BytesIO(response.content), tag='item'):
                 data = item.get('data', '').split('|')
+                item.clear()
                 if len(data) >= 5:
                     chart_data.append({
                         "date": data[0],
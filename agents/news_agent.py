@@ -8,9 +8,9 @@ import asyncio
 import aiohttp
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import json
 from dataclasses import dataclass, asdict
 from urllib.parse import quote
+from orjson import loads as json_loads
 
 
 @dataclass
@@ -115,7 +115,7 @@ class NewsAgent:
                 params=params
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = json_loads(await response.read())
                     
                     articles = []
                     for item in data.get("articles", []):
@@ -141,9 +141,8 @@ class NewsApiClient:
 
     def _parse_newsapi_response(self, articles: List[Dict]) -> List[Dict]:
         """NewsAPI 응답 파싱"""
-        news = []
-        for article in articles:
-            news.append({
+        return [
+            {
                 'title': article.get('title', ''),
                 'description': article.get('description', ''),
                 'url': article.get('url', ''),
@@ -151,8 +150,9 @@ class NewsApiClient:
                 'published_date': article.get('publishedAt', ''),
                 'image_url': article.get('urlToImage', ''),
                 'category': self._categorize_news(article.get('title', ''))
-            })
-        return news
+            }
+            for article in articles
+        ]
 
     def _parse_naver_response(self, items: List[Dict]) -> List[Dict]:
         """네이버 뉴스 응답 파싱"""
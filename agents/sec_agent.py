@@ -8,9 +8,9 @@ import asyncio
 import aiohttp
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import re
+from orjson import loads as json_loads
 
 
 @dataclass
@@ -114,14 +114,19 @@ class SECAgent:
             
             async with self.session.get(url, headers=self.headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = json_loads(await response.read())
                     
                     # 최근 공시 추출
                     recent_filings = data.get("filings", {}).get("recent", {})
                     
                     filings = []
-                    for i in range(min(limit, len(recent_filings.get("accessionNumber", [])))):
-                        filing_date = recent_filings["filingDate"][i]
+                    accession_numbers = recent_filings.get("accessionNumber", [])
+                    filing_dates = recent_filings.get("filingDate", [])
+                    forms = recent_filings.get("form", [])
+                    primary_documents = recent_filings.get("primaryDocument", [])
+                    company_name = data.get("name", "")
+                    for i in range(min(limit, len(accession_numbers))):
+                        filing_date = filing_dates[i]
                         
                         # 날짜 필터링
                         if start_date and filing_date < start_date:
@@ -130,26 +135,26 @@ class SECAgent:
                             continue
                             
                         # 폼 타입 필터링
-                        current_form_type = recent_filings["form"][i]
+                        current_form_type = forms[i]
                         if form_type and current_form_type != form_type:
                             continue
                             
                         # 공시 URL 생성
-                        accession = recent_filings["accessionNumber"][i].replace("-", "")
-                        filing_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{recent_filings['primaryDocument'][i]}"
+                        accession_number = accession_numbers[i]
+                        accession = accession_number.replace("-", "")
+                        filing_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{primary_documents[i]}"
                         
-                        filing = SECFiling(
-                            accession_number=recent_filings["accessionNumber"][i],
-                            filing_date=filing_date,
-                            form_type=current_form_type,
-                            company_name=data.get("name", ""),
-                            ticker=ticker or "",
-                            cik=cik,
-                            filing_url=filing_url,
-                            description=self.major_form_types.get(current_form_type, "")
-                        )
-                        
-                        filings.append(asdict(filing))
+                        # SECFiling 필드 구성의 딕셔너리를 직접 생성
+                        filings.append({
+                            "accession_number": accession_number,
+                            "filing_date": filing_date,
+                            "form_type": current_form_type,
+                            "company_name": company_name,
+                            "ticker": ticker or "",
+                            "cik": cik,
+                            "filing_url": filing_url,
+                            "description": self.major_form_types.get(current_form_type, "")
+                        })
                         
                     return {
                         "status": "success",
@@ -8,9 +8,10 @@ import asyncio
 import aiohttp
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import json
 from dataclasses import dataclass, asdict
 import re
+from operator import itemgetter
+from orjson import loads as json_loads
 
 
 @dataclass
@@ -89,7 +90,7 @@ class SocialAgent:
             headers=headers
         ) as response:
             if response.status == 200:
-                result = await response.json()
+                result = json_loads(await response.read())
                 self.reddit_token = result['access_token']
                 
     async def search_reddit(self,
@@ -140,7 +141,7 @@ class SocialAgent:
                 params=params
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = json_loads(await response.read())
                     
                     posts = []
                     for item in data.get('data', {}).get('children', []):
@@ -345,7 +346,7 @@ class SocialAgent:
                     "platforms": data["platforms"]
                 })
                 
-            result.sort(key=lambda x: x["total_mentions"], reverse=True)
+            result.sort(key=itemgetter("total_mentions"), reverse=True)
             
             return {
                 "status": "success",
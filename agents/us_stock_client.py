@@ -10,6 +10,8 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import asyncio
 import aiohttp
+from orjson import loads as json_loads
+
 
 class USStockClient:
     """미국/해외 주식 데이터 클라이언트"""
@@ -188,7 +190,7 @@ class USStockClient:
 
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        profile = await response.json()
+                        profile = json_loads(await response.read())
                     else:
                         profile = {}
 
@@ -198,7 +200,7 @@ class USStockClient:
 
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        recommendations = await response.json()
+                        recommendations = json_loads(await response.read())
                         if recommendations:
                             latest_rec = recommendations[0]
                         else:
@@ -228,17 +230,16 @@ class USStockClient:
             ticker = yf.Ticker(symbol)
             news = ticker.news[:10] if hasattr(ticker, 'news') else []
 
-            formatted_news = []
-            for item in news:
-                formatted_news.append({
+            return [
+                {
                     'title': item.get('title', ''),
                     'publisher': item.get('publisher', ''),
                     'link': item.get('link', ''),
                     'published': datetime.fromtimestamp(item.get('providerPublishTime', 0)).strftime('%Y-%m-%d %H:%M') if item.get('providerPublishTime') else '',
                     'type': item.get('type', 'STORY')
-                })
-
-            return formatted_news
+                }
+                for item in news
+            ]
         except Exception as e:
             print(f"뉴스 조회 오류: {e}")
             return self._get_fallback_news(symbol)
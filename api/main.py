@@ -41,6 +41,8 @@ from agents.news_api_client import NewsApiClient
 from agents.alpha_vantage_client import AlphaVantageClient
 from agents.us_stock_client import USStockClient
 from api.api_status import APIStatusChecker
+from agents.http_session import close_session
+from agents.dart_corp_codes import ensure_corp_codes
 
 app = FastAPI(title="StockAI API", version="0.1.0")
 
@@ -56,6 +58,21 @@ app.add_middleware(
 # 정적 파일 서빙
 app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
 
+
+@app.on_event("startup")
+async def startup_event():
+    """서버 시작 시 DART 전체 상장사 고유번호 매핑 백그라운드 로드 시작"""
+    if dart_client.is_valid:
+        ensure_corp_codes(dart_client.api_key)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 에이전트 공유 HTTP 세션 및 API 클라이언트 정리"""
+    await close_session()
+    await alpha_vantage_client.aclose()
+
+
 # NLU 에이전트 초기화
 nlu_agent = SimpleNLUAgent()
 
@@ -908,7 +925,11 @@ async def analyze_query(query: Dict[str, Any]):
                     # 2. DART 재무 데이터 가져오기 (한국 주식만)
                     if is_korean and dart_client.is_valid and original_stock in stock_code_map:
                         stock_code = stock_code_map[original_stock]
-                        financial_data = dart_client.get_financial_statements(stock_code)
+                        # 재무제표와 최근 공시는 서로 독립적이므로 동시에 조회
+                        financial_data, disclosures = await asyncio.gather(
+                            dart_client.get_financial_statements(stock_code),
+                            dart_client.get_recent_disclosures(stock_code, 5)
+                        )
                         if financial_data:
                             enhanced_data.update({
                                 "pe_ratio": financial_data.get('pe_ratio', enhanced_data.get('pe_ratio', 0)),
@@ -919,7 +940,6 @@ async def analyze_query(query: Dict[str, Any]):
                             })
 
                         # 최근 공시 데이터
-                        disclosures = dart_client.get_recent_disclosures(stock_code, 5)
                         if disclosures:
                             enhanced_data['recent_disclosures'] = disclosures
 
@@ -927,7 +947,7 @@ async def analyze_query(query: Dict[str, Any]):
                     if alpha_vantage_client.is_valid:
                         # 한국 주식은 .KS 후비 추가
                         symbol = f"{stock_code_map.get(original_stock, stock)}.KS" if is_korean else stock
-                        technical_indicators = alpha_vantage_client.get_technical_indicators(symbol)
+                        technical_indicators = await alpha_vantage_client.get_technical_indicators(symbol)
                         if technical_indicators:
                             enhanced_data['technical_signals'] = {
                                 "rsi": technical_indicators.get('rsi', {}).get('value', 50),
@@ -0,0 +1,85 @@
+"""
+외부 API 응답 캐싱 시스템
+REDIS_URL이 설정되어 있으면 Redis, 아니면 메모리 기반 캐싱
+"""
+
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+from orjson import dumps as json_dumps, loads as json_loads
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+class ApiCache:
+    """외부 API 응답 캐싱 클래스"""
+
+    def __init__(self):
+        # key -> (만료 시각(monotonic), 직렬화된 데이터), Redis와 같게 조회마다 새 객체 반환
+        self.memory_cache: Dict[str, Tuple[float, bytes]] = {}
+        self.max_memory_items = 1000
+        self.cache_ttl = {
+            "coingecko": 60,     # 암호화폐 시세: 1분
+            "dart": 3600,        # 공시 목록/기업 개황/재무제표: 1시간 (추가만 되는 데이터)
+            "dart_recent": 600,  # 최근 공시 상위 N건: 10분
+            "dart_archive": 86400,  # 종료일이 지난 기간의 공시 목록: 1일
+            "dart_corp_codes": 86400,  # 상장사 고유번호 매핑: 1일
+            "dart_statements": 2592000,  # 지난 연도 재무제표 (제출 후 바뀌지 않음): 30일
+            "dart_statements_recent": 86400  # 올해 재무제표 (정정 가능): 1일
+        }
+
+        redis_url = os.getenv("REDIS_URL")
+        self.redis = aioredis.from_url(redis_url) if aioredis and redis_url else None
+        print(f"[API CACHE] Using {'redis' if self.redis else 'in-memory'} cache")
+
+    def make_key(self, namespace: str, *parts: Any) -> str:
+        """캐시 키 생성"""
+        return ":".join(["stockai", "api", namespace, *map(str, parts)])
+
+    def _disable_redis(self, error: Exception):
+        """Redis 연결 실패 시 메모리 캐시로 전환"""
+        print(f"[API CACHE] Redis unavailable, falling back to in-memory cache: {error}")
+        self.redis = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시에서 데이터 조회"""
+        if self.redis:
+            try:
+                cached = await self.redis.get(key)
+                return json_loads(cached) if cached is not None else None
+            except Exception as e:
+                self._disable_redis(e)
+
+        cached = self.memory_cache.get(key)
+        if cached:
+            if cached[0] > time.monotonic():
+                return json_loads(cached[1])
+            del self.memory_cache[key]
+
+        return None
+
+    async def set(self, key: str, data: Any, namespace: str):
+        """캐시에 데이터 저장 (네임스페이스별 TTL 적용)"""
+        ttl = self.cache_ttl.get(namespace, 60)
+        payload = json_dumps(data)
+
+        if self.redis:
+            try:
+                await self.redis.set(key, payload, ex=ttl)
+                return
+            except Exception as e:
+                self._disable_redis(e)
+
+        self.memory_cache[key] = (time.monotonic() + ttl, payload)
+
+        # 메모리 캐시 크기 제한 (만료가 가장 가까운 항목 삭제)
+        if len(self.memory_cache) > self.max_memory_items:
+            oldest_key = min(self.memory_cache, key=lambda k: self.memory_cache[k][0])
+            del self.memory_cache[oldest_key]
+
+
+# 전역 캐시 인스턴스
+api_cache = ApiCache()
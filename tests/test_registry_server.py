@@ -0,0 +1,134 @@
+"""A2A Registry Server (registry_server.Registry) 테스트"""
+
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from a2a_core.registry import registry_server
+
+
+class FakeClock:
+    """레지스트리 모듈의 time 대체 (monotonic만 수동으로 진행)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return time.time()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(registry_server, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def registry(monkeypatch, clock):
+    # 엔드포인트가 사용하는 전역 레지스트리를 테스트마다 새로 생성
+    fresh = registry_server.Registry()
+    monkeypatch.setattr(registry_server, "registry", fresh)
+    return fresh
+
+
+@pytest.fixture
+def client(registry):
+    # startup 이벤트(주기 정리 태스크)는 실행하지 않음
+    return TestClient(registry_server.app)
+
+
+def register(client, agent_id, name, caps):
+    response = client.post("/register", json={
+        "agent_id": agent_id,
+        "name": name,
+        "description": f"{name} agent",
+        "endpoint": f"http://localhost/{agent_id}",
+        "capabilities": [{"name": cap} for cap in caps]
+    })
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_discover_slim_and_verbose(client):
+    register(client, "a1", "Price-Agent", ["price"])
+    register(client, "a2", "News Agent", ["news", "price"])
+
+    slim = client.get("/discover", params={"capability": "news"}).json()
+    assert slim == {
+        "agents": [{"id": "a2", "name": "News Agent", "endpoint": "http://localhost/a2", "caps": ["news", "price"]}],
+        "count": 1
+    }
+
+    verbose = client.get("/discover", params={"capability": "price", "verbose": 1}).json()
+    assert verbose["count"] == 2
+    assert {agent["agent_id"] for agent in verbose["agents"]} == {"a1", "a2"}
+    assert "description" in verbose["agents"][0]
+
+    assert client.get("/discover").json()["count"] == 2
+
+
+def test_register_invalidates_slim_cache(client):
+    register(client, "a1", "Price Agent", ["price"])
+    assert client.get("/discover", params={"capability": "price"}).json()["count"] == 1
+
+    register(client, "a2", "Other Price Agent", ["price"])
+    assert client.get("/discover", params={"capability": "price"}).json()["count"] == 2
+
+
+def test_unknown_capability_is_not_cached(client, registry):
+    register(client, "a1", "Price Agent", ["price"])
+
+    for i in range(100):
+        body = client.get("/discover", params={"capability": f"unknown-{i}"}).json()
+        assert body == {"agents": [], "count": 0}
+
+    assert set(registry._discover_bytes) == set()
+    client.get("/discover", params={"capability": "price"})
+    assert set(registry._discover_bytes) == {"price"}
+
+
+def test_expire_without_heartbeat(client, registry, clock):
+    register(client, "a1", "Price Agent", ["price"])
+
+    clock.now += registry.timeout_seconds + 1
+    assert client.get("/discover").json()["count"] == 0
+    assert client.get("/agents/a1").status_code == 404
+    assert "price" not in registry.by_capability
+
+
+def test_heartbeat_skips_stale_heap_entry(client, registry, clock):
+    register(client, "a1", "Price Agent", ["price"])
+
+    # 만료 전에 하트비트 → 첫 힙 항목은 꺼낼 때 건너뛰어야 함
+    clock.now += registry.timeout_seconds - 10
+    assert client.put("/heartbeat/a1").status_code == 200
+
+    clock.now += 20
+    assert client.get("/discover").json()["count"] == 1
+    assert len(registry._expiry_heap) == 1
+
+    clock.now += registry.timeout_seconds
+    assert client.get("/discover").json()["count"] == 0
+
+
+def test_deregister(client, registry, clock):
+    register(client, "a1", "Price Agent", ["price"])
+    client.get("/discover", params={"capability": "price"})
+
+    assert client.delete("/register/a1").status_code == 200
+    assert client.get("/discover", params={"capability": "price"}).json() == {"agents": [], "count": 0}
+    assert client.get("/resolve", params={"name_or_id": "price agent"}).status_code == 404
+    assert client.delete("/register/a1").status_code == 404
+
+    # 해제 후 남은 힙 항목은 만료 시 오류 없이 건너뜀
+    clock.now += registry.timeout_seconds + 1
+    registry._cleanup_inactive_agents()
+    assert registry._expiry_heap == []
@@ -0,0 +1,167 @@
+"""A2A 서비스 레지스트리 (service_registry.ServiceRegistry) 테스트"""
+
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from a2a_core.registry import service_registry
+
+
+class FakeClock:
+    """레지스트리 모듈의 time 대체 (monotonic만 수동으로 진행)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return time.time()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(service_registry, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def registry(monkeypatch, clock):
+    # 엔드포인트가 사용하는 전역 레지스트리를 테스트마다 새로 생성
+    fresh = service_registry.ServiceRegistry()
+    monkeypatch.setattr(service_registry, "registry", fresh)
+    return fresh
+
+
+@pytest.fixture
+def client(registry):
+    # startup 이벤트(헬스체크, 하트비트 반영 태스크)는 실행하지 않음
+    return TestClient(service_registry.app)
+
+
+def register(client, agent_id, name, caps):
+    response = client.post("/register", json={
+        "agent_id": agent_id,
+        "name": name,
+        "description": f"{name} agent",
+        "endpoint": f"http://localhost/{agent_id}",
+        "capabilities": [{"name": cap} for cap in caps]
+    })
+    assert response.status_code == 200
+    return response.json()
+
+
+def drain_heartbeats(registry):
+    """drain_heartbeats 태스크 대신 대기열을 한 번 비워 반영"""
+    queue = registry._heartbeat_queue
+    heartbeats = []
+    while not queue.empty():
+        heartbeats.append(queue.get_nowait())
+    registry._apply_heartbeats(heartbeats)
+
+
+def test_register_rejects_invalid_body(client):
+    response = client.post("/register", content=b'{"agent_id": "a1"}')
+    assert response.status_code == 422
+
+
+def test_discover_slim_and_verbose(client):
+    register(client, "a1", "Price-Agent", ["price"])
+    register(client, "a2", "News Agent", ["news", "price"])
+
+    slim = client.get("/discover", params={"capability": "news"}).json()
+    assert slim == {
+        "agents": [{"id": "a2", "name": "News Agent", "endpoint": "http://localhost/a2", "caps": ["news", "price"]}],
+        "count": 1
+    }
+
+    verbose = client.get("/discover", params={"capability": "price", "verbose": 1}).json()
+    assert verbose["count"] == 2
+    assert {agent["agent_id"] for agent in verbose["agents"]} == {"a1", "a2"}
+    # last_heartbeat는 응답에서 ISO 문자열로 변환
+    assert isinstance(verbose["agents"][0]["last_heartbeat"], str)
+
+    assert client.get("/discover").json()["count"] == 2
+    assert client.get("/resolve", params={"name_or_id": "price agent"}).json()["agent_id"] == "a1"
+
+
+def test_register_invalidates_active_cache(client, registry):
+    register(client, "a1", "Price Agent", ["price"])
+    assert client.get("/discover", params={"capability": "price"}).json()["count"] == 1
+    gen = registry._gen
+
+    register(client, "a2", "Other Price Agent", ["price"])
+    assert registry._gen > gen
+    assert client.get("/discover", params={"capability": "price"}).json()["count"] == 2
+
+
+def test_unknown_capability_is_not_cached(client, registry):
+    register(client, "a1", "Price Agent", ["price"])
+
+    for i in range(100):
+        body = client.get("/discover", params={"capability": f"unknown-{i}"}).json()
+        assert body == {"agents": [], "count": 0}
+
+    client.get("/discover", params={"capability": "price"})
+    assert set(registry._active_cache) == {"price"}
+
+    # 세대가 바뀌면 이전 항목은 남지 않음
+    register(client, "a2", "News Agent", ["news"])
+    assert registry._active_cache == {}
+
+
+def test_expire_without_heartbeat(client, registry, clock):
+    register(client, "a1", "Price Agent", ["price"])
+
+    clock.now += registry.heartbeat_timeout + 1
+    registry._expire_stale_agents()
+
+    assert registry.agents["a1"].status == "inactive"
+    assert client.get("/discover", params={"capability": "price"}).json()["count"] == 0
+    assert client.get("/resolve", params={"name_or_id": "a1"}).status_code == 404
+
+    # 하트비트가 다시 오면 활성으로 복귀
+    assert client.put("/heartbeat/a1").status_code == 200
+    drain_heartbeats(registry)
+    assert client.get("/discover", params={"capability": "price"}).json()["count"] == 1
+
+
+def test_heartbeat_skips_stale_heap_entry(client, registry, clock):
+    register(client, "a1", "Price Agent", ["price"])
+
+    # 만료 전에 하트비트 → 첫 힙 항목은 꺼낼 때 건너뛰어야 함
+    clock.now += registry.heartbeat_timeout - 10
+    client.post("/heartbeat/batch", json={"agent_ids": ["a1", "missing"]})
+    drain_heartbeats(registry)
+
+    clock.now += 20
+    registry._expire_stale_agents()
+    assert registry.agents["a1"].status == "active"
+    assert len(registry._heartbeat_heap) == 1
+
+    clock.now += registry.heartbeat_timeout
+    registry._expire_stale_agents()
+    assert registry.agents["a1"].status == "inactive"
+
+
+def test_deregister(client, registry):
+    register(client, "a1", "Price Agent", ["price"])
+    register(client, "a2", "News Agent", ["news"])
+    index_before = registry.capabilities_index
+    client.get("/discover", params={"capability": "price"})
+
+    assert client.delete("/register/a1").status_code == 200
+    assert client.get("/discover", params={"capability": "price"}).json() == {"agents": [], "count": 0}
+    assert client.get("/resolve", params={"name_or_id": "price agent"}).status_code == 404
+    assert client.delete("/register/a1").status_code == 404
+
+    # 인덱스는 새 dict로 교체되므로 이전 스냅샷은 그대로 유지
+    assert "price" not in registry.capabilities_index
+    assert index_before["price"] == frozenset({"a1"})
+    assert registry.capabilities_index["news"] == frozenset({"a2"})
@@ -0,0 +1,34 @@
+"""
+Date Cache - 조회 기간 계산용 날짜 문자열 캐시
+날짜는 자정에만 바뀌므로 요청마다 현재 시각을 포맷하지 않고 짧은 TTL로 재사용
+"""
+
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Tuple
+
+_TODAY_TTL = 60  # seconds
+
+# (확인 시각(monotonic), "YYYYMMDD")
+_today_cache: Tuple[float, str] = (float("-inf"), "")
+
+
+def today_str() -> str:
+    """오늘 날짜 (YYYYMMDD) - 최대 60초 동안 캐싱된 값 반환"""
+    global _today_cache
+
+    now = time.monotonic()
+    if now - _today_cache[0] > _TODAY_TTL:
+        _today_cache = (now, datetime.now().strftime("%Y%m%d"))
+    return _today_cache[1]
+
+
+def days_ago_str(days: int) -> str:
+    """오늘로부터 days일 전 날짜 (YYYYMMDD)"""
+    return _days_before(today_str(), days)
+
+
+@lru_cache(maxsize=64)
+def _days_before(today: str, days: int) -> str:
+    return (datetime.strptime(today, "%Y%m%d") - timedelta(days=days)).strftime("%Y%m%d")